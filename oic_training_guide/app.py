@@ -3,151 +3,93 @@ OIC Gen 3 Training Guide - Comprehensive Streamlit Application
 A complete learning resource for Oracle Integration Cloud Generation 3
 """
 
+import hmac
+import json
+import os
+import uuid
+from functools import lru_cache
+from textwrap import dedent
+
 import streamlit as st
-import sys
-from pathlib import Path
-
-# Add modules directory to path
-sys.path.append(str(Path(__file__).parent))
-
-# Import modules
-from modules import (
-    module_1_getting_started,
-    module_2_core_concepts,
-    module_3_management,
-    module_4_advanced,
-    module_5_file_ops,
-    module_6_database,
-    module_7_web_services,
-    module_8_enterprise
-)
 
-# Page configuration
-st.set_page_config(
-    page_title="OIC Gen 3 Training Guide",
-    page_icon="☁️",
-    layout="wide",
-    initial_sidebar_state="expanded"
+# Module pages are imported on demand, see MODULES below
+from modules import load_render
+from utils.bootstrap import setup_page
+from utils.content import get_module
+from utils.helpers import progress_tracker_ops
+from utils.profiling import ENABLED as PROFILING, get_profiler, profiled
+from utils.progress import DAY, EXERCISE, get_store
+from utils.renderer import (
+    coalesce, day_page_key, delta_count, render_ops, reset_delta_count
 )
+from utils.search import search
+from utils.sessions import get_registry, restore, touch, track
 
-# Custom CSS
-st.markdown("""
-<style>
-    /* Main styling */
-    .main {
-        padding: 2rem;
-    }
-    
-    /* Headers */
-    h1 {
-        color: #312D2A;
-        font-weight: 700;
-        padding-bottom: 1rem;
-        border-bottom: 3px solid #FF0000;
-    }
-    
-    h2 {
-        color: #C74634;
-        margin-top: 2rem;
-    }
-    
-    h3 {
-        color: #312D2A;
-    }
-    
-    /* Sidebar */
-    .css-1d391kg {
-        background-color: #F8F8F8;
-    }
-    
-    /* Code blocks */
-    .stCodeBlock {
-        background-color: #F5F5F5;
-        border-left: 4px solid #FF0000;
-    }
-    
-    /* Info boxes */
-    .stAlert {
-        border-radius: 8px;
-    }
-    
-    /* Buttons */
-    .stButton>button {
-        background-color: #FF0000;
-        color: white;
-        border-radius: 6px;
-        padding: 0.5rem 2rem;
-        font-weight: 600;
-    }
-    
-    .stButton>button:hover {
-        background-color: #C74634;
-    }
-    
-    /* Progress bar */
-    .stProgress > div > div {
-        background-color: #FF0000;
-    }
-    
-    /* Expander */
-    .streamlit-expanderHeader {
-        background-color: #F8F8F8;
-        border-radius: 6px;
-    }
-    
-    /* Metrics */
-    [data-testid="stMetricValue"] {
-        font-size: 2rem;
-        color: #FF0000;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# Module configuration
+# Module configuration: sidebar label -> module name under ``modules``.
+# A module is only imported the first time its page is selected.
 MODULES = {
     "🏠 Home": None,
-    "1️⃣ Getting Started": module_1_getting_started,
-    "2️⃣ Core Integration Concepts": module_2_core_concepts,
-    "3️⃣ Integration Management": module_3_management,
-    "4️⃣ Advanced Features": module_4_advanced,
-    "5️⃣ File Operations": module_5_file_ops,
-    "6️⃣ Database Integration": module_6_database,
-    "7️⃣ Web Services & APIs": module_7_web_services,
-    "8️⃣ Enterprise Patterns": module_8_enterprise,
+    "1️⃣ Getting Started": "module_1_getting_started",
+    "2️⃣ Core Integration Concepts": "module_2_core_concepts",
+    "3️⃣ Integration Management": "module_3_management",
+    "4️⃣ Advanced Features": "module_4_advanced",
+    "5️⃣ File Operations": "module_5_file_ops",
+    "6️⃣ Database Integration": "module_6_database",
+    "7️⃣ Web Services & APIs": "module_7_web_services",
+    "8️⃣ Enterprise Patterns": "module_8_enterprise",
     "📚 Resources": None,
 }
 
-def render_home():
-    """Render the home page."""
-    st.title("☁️ Oracle Integration Cloud Gen 3 Training Guide")
-    st.markdown("### Your Complete Learning Path to OIC Mastery")
-    
-    st.markdown("""
-    Welcome to the comprehensive Oracle Integration Cloud (OIC) Generation 3 training guide! 
-    This interactive learning resource is based on a complete 26-day training series, 
-    organized into 8 logical modules for structured learning.
-    """)
-    
-    # Overview cards
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Modules", "8", help="Comprehensive learning modules")
-    
-    with col2:
-        st.metric("Training Days", "26", help="Days of detailed content")
-    
-    with col3:
-        st.metric("Topics", "50+", help="Key topics covered")
-    
-    with col4:
-        st.metric("Difficulty", "Beginner to Advanced", help="Complete learning path")
-    
-    st.markdown("---")
-    
-    # Learning path
-    st.markdown("## 🎯 Learning Path")
-    
+# Admin-only page, listed after the modules for admins (see ``is_admin``)
+DIAGNOSTICS = "🩺 Diagnostics"
+
+# Training days covered by each module, used to open ``?day=N`` deep links.
+MODULE_DAYS = {
+    "1️⃣ Getting Started": (1, 2),
+    "2️⃣ Core Integration Concepts": (3, 7),
+    "3️⃣ Integration Management": (8, 10),
+    "4️⃣ Advanced Features": (11, 13),
+    "5️⃣ File Operations": (14, 17),
+    "6️⃣ Database Integration": (18, 20),
+    "7️⃣ Web Services & APIs": (21, 23),
+    "8️⃣ Enterprise Patterns": (24, 26),
+}
+
+def module_for_day(day):
+    """Return the sidebar label of the module covering ``day``, or Home."""
+    for label, (first, last) in MODULE_DAYS.items():
+        if first <= day <= last:
+            return label
+    return "🏠 Home"
+
+def module_label(number):
+    """Return the sidebar label of module ``number``, or Home."""
+    labels = list(MODULE_DAYS)
+    return labels[number - 1] if 1 <= number <= len(labels) else "🏠 Home"
+
+def initial_page():
+    """Sidebar page for a new session: ``?module=N``, else ``?day=N``, else Home."""
+    module = st.query_params.get("module", "")
+    if module.isdigit():
+        return module_label(int(module))
+    day = st.query_params.get("day", "")
+    return module_for_day(int(day)) if day.isdigit() else "🏠 Home"
+
+def sync_route(selected_module):
+    """Mirror the current page in the URL: ``?module=N`` on module pages."""
+    if MODULES.get(selected_module) is None:
+        # Day and section links only apply to module pages
+        for param in ("module", "day", "section"):
+            if param in st.query_params:
+                del st.query_params[param]
+        return
+    number = str(list(MODULE_DAYS).index(selected_module) + 1)
+    if st.query_params.get("module") != number:
+        st.query_params["module"] = number
+
+@lru_cache(maxsize=None)
+def home_ops():
+    """Display list for the home page, built once per process."""
     modules_info = [
         ("Module 1: Getting Started", "Days 1-2", "Introduction to OIC Gen 3, UI overview, first integration"),
         ("Module 2: Core Integration Concepts", "Days 3-7", "Scheduled integrations, REST adapters, data mapping"),
@@ -159,82 +101,98 @@ def render_home():
         ("Module 8: Enterprise Patterns", "Days 24-26", "FBDI, bulk loading, callbacks, BIP reports"),
     ]
     
-    for i, (title, days, description) in enumerate(modules_info, 1):
-        with st.expander(f"**{title}** ({days})"):
-            st.markdown(f"📖 {description}")
-            st.markdown(f"*Click on '{i}️⃣ {title.split(': ')[1]}' in the sidebar to start learning*")
-    
-    st.markdown("---")
-    
-    # Key features
-    st.markdown("## ✨ What You'll Learn")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
-        **Fundamentals:**
-        - ✅ OIC Gen 3 architecture and UI
-        - ✅ Creating and managing integrations
-        - ✅ Working with connections and adapters
-        - ✅ Data mapping and transformations
-        - ✅ Monitoring and troubleshooting
-        """)
-    
-    with col2:
-        st.markdown("""
-        **Advanced Topics:**
-        - ✅ Fault handling and error management
-        - ✅ File processing and FTP operations
-        - ✅ Database integrations with ATP
-        - ✅ SOAP and REST web services
-        - ✅ Enterprise patterns (FBDI, callbacks)
-        """)
-    
-    st.markdown("---")
-    
-    # Getting started
-    st.markdown("## 🚀 Getting Started")
-    st.info("👈 **Select a module from the sidebar to begin your learning journey!**")
+    ops = [
+        ("title", "☁️ Oracle Integration Cloud Gen 3 Training Guide"),
+        ("markdown", "### Your Complete Learning Path to OIC Mastery"),
+        ("markdown", dedent("""
+        Welcome to the comprehensive Oracle Integration Cloud (OIC) Generation 3 training guide! 
+        This interactive learning resource is based on a complete 26-day training series, 
+        organized into 8 logical modules for structured learning.
+        """).strip()),
+        # Overview cards
+        ("columns", (1, 1, 1, 1), (
+            (("metric", "Modules", "8", "Comprehensive learning modules"),),
+            (("metric", "Training Days", "26", "Days of detailed content"),),
+            (("metric", "Topics", "50+", "Key topics covered"),),
+            (("metric", "Difficulty", "Beginner to Advanced", "Complete learning path"),),
+        )),
+        ("markdown", "---"),
+        # Learning path
+        ("markdown", "## 🎯 Learning Path"),
+    ]
     
-    st.markdown("""
-    **Recommended Learning Approach:**
-    1. Start with Module 1 if you're new to OIC
-    2. Follow the modules in sequence for a structured learning path
-    3. Practice with the hands-on exercises in each module
-    4. Refer back to earlier modules as needed
-    5. Use the Resources section for additional references
-    """)
+    for i, (title, days, description) in enumerate(modules_info, 1):
+        ops.append(("expander", f"**{title}** ({days})", (
+            ("markdown", f"📖 {description}"),
+            ("markdown", f"*Click on '{i}️⃣ {title.split(': ')[1]}' in the sidebar to start learning*"),
+        )))
+    
+    ops += [
+        ("markdown", "---"),
+        # Key features
+        ("markdown", "## ✨ What You'll Learn"),
+        ("columns", (1, 1), (
+            (("markdown", dedent("""
+            **Fundamentals:**
+            - ✅ OIC Gen 3 architecture and UI
+            - ✅ Creating and managing integrations
+            - ✅ Working with connections and adapters
+            - ✅ Data mapping and transformations
+            - ✅ Monitoring and troubleshooting
+            """).strip()),),
+            (("markdown", dedent("""
+            **Advanced Topics:**
+            - ✅ Fault handling and error management
+            - ✅ File processing and FTP operations
+            - ✅ Database integrations with ATP
+            - ✅ SOAP and REST web services
+            - ✅ Enterprise patterns (FBDI, callbacks)
+            """).strip()),),
+        )),
+        ("markdown", "---"),
+        # Getting started
+        ("markdown", "## 🚀 Getting Started"),
+        ("info", "👈 **Select a module from the sidebar to begin your learning journey!**"),
+        ("markdown", dedent("""
+        **Recommended Learning Approach:**
+        1. Start with Module 1 if you're new to OIC
+        2. Follow the modules in sequence for a structured learning path
+        3. Practice with the hands-on exercises in each module
+        4. Refer back to earlier modules as needed
+        5. Use the Resources section for additional references
+        """).strip()),
+    ]
+    return coalesce(ops)
 
-def render_resources():
-    """Render the resources page."""
-    st.title("📚 Resources & References")
-    
-    st.markdown("## 🔗 Official Documentation")
-    st.markdown("""
-    - [Oracle Integration Cloud Documentation](https://docs.oracle.com/en/cloud/paas/integration-cloud/)
-    - [OIC Gen 3 Release Notes](https://docs.oracle.com/en/cloud/paas/integration-cloud/whats-new/)
-    - [Oracle Learning Library](https://apexapps.oracle.com/pls/apex/f?p=44785:1)
-    - [Oracle Cloud Infrastructure](https://docs.oracle.com/en-us/iaas/Content/home.htm)
-    """)
-    
-    st.markdown("---")
-    
-    st.markdown("## 🎥 Video Training Series")
-    st.markdown("""
-    This guide is based on the comprehensive OIC Gen 3 Training Series:
-    - [Complete Playlist on YouTube](https://www.youtube.com/playlist?list=PL3X62LScvI_Jv63W_k8PG0Chfzr4n_QEN)
-    - 26 detailed training sessions
-    - Beginner to advanced topics
-    - Hands-on demonstrations
-    """)
-    
-    st.markdown("---")
-    
-    st.markdown("## 📖 Quick Reference Guides")
-    
-    with st.expander("🔌 Common Adapter Types"):
-        st.markdown("""
+@profiled
+def render_home():
+    """Render the home page."""
+    render_ops(home_ops())
+
+@lru_cache(maxsize=None)
+def resources_ops():
+    """Display list for the resources page, built once per process."""
+    ops = [
+        ("title", "📚 Resources & References"),
+        ("markdown", "## 🔗 Official Documentation"),
+        ("markdown", dedent("""
+        - [Oracle Integration Cloud Documentation](https://docs.oracle.com/en/cloud/paas/integration-cloud/)
+        - [OIC Gen 3 Release Notes](https://docs.oracle.com/en/cloud/paas/integration-cloud/whats-new/)
+        - [Oracle Learning Library](https://apexapps.oracle.com/pls/apex/f?p=44785:1)
+        - [Oracle Cloud Infrastructure](https://docs.oracle.com/en-us/iaas/Content/home.htm)
+        """).strip()),
+        ("markdown", "---"),
+        ("markdown", "## 🎥 Video Training Series"),
+        ("markdown", dedent("""
+        This guide is based on the comprehensive OIC Gen 3 Training Series:
+        - [Complete Playlist on YouTube](https://www.youtube.com/playlist?list=PL3X62LScvI_Jv63W_k8PG0Chfzr4n_QEN)
+        - 26 detailed training sessions
+        - Beginner to advanced topics
+        - Hands-on demonstrations
+        """).strip()),
+        ("markdown", "---"),
+        ("markdown", "## 📖 Quick Reference Guides"),
+        ("expander", "🔌 Common Adapter Types", (("markdown", dedent("""
         | Adapter | Use Case | Key Features |
         |---------|----------|--------------|
         | REST | RESTful APIs | JSON/XML, OAuth, Basic Auth |
@@ -243,10 +201,8 @@ def render_resources():
         | Database | Database Operations | Insert, Update, Stored Procedures |
         | Oracle ERP Cloud | Fusion Applications | Pre-built integrations |
         | File | Local File Operations | Read, Write, List |
-        """)
-    
-    with st.expander("⚙️ Integration Patterns"):
-        st.markdown("""
+        """).strip()),)),
+        ("expander", "⚙️ Integration Patterns", (("markdown", dedent("""
         **Scheduled Integration:**
         - Time-based execution
         - Batch processing
@@ -261,10 +217,8 @@ def render_resources():
         - Triggered by events
         - Asynchronous processing
         - Event subscription model
-        """)
-    
-    with st.expander("🛠️ Best Practices Checklist"):
-        st.markdown("""
+        """).strip()),)),
+        ("expander", "🛠️ Best Practices Checklist", (("markdown", dedent("""
         - ✅ Use meaningful names for integrations and connections
         - ✅ Implement proper error handling in all integrations
         - ✅ Use tracking variables for monitoring
@@ -275,50 +229,235 @@ def render_resources():
         - ✅ Monitor integration performance regularly
         - ✅ Version control your integration packages
         - ✅ Follow naming conventions consistently
-        """)
-    
-    st.markdown("---")
-    
-    st.markdown("## 💡 Tips for Success")
-    st.success("""
-    **Learning Tips:**
-    - Practice in a development environment first
-    - Start with simple integrations and gradually increase complexity
-    - Review error logs to understand issues
-    - Join Oracle Cloud communities for support
-    - Keep up with OIC updates and new features
-    """)
-    
+        """).strip()),)),
+        ("markdown", "---"),
+        ("markdown", "## 💡 Tips for Success"),
+        ("success", dedent("""
+        **Learning Tips:**
+        - Practice in a development environment first
+        - Start with simple integrations and gradually increase complexity
+        - Review error logs to understand issues
+        - Join Oracle Cloud communities for support
+        - Keep up with OIC updates and new features
+        """).strip()),
+        ("markdown", "---"),
+        ("markdown", "## 🤝 Community & Support"),
+        ("markdown", dedent("""
+        - [Oracle Cloud Customer Connect](https://cloudcustomerconnect.oracle.com/)
+        - [Oracle Integration Blog](https://blogs.oracle.com/integration/)
+        - [Oracle Forums](https://community.oracle.com/)
+        - [Stack Overflow - OIC Tag](https://stackoverflow.com/questions/tagged/oracle-integration-cloud)
+        """).strip()),
+    ]
+    return coalesce(ops)
+
+@profiled
+def render_resources():
+    """Render the resources page."""
+    render_ops(resources_ops())
+
+def _open_page(module_name, page):
+    """Search result callback: switch to a module and one of its pages."""
+    st.session_state.selected_module = next(
+        label for label, name in MODULES.items() if name == module_name
+    )
+    st.session_state[day_page_key(get_module(module_name).number)] = page
+
+@st.fragment
+@profiled
+def render_search():
+    """Render the search box and its ranked results.
+
+    A fragment, so typing a query reruns only the search results; opening a
+    result reruns the app to show the new page.
+    """
+    touch()
+    query = st.text_input(
+        "Search",
+        placeholder="🔍 Search, e.g. dvm:lookupValue",
+        label_visibility="collapsed"
+    )
+    if not query.strip():
+        return
+    hits = search(query, limit=8)
+    if not hits:
+        st.caption("No matches found")
+        return
+    for i, hit in enumerate(hits):
+        doc = hit.document
+        if st.button(
+            f"{doc.module_title} › {doc.title}",
+            key=f"search_hit_{i}",
+            help=hit.snippet,
+            on_click=_open_page,
+            args=(doc.module, doc.page),
+            width="stretch",
+        ):
+            st.rerun(scope="app")
     st.markdown("---")
-    
-    st.markdown("## 🤝 Community & Support")
-    st.markdown("""
-    - [Oracle Cloud Customer Connect](https://cloudcustomerconnect.oracle.com/)
-    - [Oracle Integration Blog](https://blogs.oracle.com/integration/)
-    - [Oracle Forums](https://community.oracle.com/)
-    - [Stack Overflow - OIC Tag](https://stackoverflow.com/questions/tagged/oracle-integration-cloud)
-    """)
+
+def current_learner():
+    """Identify the learner whose progress is shown.
+
+    Signed-in users are keyed by email; anonymous learners get a random id
+    that is kept in the ``?learner=`` query parameter so a bookmark or
+    refresh finds the same progress.
+    """
+    user = getattr(st, "user", None)
+    if user is not None and user.get("is_logged_in") and user.get("email"):
+        return user["email"]
+    learner = st.query_params.get("learner")
+    if not learner:
+        learner = st.session_state.setdefault("learner", uuid.uuid4().hex)
+        st.query_params["learner"] = learner
+    return learner
+
+@profiled
+def render_progress(learner):
+    """Render the sidebar progress tracker from the cached progress store."""
+    done_days = {int(item) for kind, item in get_store().completed(learner) if kind == DAY}
+    completed_modules = sum(
+        all(day in done_days for day in range(first, last + 1))
+        for first, last in MODULE_DAYS.values()
+    )
+    render_ops(progress_tracker_ops(completed_modules, len(MODULE_DAYS)), st.sidebar)
+    st.sidebar.caption(f"{len(done_days)}/26 training days completed")
+
+def _set_done(learner, kind, items, key):
+    for item in items:
+        get_store().mark(learner, kind, item, st.session_state[key])
+    if kind == DAY:
+        st.session_state.progress_changed = True
+
+@st.fragment
+@profiled
+def render_day_progress(learner, module, day):
+    """Checkboxes under a day for its exercises and for the day itself.
+
+    A fragment, so ticking an exercise reruns only these checkboxes.
+    Completing a day reruns the app so the sidebar tracker catches up.
+    """
+    touch()
+    if st.session_state.pop("progress_changed", False):
+        st.rerun(scope="app")
+    store = get_store()
+    for title in day.exercises:
+        item = f"{day.number}:{title}"
+        key = f"done_{EXERCISE}_{item}"
+        st.checkbox(
+            f"I completed the exercise: {title}",
+            value=store.is_done(learner, EXERCISE, item),
+            key=key,
+            on_change=_set_done,
+            args=(learner, EXERCISE, [item], key)
+        )
+    key = f"done_{DAY}_{day.number}"
+    st.checkbox(
+        f"✅ Mark {day.label} as complete",
+        value=store.is_done(learner, DAY, day.number),
+        key=key,
+        on_change=_set_done,
+        args=(learner, DAY, range(day.number, (day.last or day.number) + 1), key)
+    )
+
+def is_admin():
+    """Whether the current viewer may open the Diagnostics page.
+
+    Admins are signed-in users listed in ``OIC_ADMINS`` (comma-separated
+    emails), or anyone visiting with ``?admin=<OIC_ADMIN_TOKEN>``.
+    """
+    user = getattr(st, "user", None)
+    if user is not None and user.get("is_logged_in"):
+        admins = {email.strip().lower() for email in os.environ.get("OIC_ADMINS", "").split(",")}
+        if (user.get("email") or "").lower() in admins - {""}:
+            return True
+    token = os.environ.get("OIC_ADMIN_TOKEN", "")
+    return bool(token) and hmac.compare_digest(st.query_params.get("admin", ""), token)
+
+def render_diagnostics():
+    """Render the admin-only page of render timings and cache statistics."""
+    import pandas as pd  # only this admin page needs it
+
+    st.title(DIAGNOSTICS)
+    if not PROFILING:
+        st.info("Profiling is off. Start the app with `OIC_PROFILE=1` to collect render timings.")
+    report = get_profiler().snapshot()
+    report["sessions"] = get_registry().stats()
+    st.caption(
+        f"Aggregated across all sessions of this process; percentiles cover the "
+        f"last {report['window']} calls of each function."
+    )
+
+    st.markdown("### ⏱️ Render Times")
+    if report["renders"]:
+        renders = pd.DataFrame.from_dict(report["renders"], orient="index")
+        st.dataframe(renders.sort_values("p90_ms", ascending=False))
+    else:
+        st.caption("No renders recorded yet")
+
+    st.markdown("### 👥 Sessions")
+    sessions = report["sessions"]
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Live sessions", sessions["sessions"])
+    col2.metric("State (total)", f"{sessions['state_bytes_total'] / 1024:.1f} KB")
+    col3.metric("State (max)", f"{sessions['state_bytes_max'] / 1024:.1f} KB")
+    col4.metric("Evicted / restored", f"{sessions['evicted']} / {sessions['restored']}")
+    st.caption(
+        f"Sessions idle for {sessions['idle_timeout_s'] / 60:g} minutes are evicted. "
+        f"{sessions['progress_cache_items']} progress items are cached for "
+        f"{sessions['progress_cache_learners']} learners."
+    )
+
+    st.markdown("### 🗄️ Caches")
+    if report["caches"]:
+        st.dataframe(pd.DataFrame.from_dict(report["caches"], orient="index"))
+    else:
+        st.caption("No cache lookups recorded yet")
+
+    col1, col2 = st.columns(2)
+    col1.download_button(
+        "⬇️ Export JSON",
+        json.dumps(report, indent=2),
+        file_name="oic_diagnostics.json",
+        mime="application/json"
+    )
+    col2.button("🔄 Reset", on_click=get_profiler().reset)
 
 def main():
     """Main application logic."""
     
+    reset_delta_count()
+    setup_page()
+    
     # Sidebar
     st.sidebar.title("📖 Navigation")
+    with st.sidebar:
+        render_search()
     st.sidebar.markdown("Select a module to explore:")
     
-    # Module selection
+    # Returning learners whose idle session was evicted get their place back
+    learner = current_learner()
+    restore(learner)
+    
+    # Module selection; ``?module=N`` or ``?day=N`` picks it on first load, so
+    # a deep link renders its target directly instead of Home first
+    if "selected_module" not in st.session_state:
+        st.session_state.selected_module = initial_page()
+    pages = list(MODULES) + ([DIAGNOSTICS] if is_admin() else [])
+    if st.session_state.selected_module not in pages:
+        st.session_state.selected_module = "🏠 Home"
     selected_module = st.sidebar.radio(
         "Modules",
-        list(MODULES.keys()),
+        pages,
+        key="selected_module",
         label_visibility="collapsed"
     )
     
     st.sidebar.markdown("---")
     
-    # Progress tracker (placeholder - can be enhanced with session state)
+    # Progress tracker
     st.sidebar.markdown("### 📊 Your Progress")
-    st.sidebar.progress(0.0)
-    st.sidebar.caption("Complete modules to track your progress")
+    render_progress(learner)
     
     st.sidebar.markdown("---")
     
@@ -334,15 +473,29 @@ def main():
         Based on the 26-day training series covering beginner to advanced topics.
         """)
     
+    sync_route(selected_module)
+    
     # Render selected module
     if selected_module == "🏠 Home":
         render_home()
     elif selected_module == "📚 Resources":
         render_resources()
+    elif selected_module == DIAGNOSTICS:
+        render_diagnostics()
     else:
-        module = MODULES[selected_module]
-        if module:
-            module.render()
+        module_name = MODULES[selected_module]
+        if module_name:
+            load_render(module_name)(
+                day_footer=lambda module, day: render_day_progress(learner, module, day)
+            )
+    
+    # Session state size for memory accounting
+    state_bytes = track(learner)
+    
+    # Element count for this run; ``?debug`` shows it under the sidebar
+    if "debug" in st.query_params:
+        st.sidebar.caption(f"🧮 {delta_count()} elements rendered on this page")
+        st.sidebar.caption(f"🧠 {state_bytes / 1024:.1f} KB of session state")
 
 if __name__ == "__main__":
     main()
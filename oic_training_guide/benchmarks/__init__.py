@@ -0,0 +1 @@
+"""Benchmarks for the OIC Training Guide Streamlit app."""
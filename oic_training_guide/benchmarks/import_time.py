@@ -0,0 +1,105 @@
+"""Cold-start benchmark: app import time and Home page first paint.
+
+Each sample runs in a fresh interpreter so nothing is served from
+``sys.modules``. The ``eager`` variant additionally imports all eight module
+pages, which is what ``app.py`` did before module loading became lazy, so the
+two rows show the startup cost saved per process.
+
+Usage (from the ``oic_training_guide`` directory)::
+
+    python -m benchmarks.import_time --runs 5 --json import_time.json
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+from modules import __all__ as MODULE_NAMES
+
+APP_DIR = Path(__file__).resolve().parent.parent
+
+_EAGER_IMPORTS = "".join(f"import modules.{name}\n" for name in MODULE_NAMES)
+
+# Streamlit itself is imported before the clock starts: it is a fixed cost
+# shared by every variant and would otherwise drown out the app's own share.
+_IMPORT_SNIPPET = """
+import time
+import streamlit
+start = time.perf_counter()
+import app
+{eager}
+print(time.perf_counter() - start)
+"""
+
+_FIRST_PAINT_SNIPPET = """
+import time
+from streamlit.testing.v1 import AppTest
+start = time.perf_counter()
+{eager}
+at = AppTest.from_file("app.py", default_timeout=60)
+at.run()
+assert not at.exception, at.exception
+print(time.perf_counter() - start)
+"""
+
+
+def _sample(snippet, eager):
+    """Run ``snippet`` in a fresh interpreter and return the reported seconds."""
+    code = snippet.format(eager=_EAGER_IMPORTS if eager else "")
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=APP_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def _summary(samples):
+    return {
+        "median_ms": round(statistics.median(samples) * 1000, 2),
+        "min_ms": round(min(samples) * 1000, 2),
+        "runs": len(samples),
+    }
+
+
+def run(runs=5):
+    """Measure the lazy and eager variants and return a report dict."""
+    report = {}
+    for variant, eager in (("lazy", False), ("eager", True)):
+        report[variant] = {
+            "import": _summary([_sample(_IMPORT_SNIPPET, eager) for _ in range(runs)]),
+            "first_paint": _summary([_sample(_FIRST_PAINT_SNIPPET, eager) for _ in range(runs)]),
+        }
+    for metric in ("import", "first_paint"):
+        saved = report["eager"][metric]["median_ms"] - report["lazy"][metric]["median_ms"]
+        report.setdefault("saved_ms", {})[metric] = round(saved, 2)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="samples per measurement")
+    parser.add_argument("--json", help="write the report to this file")
+    args = parser.parse_args(argv)
+
+    report = run(args.runs)
+    for variant in ("lazy", "eager"):
+        print(
+            f"{variant:>5}: import {report[variant]['import']['median_ms']:8.2f} ms | "
+            f"first paint {report[variant]['first_paint']['median_ms']:8.2f} ms"
+        )
+    print(
+        f"saved: import {report['saved_ms']['import']:.2f} ms | "
+        f"first paint {report['saved_ms']['first_paint']:.2f} ms"
+    )
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,371 @@
+"""Concurrent-session load test: many simulated learners against one app server.
+
+The harness starts ``streamlit run app.py`` in a subprocess and opens one
+websocket per simulated session. Each websocket speaks the browser's protocol
+(``BackMsg`` / ``ForwardMsg`` protobufs on ``/_stcore/stream``). A session
+opens the Home page, then navigates the sidebar modules (and, on module
+pages, the day selector, as a fragment rerun) with random think times between
+steps. Every session is served by the one server process, so its caches and
+script threads are shared exactly as in production.
+
+Reported per step kind and overall: script-run latency percentiles (from
+sending the rerun to ``script_finished``) and the number of deltas each run
+sent. The server's CPU time and resident memory are read from ``/proc`` and
+divided per session and per script run; sessions run concurrently, so that
+split is an average, not an attribution. The clients share the machine with
+the server, so keep that in mind when comparing CPU-bound results.
+
+Any session error (an exception shown by the app, a failed run, a timeout, a
+dropped connection) is listed in the report and makes the command exit
+with status 1.
+
+Usage (from the ``oic_training_guide`` directory)::
+
+    python -m benchmarks.load_test --sessions 20 --steps 10 --json load.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+try:
+    import websockets
+except ImportError:  # pragma: no cover - optional dependency
+    websockets = None
+
+APP_DIR = Path(__file__).resolve().parent.parent
+APP_FILE = str(APP_DIR / "app.py")
+
+NAV_KEY = "selected_module"
+# Day selectors are keyed ``module_<n>_page``; widget ids end with the key.
+DAY_KEY_SUFFIX = "_page"
+
+_PERCENTILES = (50, 90, 95, 99)
+_SAMPLE_INTERVAL = 0.2
+_FINISHED = {
+    ForwardMsg.ScriptFinishedStatus.FINISHED_SUCCESSFULLY,
+    ForwardMsg.ScriptFinishedStatus.FINISHED_FRAGMENT_RUN_SUCCESSFULLY,
+}
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _proc_cpu_seconds(pid):
+    """User + system CPU time of ``pid``, or ``None`` where ``/proc`` is unavailable."""
+    try:
+        with open(f"/proc/{pid}/stat") as stat:
+            fields = stat.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _proc_rss_bytes(pid):
+    try:
+        with open(f"/proc/{pid}/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def _percentiles(samples):
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    summary = {
+        f"p{p}": round(ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))], 2)
+        for p in _PERCENTILES
+    }
+    summary["mean"] = round(statistics.fmean(ordered), 2)
+    summary["max"] = round(ordered[-1], 2)
+    summary["count"] = len(ordered)
+    return summary
+
+
+class Server:
+    """``streamlit run app.py`` on a free local port."""
+
+    def __init__(self, startup_timeout=60):
+        self.port = _free_port()
+        self.startup_timeout = startup_timeout
+        self.process = None
+        # A file, not a pipe: nothing reads the server's log while it runs.
+        self._log = tempfile.TemporaryFile("w+")
+
+    @property
+    def url(self):
+        return f"ws://127.0.0.1:{self.port}/_stcore/stream"
+
+    def __enter__(self):
+        env = dict(os.environ)
+        # The progress store writes to disk; keep the test's learners out of it.
+        env.setdefault("OIC_PROGRESS_DB", str(APP_DIR / ".cache" / "load_test_progress.db"))
+        self.process = subprocess.Popen(
+            [
+                sys.executable, "-m", "streamlit", "run", APP_FILE,
+                "--server.headless", "true",
+                "--server.port", str(self.port),
+                "--server.fileWatcherType", "none",
+                "--browser.gatherUsageStats", "false",
+            ],
+            cwd=APP_DIR, env=env, stdout=subprocess.DEVNULL, stderr=self._log,
+        )
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                self._log.seek(0)
+                raise RuntimeError(f"streamlit exited during startup:\n{self._log.read()}")
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{self.port}/_stcore/health", timeout=1):
+                    return self
+            except OSError:
+                time.sleep(0.2)
+        self.__exit__()
+        raise RuntimeError(f"streamlit did not become healthy within {self.startup_timeout} s")
+
+    def __exit__(self, *exc_info):
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+        self._log.close()
+
+
+class Session:
+    """One simulated learner: a websocket session driving the app."""
+
+    def __init__(self, index, steps, think, seed, timeout):
+        self.index = index
+        self.steps = steps
+        self.think = think
+        self.rng = random.Random(seed + index)
+        self.timeout = timeout
+        self.runs = []
+        self.error = None
+        self._page = ""
+        self._states = {}  # widget id -> string value, as the browser resends them
+        self._radios = {}  # widget id -> (options, fragment id)
+
+    async def _rerun(self, ws, kind, fragment_id=""):
+        msg = BackMsg()
+        state = msg.rerun_script
+        state.query_string = ""
+        state.page_script_hash = self._page
+        if fragment_id:
+            state.fragment_id = fragment_id
+        for widget_id, value in self._states.items():
+            widget = state.widget_states.widgets.add()
+            widget.id = widget_id
+            widget.string_value = value
+        start = time.perf_counter()
+        await ws.send(msg.SerializeToString())
+        deltas = 0
+        while True:
+            try:
+                data = await asyncio.wait_for(ws.recv(), self.timeout)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"{kind} run: no reply within {self.timeout} s") from None
+            forward = ForwardMsg()
+            forward.ParseFromString(data)
+            kind_of = forward.WhichOneof("type")
+            if kind_of == "new_session":
+                self._page = forward.new_session.page_script_hash
+            elif kind_of == "delta":
+                deltas += 1
+                self._read_delta(forward.delta)
+            elif kind_of == "script_finished":
+                if forward.script_finished not in _FINISHED:
+                    raise RuntimeError(f"{kind} run finished with status {forward.script_finished}")
+                break
+        self.runs.append({"kind": kind, "ms": (time.perf_counter() - start) * 1000, "deltas": deltas})
+
+    def _read_delta(self, delta):
+        if delta.WhichOneof("type") != "new_element":
+            return
+        element = delta.new_element
+        kind = element.WhichOneof("type")
+        if kind == "exception":
+            raise RuntimeError(f"{element.exception.type}: {element.exception.message}")
+        if kind == "radio":
+            self._radios[element.radio.id] = (list(element.radio.options), delta.fragment_id)
+
+    def _radio(self, suffix):
+        return next(((wid, *info) for wid, info in self._radios.items() if wid.endswith(suffix)), None)
+
+    async def _pause(self):
+        low, high = self.think
+        if high > 0:
+            await asyncio.sleep(self.rng.uniform(low, high))
+
+    async def run(self, url):
+        try:
+            async with websockets.connect(url, subprotocols=["streamlit"], max_size=None) as ws:
+                await self._rerun(ws, "first_paint")
+                for _ in range(self.steps):
+                    await self._pause()
+                    nav_id, modules, _ = self._radio(f"-{NAV_KEY}")
+                    day = self._radio(DAY_KEY_SUFFIX)
+                    on_module = self._states.get(nav_id, modules[0]) not in (modules[0], modules[-1])
+                    if on_module and day is not None and self.rng.random() < 0.5:
+                        day_id, days, fragment_id = day
+                        self._states[day_id] = self.rng.choice(days)
+                        await self._rerun(ws, "day", fragment_id)
+                    else:
+                        self._states[nav_id] = self.rng.choice(modules)
+                        # A new module draws its own day selector.
+                        self._radios = {nav_id: self._radios[nav_id]}
+                        await self._rerun(ws, "module")
+        except Exception as exc:  # reported, not raised: one failure shouldn't end the test
+            self.error = f"{type(exc).__name__}: {exc}"
+
+
+async def _sample_rss(pid, samples, stop):
+    while not stop.is_set():
+        rss = _proc_rss_bytes(pid)
+        if rss is not None:
+            samples.append(rss)
+        try:
+            await asyncio.wait_for(stop.wait(), _SAMPLE_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def _drive(url, pid, simulated, ramp_up):
+    stop = asyncio.Event()
+    rss_samples = []
+    sampler = asyncio.create_task(_sample_rss(pid, rss_samples, stop))
+    tasks = []
+    for i, session in enumerate(simulated):
+        tasks.append(asyncio.create_task(session.run(url)))
+        if i < len(simulated) - 1:
+            await asyncio.sleep(ramp_up / (len(simulated) - 1))
+    await asyncio.gather(*tasks)
+    stop.set()
+    await sampler
+    return rss_samples
+
+
+def run(sessions=10, steps=10, think=(0.5, 2.0), ramp_up=1.0, seed=0, timeout=60):
+    """Start the app server, run the load test against it and return a report dict."""
+    simulated = [Session(i, steps, think, seed, timeout) for i in range(sessions)]
+    with Server() as server:
+        pid = server.process.pid
+        # Warm the server's imports with one throwaway session, as a deployed
+        # server would be, so first_paint measures a session, not the process.
+        warm = Session(-1, 0, (0, 0), seed, max(timeout, server.startup_timeout))
+        asyncio.run(warm.run(server.url))
+        if warm.error:
+            raise RuntimeError(f"warm-up session failed: {warm.error}")
+        rss_start = _proc_rss_bytes(pid)
+        cpu_start = _proc_cpu_seconds(pid)
+        wall_start = time.perf_counter()
+        rss_samples = asyncio.run(_drive(server.url, pid, simulated, ramp_up))
+        wall = time.perf_counter() - wall_start
+        cpu_end = _proc_cpu_seconds(pid)
+        rss_end = _proc_rss_bytes(pid)
+
+    runs = [r for s in simulated for r in s.runs]
+    by_kind = {}
+    for kind in sorted({r["kind"] for r in runs}):
+        selected = [r for r in runs if r["kind"] == kind]
+        by_kind[kind] = {
+            "latency_ms": _percentiles([r["ms"] for r in selected]),
+            "deltas": _percentiles([r["deltas"] for r in selected]),
+        }
+    cpu = cpu_end - cpu_start if cpu_start is not None and cpu_end is not None else None
+    rss_growth = rss_end - rss_start if rss_start is not None and rss_end is not None else None
+    return {
+        "config": {
+            "sessions": sessions,
+            "steps": steps,
+            "think_s": list(think),
+            "ramp_up_s": ramp_up,
+            "seed": seed,
+            "python": sys.version.split()[0],
+        },
+        "wall_s": round(wall, 3),
+        "script_runs": len(runs),
+        "runs_per_s": round(len(runs) / wall, 2) if wall else None,
+        "latency_ms": _percentiles([r["ms"] for r in runs]),
+        "deltas": _percentiles([r["deltas"] for r in runs]),
+        "by_kind": by_kind,
+        "cpu": {
+            "total_s": round(cpu, 3) if cpu is not None else None,
+            "per_session_s": round(cpu / sessions, 3) if cpu is not None and sessions else None,
+            "per_run_ms": round(cpu * 1000 / len(runs), 2) if cpu is not None and runs else None,
+            "utilisation": round(cpu / wall, 2) if cpu is not None and wall else None,
+        },
+        "rss": {
+            "start_mb": round(rss_start / 2**20, 1) if rss_start is not None else None,
+            "end_mb": round(rss_end / 2**20, 1) if rss_end is not None else None,
+            "peak_mb": round(max(rss_samples) / 2**20, 1) if rss_samples else None,
+            "per_session_mb": round(rss_growth / 2**20 / sessions, 2) if rss_growth is not None and sessions else None,
+        },
+        "errors": [
+            {"session": s.index, "error": s.error} for s in simulated if s.error
+        ],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=10, help="concurrent simulated learners")
+    parser.add_argument("--steps", type=int, default=10, help="navigation steps per session")
+    parser.add_argument(
+        "--think", type=float, nargs=2, default=(0.5, 2.0), metavar=("MIN", "MAX"),
+        help="think time range between steps, in seconds",
+    )
+    parser.add_argument("--ramp-up", type=float, default=1.0, help="seconds over which sessions start")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the navigation choices")
+    parser.add_argument("--timeout", type=float, default=60, help="per script-run timeout, in seconds")
+    parser.add_argument("--json", help="write the report to this file")
+    args = parser.parse_args(argv)
+    if websockets is None:
+        raise SystemExit("The load test needs the websockets package: pip install websockets")
+
+    report = run(args.sessions, args.steps, tuple(args.think), args.ramp_up, args.seed, args.timeout)
+    latency = report["latency_ms"]
+    print(
+        f"{report['script_runs']} script runs in {report['wall_s']:.1f} s "
+        f"({report['runs_per_s']} runs/s) across {args.sessions} sessions"
+    )
+    if latency:
+        print(
+            f"latency: p50 {latency['p50']:.1f} ms | p95 {latency['p95']:.1f} ms | "
+            f"p99 {latency['p99']:.1f} ms | max {latency['max']:.1f} ms"
+        )
+    for kind, stats in report["by_kind"].items():
+        print(f"{kind:>11}: p50 {stats['latency_ms']['p50']:8.1f} ms | "
+              f"{stats['deltas']['p50']:.0f} deltas")
+    print(
+        f"server cpu: {report['cpu']['total_s']} s total, {report['cpu']['per_run_ms']} ms/run | "
+        f"rss: peak {report['rss']['peak_mb']} MB, {report['rss']['per_session_mb']} MB/session"
+    )
+    for error in report["errors"]:
+        print(f"session {error['session']} failed: {error['error']}")
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+    if report["errors"]:
+        sys.exit(f"{len(report['errors'])} of {args.sessions} sessions failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""Startup and per-module render cost, saved as JSON for comparing commits.
+
+Three measurements, each in fresh interpreters:
+
+* ``importtime``: ``python -X importtime -c "import app"``, reported as the
+  app's cumulative import time and its slowest own imports (``modules``,
+  ``utils``, ``app``), which are what a change here can affect.
+* ``modules``: for each module, the cold ``render()`` (import, compile and
+  draw in a new process) with its peak traced memory, then warm renders
+  (compiled content replayed) with the elements and day headings drawn, for
+  both the default single-day page and *All days*.
+* ``context``: Python and Streamlit versions and the git commit, so two
+  reports can be told apart.
+
+Pages are drawn through ``AppTest``, so fragments (the day selector, the
+days and the labs) run as they do in the app, but no server or browser is
+involved. Each module also reports ``overhead_ms``, AppTest's warm time for an
+empty script, which every warm figure includes.
+
+Usage (from the ``oic_training_guide`` directory)::
+
+    python -m benchmarks.render_cost --runs 20 --json render_cost.json
+"""
+
+import argparse
+import json
+import platform
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+from modules import __all__ as MODULE_NAMES
+
+APP_DIR = Path(__file__).resolve().parent.parent
+
+_OWN_IMPORTS = re.compile(r"^(app|modules|utils)(\.|$)")
+
+# Background work (diagram pre-rendering, file watching) is only started
+# by ``setup_page``, which is not called here, so nothing races the timers.
+# Pages are drawn through ``AppTest`` so the day selector, each day and the
+# labs, all fragments, actually run; an empty script is run first so the
+# cold time excludes AppTest's own start-up, and its warm time is reported
+# as the per-run overhead included in every figure.
+_RENDER_SNIPPET = """
+import json, logging, statistics, time, tracemalloc
+from streamlit.testing.v1 import AppTest
+logging.disable(logging.WARNING)
+
+def elements(node):
+    children = getattr(node, "children", None)
+    if children is None:
+        return 1
+    return sum(elements(child) for child in children.values())
+
+def page(options):
+    script = f"from modules import load_render\\nload_render({name!r})(**{{options!r}})"
+    return AppTest.from_string(script, default_timeout={timeout})
+
+def draw(at):
+    at.run()
+    if at.exception:
+        raise SystemExit(at.exception[0].value)
+    return at
+
+def warm(at):
+    samples = []
+    for _ in range({runs}):
+        began = time.perf_counter()
+        draw(at)
+        samples.append(time.perf_counter() - began)
+    return samples
+
+empty = draw(AppTest.from_string("pass"))
+overhead = warm(empty)
+tracemalloc.start()
+start = time.perf_counter()
+at = draw(page({{}}))
+result = {{
+    "cold_ms": round((time.perf_counter() - start) * 1000, 3),
+    "peak_memory_kb": round(tracemalloc.get_traced_memory()[1] / 1024, 1),
+    "overhead_ms": round(statistics.median(overhead) * 1000, 3),
+}}
+tracemalloc.stop()
+for name, options, days in (("day", {{}}, 1), ("all_days", {{"paged": False}}, None)):
+    at = draw(page(options)) if options else at
+    headings = sum(m.value.count("## 📅") for m in at.markdown)
+    if headings == 0 or (days == 1 and headings != 1):
+        raise SystemExit(f"{name}: expected day content, found {{headings}} day headings")
+    samples = warm(at)
+    result[name] = {{
+        "warm_median_ms": round(statistics.median(samples) * 1000, 3),
+        "warm_min_ms": round(min(samples) * 1000, 3),
+        "elements": elements(at.main),
+        "days": headings,
+    }}
+print(json.dumps(result))
+"""
+
+
+def _python(args, **kwargs):
+    result = subprocess.run([sys.executable, *args], cwd=APP_DIR, capture_output=True, text=True, **kwargs)
+    if result.returncode:
+        raise RuntimeError(f"{args[0]} {args[1][:40]!r}... failed:\n{result.stderr.strip()}")
+    return result
+
+
+def importtime(top=10):
+    """Parse ``-X importtime`` for ``import app``."""
+    stderr = _python(["-X", "importtime", "-c", "import app"]).stderr
+    rows = []
+    for line in stderr.splitlines():
+        match = re.match(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)", line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    app_row = next((row for row in rows if row[0] == "app"), None)
+    # A module can be listed twice (a circular import finishing late); keep its largest row.
+    own = {}
+    for row in rows:
+        if _OWN_IMPORTS.match(row[0]) and row[2] > own.get(row[0], (None, 0, 0))[2]:
+            own[row[0]] = row
+    own = sorted(own.values(), key=lambda row: -row[2])
+    return {
+        "app_cumulative_ms": round(app_row[2] / 1000, 2) if app_row else None,
+        "total_ms": round(sum(row[1] for row in rows) / 1000, 2),
+        "own_imports": [
+            {"module": name, "self_ms": round(s / 1000, 2), "cumulative_ms": round(c / 1000, 2)}
+            for name, s, c, _ in own[:top]
+        ],
+    }
+
+
+def module_cost(name, runs, timeout=60):
+    """Cold and warm render cost of ``modules.<name>`` in a fresh interpreter."""
+    stdout = _python(["-c", _RENDER_SNIPPET.format(name=name, runs=runs, timeout=timeout)]).stdout
+    return json.loads(stdout.strip().splitlines()[-1])
+
+
+def _context():
+    import streamlit
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=APP_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "platform": platform.platform(),
+        "commit": commit,
+    }
+
+
+def run(runs=20, samples=3):
+    """Measure everything and return a report dict.
+
+    ``samples`` fresh-interpreter runs are taken per measurement; the report
+    keeps the one with the median cold time to smooth out process noise.
+    """
+    imports = sorted((importtime() for _ in range(samples)), key=lambda r: r["app_cumulative_ms"] or 0)
+    modules = {}
+    for name in MODULE_NAMES:
+        costs = sorted((module_cost(name, runs) for _ in range(samples)), key=lambda r: r["cold_ms"])
+        modules[name] = costs[len(costs) // 2]
+    totals = {
+        "cold_ms_total": round(sum(m["cold_ms"] for m in modules.values()), 3),
+        "peak_memory_kb_max": max(m["peak_memory_kb"] for m in modules.values()),
+    }
+    for page in ("day", "all_days"):
+        totals[f"{page}_warm_ms_mean"] = round(
+            statistics.fmean(m[page]["warm_median_ms"] for m in modules.values()), 3
+        )
+    return {
+        "context": _context(),
+        "importtime": imports[len(imports) // 2],
+        "modules": modules,
+        "summary": totals,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="warm renders per module and page")
+    parser.add_argument("--samples", type=int, default=3, help="fresh-interpreter samples per measurement")
+    parser.add_argument("--json", help="write the report to this file")
+    args = parser.parse_args(argv)
+
+    report = run(args.runs, args.samples)
+    print(f"import app: {report['importtime']['app_cumulative_ms']} ms cumulative")
+    for row in report["importtime"]["own_imports"][:5]:
+        print(f"  {row['module']:<32} {row['cumulative_ms']:8.2f} ms")
+    print(f"{'module':<28} {'cold':>9} {'warm':>8} {'all days':>9} {'elements':>9} {'peak':>9}")
+    for name, cost in report["modules"].items():
+        print(
+            f"{name:<28} {cost['cold_ms']:7.1f}ms {cost['day']['warm_median_ms']:6.2f}ms "
+            f"{cost['all_days']['warm_median_ms']:7.2f}ms {cost['day']['elements']:>4}/{cost['all_days']['elements']:<4} "
+            f"{cost['peak_memory_kb']:7.0f}KB"
+        )
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
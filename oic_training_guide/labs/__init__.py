@@ -0,0 +1,23 @@
+"""Interactive labs embedded in module pages.
+
+A module places a lab with a ``utils.content.Lab`` block naming one of
+``LABS``. Lab files import pandas and draw their own widgets, so they are
+imported lazily the first time a page shows them, like ``modules``. The
+static site and the book show a pointer to the app instead.
+"""
+
+import importlib
+
+# name -> title shown wherever the lab can't run.
+LABS = {
+    "mapping": "🧪 Mapping Lab",
+    "switch": "🔀 Switch Simulator",
+    "scheduled_run": "⏱️ Scheduled Run Simulator",
+    "backfill": "⏪ Backfill Simulator",
+    "endpoints": "🧭 REST Trigger Emulator",
+}
+
+
+def render_lab(name):
+    """Draw ``labs.<name>`` at the current position."""
+    importlib.import_module(f"{__name__}.{name}").render()
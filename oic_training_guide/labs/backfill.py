@@ -0,0 +1,129 @@
+"""Backfill Simulator: recover the scheduled runs missed during downtime.
+
+The schedule and the last watermark give the missed fire times
+(``labs.schedules``). These are replayed oldest first, each with its own
+``processDate``, at several concurrency limits. The lab reports the
+catch-up time for each limit, and how the backlog and watermark move at
+the chosen one.
+"""
+
+from bisect import bisect_right
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from labs.schedules import RunCost, ScheduleError, compare_concurrency, parse_schedule
+
+CONCURRENCY_LEVELS = (1, 2, 4, 8, 16)
+
+# How many replayed runs to list; the rest are summarized by the chart.
+RUN_PREVIEW = 10
+
+
+def _duration(delta):
+    minutes = round(delta.total_seconds() / 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours} h {minutes:02d} min" if hours else f"{minutes} min"
+
+
+def _backlog(backfill):
+    """Runs waiting or active over time, sampled at each completion."""
+    finished = sorted(run.finished for run in backfill.runs)
+    due = sorted(run.fire for run in backfill.runs)
+    rows = []
+    for done, when in enumerate(finished, start=1):
+        rows.append({"Time": when, "Runs behind": bisect_right(due, when) - done})
+    return pd.DataFrame(rows).set_index("Time") if rows else pd.DataFrame()
+
+
+def _moment(container, label, default, key):
+    left, right = container.columns(2)
+    day = left.date_input(label, default.date(), key=f"{key}_date")
+    clock = right.time_input("Time", default.time(), key=f"{key}_time", label_visibility="hidden")
+    return datetime.combine(day, clock)
+
+
+@st.fragment
+def render():
+    """Draw the Backfill Simulator; its widgets rerun only the lab."""
+    st.markdown("#### ⏪ Backfill Simulator")
+    st.caption(
+        "After downtime, every fire time since the last watermark must be replayed with its own "
+        "processDate. Runs share the target system, so extra concurrency helps only until it is saturated."
+    )
+    schedule_text = st.text_input(
+        "Schedule", "Daily at 2:00 AM", key="lab_backfill_schedule",
+        help=(
+            "A cron expression (`0 2 * * *`, `*/15 * * * MON-FRI`) "
+            "or Daily at 2:00 AM, Hourly, Every 15 minutes."
+        ),
+    )
+    left, right = st.columns(2)
+    watermark = _moment(left, "Last watermark", datetime(2024, 1, 1, 2), "lab_backfill_watermark")
+    now = _moment(right, "Back online", datetime(2024, 1, 15, 9), "lab_backfill_now")
+    cols = st.columns(4)
+    records = cols[0].number_input(
+        "Records per run", min_value=0, max_value=10_000_000, value=200_000, step=50_000, key="lab_backfill_records"
+    )
+    run_rate = cols[1].number_input(
+        "Run rate (records/s)", min_value=1, value=500, step=100, key="lab_backfill_run_rate",
+        help="How fast one run transfers when it has the target to itself.",
+    )
+    target_rate = cols[2].number_input(
+        "Target limit (records/s)", min_value=1, value=2_000, step=500, key="lab_backfill_target_rate",
+        help="Total the target accepts, shared by every run transferring at once.",
+    )
+    concurrency = cols[3].select_slider("Concurrency", CONCURRENCY_LEVELS, value=4, key="lab_backfill_concurrency")
+    if not st.button("▶️ Replay backlog", key="lab_backfill_run"):
+        return
+
+    try:
+        schedule = parse_schedule(schedule_text)
+    except ScheduleError as exc:
+        st.error(f"❌ {exc}")
+        return
+    if now <= watermark:
+        st.error("❌ Back online must be after the last watermark")
+        return
+    cost = RunCost(records=int(records), run_rate=float(run_rate), target_rate=float(target_rate))
+    results = compare_concurrency(schedule, watermark, now, sorted({*CONCURRENCY_LEVELS, concurrency}), cost)
+    chosen = next(result for result in results if result.concurrency == concurrency)
+    if not chosen.missed:
+        st.success(f"✅ No runs of `{schedule.expression}` were missed.")
+        return
+
+    cols = st.columns(3)
+    cols[0].metric("Missed runs", f"{chosen.missed:,}", help=f"`{schedule.expression}` between the two times")
+    cols[1].metric(
+        "Catch-up", _duration(chosen.catch_up) if chosen.caught_up else "never",
+        help=f"{len(chosen.runs):,} runs, including those that came due while catching up",
+    )
+    cols[2].metric("Watermark", chosen.watermarks[-1][1].strftime("%Y-%m-%d %H:%M") if chosen.watermarks else "–")
+    if not chosen.caught_up:
+        st.warning("⚠️ At this concurrency new runs come due faster than they finish.")
+
+    left, right = st.columns(2)
+    left.markdown("**Catch-up time vs concurrency**")
+    left.dataframe(
+        pd.DataFrame([
+            {
+                "Concurrency": result.concurrency,
+                "Catch-up": _duration(result.catch_up) if result.caught_up else "never",
+                "Peak active": result.peak_active,
+                "Runs": len(result.runs),
+            }
+            for result in results
+        ]),
+        hide_index=True,
+    )
+    right.markdown(f"**Runs behind at concurrency {concurrency}**")
+    right.line_chart(_backlog(chosen), height=220)
+    st.markdown("**First replayed runs**")
+    st.dataframe(
+        pd.DataFrame([
+            {**run.parameters, "Started": run.started, "Finished": run.finished}
+            for run in sorted(chosen.runs, key=lambda run: run.fire)[:RUN_PREVIEW]
+        ]),
+        hide_index=True,
+    )
@@ -0,0 +1,196 @@
+"""Switch actions compiled for bulk routing.
+
+A Switch is an ordered list of cases, each a condition (a mapper
+expression, see ``labs.expressions``) and a route, plus an *Otherwise*
+route. The first case whose condition holds wins. ``compile_switch`` turns
+it into a ``Switch`` that can route three ways:
+
+* ``route_record``: case by case for one record, as a flow does at runtime;
+* ``route_masks``: each condition evaluated over a whole batch, combined
+  with ``numpy.select`` in case order;
+* ``route_table``: when every case compares the same field with a number
+  (``$orderAmount > 10000``), the cases collapse into a ``DecisionTable``
+  of sorted thresholds. A record is routed with one binary search instead
+  of one test per case, and a batch with one ``numpy.searchsorted``.
+
+Routes are returned as integer codes into ``Switch.routes`` so counting
+branches is a ``numpy.bincount``.
+"""
+
+import math
+from bisect import bisect_left
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from labs.expressions import (
+    ExpressionError,
+    boolean_column,
+    compile_expression,
+    number_column,
+    to_boolean,
+    to_number,
+)
+
+# op -> the same test with its operands swapped (``1000 < $x`` is ``$x > 1000``).
+_FLIPPED = {">": "<", ">=": "<=", "<": ">", "<=": ">=", "=": "=", "!=": "!="}
+
+_TESTS = {
+    ">": lambda value, threshold: value > threshold,
+    ">=": lambda value, threshold: value >= threshold,
+    "<": lambda value, threshold: value < threshold,
+    "<=": lambda value, threshold: value <= threshold,
+    "=": lambda value, threshold: value == threshold,
+    "!=": lambda value, threshold: value != threshold,
+}
+
+
+def _field(node):
+    if node[0] == "var":
+        return node[1]
+    if node[0] == "call" and node[1] == "number" and node[2][0][0] == "var":
+        return node[2][0][1]
+    return None
+
+
+def threshold_test(tree):
+    """``(field, op, threshold)`` if ``tree`` compares one field with a number, else ``None``."""
+    if tree[0] != "binop" or tree[1] not in _TESTS:
+        return None
+    op, left, right = tree[1], tree[2], tree[3]
+    if right[0] == "literal" and isinstance(right[1], float) and _field(left):
+        return _field(left), op, right[1]
+    if left[0] == "literal" and isinstance(left[1], float) and _field(right):
+        return _field(right), _FLIPPED[op], left[1]
+    return None
+
+
+@dataclass(frozen=True)
+class DecisionTable:
+    """First-match threshold cases over one numeric field.
+
+    The sorted thresholds ``t0 < t1 < ...`` split the number line into
+    regions: ``(-inf, t0)``, ``{t0}``, ``(t0, t1)``, ``{t1}``, ... ``(tk, inf)``.
+    Every case gives the same answer anywhere inside a region, so
+    ``labels[region]`` is the route code found by running the cases once
+    on a point of that region. Missing and non-numeric values (NaN) get
+    ``missing``, found the same way.
+    """
+    field: str
+    thresholds: tuple
+    labels: tuple
+    missing: int
+
+    def lookup(self, value):
+        """Route code for one value: a binary search."""
+        value = to_number(value)
+        if math.isnan(value):
+            return self.missing
+        i = bisect_left(self.thresholds, value)
+        exact = i < len(self.thresholds) and self.thresholds[i] == value
+        return self.labels[2 * i + exact]
+
+    def lookup_column(self, values):
+        """Route codes for an array of numbers: one ``searchsorted``."""
+        thresholds = np.asarray(self.thresholds, dtype=float)
+        labels = np.asarray(self.labels, dtype=np.int64)
+        i = np.searchsorted(thresholds, values, side="left")
+        exact = thresholds[np.minimum(i, len(thresholds) - 1)] == values
+        exact &= i < len(thresholds)
+        codes = labels[2 * i + exact]
+        codes[np.isnan(values)] = self.missing
+        return codes
+
+    def intervals(self):
+        """``(interval, code)`` rows with adjacent regions of one route merged."""
+        t = self.thresholds
+        rows = []
+        start = 0
+        for region in range(1, len(self.labels) + 1):
+            if region < len(self.labels) and self.labels[region] == self.labels[start]:
+                continue
+            end = region - 1
+            low = f"[{_number(t[start // 2])}" if start % 2 else (f"({_number(t[start // 2 - 1])}" if start else "(-∞")
+            high = f"{_number(t[end // 2])}]" if end % 2 else (f"{_number(t[end // 2])})" if end // 2 < len(t) else "∞)")
+            rows.append((f"{low}, {high}", self.labels[start]))
+            start = region
+        return rows
+
+
+def _number(value):
+    return f"{value:g}"
+
+
+def build_table(tests, otherwise):
+    """A ``DecisionTable`` for ``[(field, op, threshold), ...]`` cases, or ``None``."""
+    if not tests or len({field for field, _, _ in tests}) != 1:
+        return None
+    thresholds = sorted({threshold for _, _, threshold in tests})
+    # A point in each region: below, on and between the thresholds.
+    points = [thresholds[0] - 1]
+    for low, high in zip(thresholds, thresholds[1:] + [thresholds[-1] + 2]):
+        points += [low, (low + high) / 2]
+
+    def first_match(point):
+        return next((n for n, (_, op, threshold) in enumerate(tests) if _TESTS[op](point, threshold)), otherwise)
+
+    labels = tuple(first_match(point) for point in points)
+    return DecisionTable(tests[0][0], tuple(thresholds), labels, first_match(math.nan))
+
+
+@dataclass(frozen=True)
+class Switch:
+    """Compiled Switch cases; routes are codes into ``routes``."""
+    conditions: tuple  # one Expression per case
+    routes: tuple  # case routes, then the Otherwise route
+    table: DecisionTable = None
+
+    @property
+    def otherwise(self):
+        return len(self.routes) - 1
+
+    def route_record(self, record):
+        """Case by case, stopping at the first condition that holds."""
+        for code, condition in enumerate(self.conditions):
+            if to_boolean(condition.row(record)):
+                return code
+        return self.otherwise
+
+    def route_records(self, records):
+        return np.fromiter((self.route_record(record) for record in records), dtype=np.int64, count=len(records))
+
+    def route_masks(self, frame):
+        """Every condition over the whole batch, first match per row."""
+        masks = []
+        for condition in self.conditions:
+            mask = boolean_column(condition.column(frame))
+            if isinstance(mask, pd.Series):
+                mask = mask.to_numpy(dtype=bool)
+            else:
+                mask = np.full(len(frame), mask)
+            masks.append(mask)
+        return np.select(masks, range(len(masks)), default=self.otherwise).astype(np.int64)
+
+    def route_table(self, frame):
+        """One binary search per row over the decision table."""
+        column = frame[self.table.field] if self.table.field in frame.columns else pd.Series(np.nan, index=frame.index)
+        values = number_column(column).to_numpy(dtype=float)
+        return self.table.lookup_column(values)
+
+
+def compile_switch(cases, otherwise):
+    """Compile ``[(condition, route), ...]`` and the Otherwise route into a ``Switch``."""
+    conditions, routes, tests = [], [], []
+    for number, (condition, route) in enumerate(cases, start=1):
+        try:
+            expression = compile_expression(condition)
+        except ExpressionError as exc:
+            raise ExpressionError(f"Case {number}: {exc}") from None
+        conditions.append(expression)
+        routes.append(route)
+        tests.append(threshold_test(expression.tree))
+    if not conditions:
+        raise ExpressionError("Add at least one case")
+    table = None if None in tests else build_table(tests, otherwise=len(conditions))
+    return Switch(tuple(conditions), (*routes, otherwise), table)
@@ -0,0 +1,111 @@
+"""REST Trigger Emulator: dispatch requests to app-driven endpoint templates.
+
+Templates are compiled into a routing trie (``labs.routing``). A request
+shows the endpoint it reaches, with its path and query parameters. The
+benchmark registers thousands of generated endpoints and compares the trie
+with one regular expression per route.
+"""
+
+import json
+
+import pandas as pd
+import streamlit as st
+
+from labs.routing import (
+    METHODS,
+    RegexRouter,
+    RouteError,
+    Router,
+    generate_routes,
+    parse_routes,
+    sample_requests,
+    time_router,
+)
+
+DEFAULT_ROUTES = """\
+// [METHOD] /path/{pathParam}?queryParam&queryParam=default
+GET /api/orders/{orderId}?includeDetails&format=json
+GET /api/orders/search?q&limit=10
+GET /api/users?status&limit=10
+GET /api/users/{userId}/orders/{orderId}
+GET /orders/{orderId}/lines/{lineId}
+PATCH /orders/{orderId}/lines/{lineId}
+"""
+
+ROUTE_COUNTS = (100, 1_000, 5_000, 10_000)
+
+# The regex router scans every endpoint per request; this keeps 10,000
+# endpoints to a few seconds.
+BENCHMARK_REQUESTS = 2_000
+
+
+def _describe(match):
+    if match is None:
+        return "No endpoint (404)"
+    return match.route.template
+
+
+@st.fragment
+def render():
+    """Draw the REST Trigger Emulator; its widgets rerun only the lab."""
+    st.markdown("#### 🧭 REST Trigger Emulator")
+    st.caption(
+        "Register endpoint templates and send requests. A literal segment wins over a path "
+        "parameter, so /api/orders/search never reaches {orderId}."
+    )
+    text = st.text_area("Endpoints", DEFAULT_ROUTES, height=170, key="lab_endpoints_routes")
+    left, right = st.columns([1, 4])
+    method = left.selectbox("Method", METHODS, key="lab_endpoints_method")
+    url = right.text_input("Request", "/api/orders/ORD-1001?includeDetails=true", key="lab_endpoints_url")
+    try:
+        routes = parse_routes(text)
+        router = Router(routes)
+    except RouteError as exc:
+        st.error(f"❌ {exc}")
+        return
+    match = router.match(method, url)
+    if match is None:
+        st.warning(f"⚠️ No endpoint for {method} {url}")
+    else:
+        st.success(f"✅ {match.route.method} {match.route.template}")
+        st.code(
+            json.dumps({"pathParameters": match.path_params, "queryParameters": match.query_params}, indent=2),
+            language="json",
+        )
+    naive = RegexRouter(routes).match(method, url)
+    if (naive.route if naive else None) != (match.route if match else None):
+        st.info(f"First-match regex routing would send this to: {_describe(naive)}")
+
+    st.markdown("**Dispatch cost**")
+    left, right = st.columns([3, 1])
+    count = left.select_slider(
+        "Registered endpoints", ROUTE_COUNTS, value=5_000, format_func="{:,}".format, key="lab_endpoints_count"
+    )
+    if not right.button("⏱️ Benchmark", key="lab_endpoints_bench"):
+        return
+    routes = generate_routes(count)
+    requests = sample_requests(routes, BENCHMARK_REQUESTS)
+    with st.spinner("Matching…"):
+        timings = [time_router("Routing trie", Router, routes, requests)]
+        timings.append(time_router("Regex per route", RegexRouter, routes, requests))
+    agree = all(
+        (a.route, a.path_params) == (b.route, b.path_params) if a and b else a is b
+        for a, b in zip(timings[0].results, timings[1].results)
+    )
+    st.dataframe(
+        pd.DataFrame([
+            {
+                "Router": timing.name,
+                "Build (ms)": round(timing.build_ms, 1),
+                "Per request (µs)": round(timing.per_request_us, 1),
+                "Requests/s": round(timing.throughput),
+                "Matched": f"{timing.matched:,} / {timing.requests:,}",
+            }
+            for timing in timings
+        ]),
+        hide_index=True,
+    )
+    st.caption(
+        f"{len(routes):,} endpoints such as `{routes[-1].method} {routes[-1].template}`. "
+        + ("Both routers agree on every request." if agree else "⚠️ The routers disagree on some requests.")
+    )
@@ -0,0 +1,703 @@
+"""Mapping expression engine for the Mapping Lab.
+
+Understands the mapper functions taught on Day 7::
+
+    concat($firstName, " ", $lastName)
+    substring($text, 1, 10)
+    upper-case($name)  lower-case($email)
+    fn:format-dateTime($date, "[Y0001]-[M01]-[D01]")  fn:current-dateTime()
+    number($stringValue)  round($decimal, 2)  string($value)
+    if ($status = "ACTIVE") then "Y" else "N"
+
+plus ``= != < <= > >=``, ``and``/``or``, ``+ - * div mod`` and parentheses.
+Variables name record fields; ``$customer/name`` reaches into nested JSON,
+which ``flatten`` turns into a ``customer/name`` column.
+
+An expression is parsed once by ``compile_expression`` into two callables:
+
+* ``Expression.row(record)`` evaluates one record (a dict);
+* ``Expression.column(frame)`` evaluates a whole ``pandas.DataFrame`` with
+  column-wise operations, falling back to a per-value loop only where no
+  vectorized form exists (e.g. a ``substring`` start taken from a field).
+
+Both follow the same rules: missing values are empty strings (or NaN as
+numbers), ``round`` rounds halves up, and a comparison is numeric when
+either side is a number and textual otherwise.
+"""
+
+import math
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+FIELD_SEPARATOR = "/"
+
+
+class ExpressionError(ValueError):
+    """An expression or mapping that cannot be parsed or compiled."""
+
+
+# --- Value conversions (row) ----------------------------------------------------
+
+def _is_missing(value):
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def to_string(value):
+    """XPath ``string()``: ``1.0`` is ``"1"``, missing is ``""``."""
+    if _is_missing(value):
+        return ""
+    if isinstance(value, (bool, np.bool_)):
+        return "true" if value else "false"
+    if isinstance(value, (float, np.floating)):
+        if math.isinf(value):
+            return "Infinity" if value > 0 else "-Infinity"
+        return str(int(value)) if float(value).is_integer() else repr(float(value))
+    return str(value)
+
+
+def to_number(value):
+    """XPath ``number()``: NaN for anything that isn't a number."""
+    if _is_missing(value):
+        return math.nan
+    if isinstance(value, (bool, np.bool_)):
+        return 1.0 if value else 0.0
+    try:
+        return float(value.strip() if isinstance(value, str) else value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def to_boolean(value):
+    if _is_missing(value):
+        return False
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (int, float, np.number)):
+        return value != 0
+    return len(str(value)) > 0
+
+
+def _round(value, precision=0):
+    # XPath rounds halves towards positive infinity: round(2.5) = 3, round(-2.5) = -2.
+    if math.isnan(value) or math.isinf(value) or math.isnan(precision):
+        return value if not math.isnan(precision) else math.nan
+    factor = 10.0 ** precision
+    return math.floor(value * factor + 0.5) / factor
+
+
+def _divide(a, b):
+    if b == 0:
+        if a == 0 or math.isnan(a):
+            return math.nan
+        return math.copysign(math.inf, a) * math.copysign(1.0, b)
+    return a / b
+
+
+def _parse_datetime(value):
+    text = to_string(value)
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+
+# --- Value conversions (column) ----------------------------------------------------
+
+def _is_column(value):
+    return isinstance(value, pd.Series)
+
+
+def _string_column(value):
+    if not _is_column(value):
+        return to_string(value)
+    if isinstance(value.dtype, pd.CategoricalDtype):
+        # Unordered categoricals only compare for equality; use their strings.
+        labels = np.append(value.cat.categories.map(to_string).to_numpy(dtype=object), "")
+        return pd.Series(labels[value.cat.codes.to_numpy()], index=value.index)
+    if pd.api.types.is_bool_dtype(value) or pd.api.types.is_numeric_dtype(value):
+        return value.map(to_string)
+    if pd.api.types.is_string_dtype(value) and not (value.dtype == object and value.map(type).ne(str).any()):
+        return value.fillna("")
+    return value.map(to_string)
+
+
+def number_column(value):
+    """``to_number`` over a column (or a single value)."""
+    if not _is_column(value):
+        return to_number(value)
+    if pd.api.types.is_bool_dtype(value):
+        return value.astype(float)
+    if pd.api.types.is_numeric_dtype(value):
+        return value.astype(float)
+    return pd.to_numeric(_string_column(value).str.strip(), errors="coerce")
+
+
+def boolean_column(value):
+    """``to_boolean`` over a column (or a single value)."""
+    if not _is_column(value):
+        return to_boolean(value)
+    if pd.api.types.is_bool_dtype(value):
+        return value.fillna(False).astype(bool)
+    if pd.api.types.is_numeric_dtype(value):
+        return (value != 0) & value.notna()
+    return _string_column(value).str.len() > 0
+
+
+def _per_value(func, args, index):
+    """Apply a row-level ``func`` across column arguments (the slow path)."""
+    columns = [arg.tolist() if _is_column(arg) else [arg] * len(index) for arg in args]
+    return pd.Series([func(*values) for values in zip(*columns)], index=index, dtype=object)
+
+
+# --- Date pictures ------------------------------------------------------------------
+
+_PICTURE_PARTS = {
+    "Y0001": "%Y", "Y": "%Y", "Y01": "%y",
+    "M01": "%m", "MNn": "%B", "Mn": "%b",
+    "D01": "%d",
+    "H01": "%H", "h01": "%I", "m01": "%M", "s01": "%S", "P": "%p",
+    "FNn": "%A", "Fn": "%a",
+    "Z": "%z",
+}
+
+# Components that can be cut straight out of "YYYY-MM-DDTHH:MM:SS".
+_ISO_SLICES = {"%Y": (0, 4), "%m": (5, 7), "%d": (8, 10), "%H": (11, 13), "%M": (14, 16), "%S": (17, 19)}
+
+
+@dataclass(frozen=True)
+class DatePicture:
+    """A compiled XPath date picture such as ``[Y0001]-[M01]-[D01]``.
+
+    ``fmt`` is the ``strftime`` equivalent. ``pieces`` spells the same output
+    as ``(start, end)`` slices of an ISO timestamp and literal strings, or is
+    ``None`` when a component (month names, 12-hour clock...) needs
+    ``strftime``; slicing is what lets a column skip per-value formatting.
+    """
+    fmt: str
+    pieces: tuple = None
+
+
+def compile_picture(picture):
+    """Translate an XPath date picture to a ``DatePicture``."""
+    parts = []
+    i = 0
+    while i < len(picture):
+        char = picture[i]
+        if picture.startswith("[[", i) or picture.startswith("]]", i):
+            parts.append(("text", char))
+            i += 2
+        elif char == "[":
+            end = picture.find("]", i)
+            if end == -1:
+                raise ExpressionError(f"Unclosed '[' in date picture {picture!r}")
+            component = picture[i + 1:end].replace(" ", "")
+            if component not in _PICTURE_PARTS:
+                raise ExpressionError(f"Unsupported date picture component [{component}]")
+            parts.append(("field", _PICTURE_PARTS[component]))
+            i = end + 1
+        else:
+            parts.append(("text", char))
+            i += 1
+    fmt = "".join(value if kind == "field" else value.replace("%", "%%") for kind, value in parts)
+    if not all(kind == "text" or value in _ISO_SLICES for kind, value in parts):
+        return DatePicture(fmt)
+    return DatePicture(fmt, tuple(_ISO_SLICES[value] if kind == "field" else value for kind, value in parts))
+
+
+# --- Functions --------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Function:
+    """A mapper function: row and column implementations, arity and result type."""
+    row: Callable
+    column: Callable
+    min_args: int
+    max_args: int
+    returns: str  # "string", "number", "boolean" or "any"
+
+
+def _concat_row(*parts):
+    return "".join(to_string(part) for part in parts)
+
+
+def _concat_column(index, *parts):
+    result = ""
+    for part in parts:
+        result = result + _string_column(part)
+    return result
+
+
+def _substring_row(text, start, length=None):
+    text = to_string(text)
+    first = to_number(start)
+    if math.isnan(first):
+        return ""
+    first = _round(first)
+    if length is None:
+        return text[max(int(first) - 1, 0):] if not math.isinf(first) else ""
+    last = first + _round(to_number(length))
+    if math.isnan(last) or last <= 1:
+        return ""
+    begin = max(first, 1)
+    end = min(last, len(text) + 1)
+    return text[int(begin) - 1:int(end) - 1] if end > begin else ""
+
+
+def _substring_column(index, text, start, length=None):
+    args = (text, start) if length is None else (text, start, length)
+    if not _is_column(text) or any(_is_column(arg) for arg in args[1:]):
+        return _per_value(_substring_row, args, index)
+    first = _round(to_number(start))
+    last = math.inf if length is None else first + _round(to_number(length))
+    if math.isnan(first) or math.isnan(last) or math.isinf(first) or last <= max(first, 1):
+        return pd.Series("", index=index)
+    stop = None if math.isinf(last) else int(last) - 1
+    return _string_column(text).str.slice(int(max(first, 1)) - 1, stop)
+
+
+def _upper_column(index, text):
+    text = _string_column(text)
+    return text.str.upper() if _is_column(text) else text.upper()
+
+
+def _lower_column(index, text):
+    text = _string_column(text)
+    return text.str.lower() if _is_column(text) else text.lower()
+
+
+def _format_datetime_row(value, picture):
+    parsed = _parse_datetime(value)
+    return parsed.strftime(picture.fmt) if parsed is not None else ""
+
+
+def _format_datetime_column(index, value, picture):
+    if not _is_column(value):
+        return _format_datetime_row(value, picture)
+    # Timestamps repeat a lot in real batches (same day, same run); parse and
+    # format each distinct value once and spread the results back.
+    codes, distinct = pd.factorize(_string_column(value))
+    formatted = _format_datetimes(pd.Series(distinct), picture)
+    return pd.Series(formatted.to_numpy()[codes], index=index)
+
+
+def _format_datetimes(text, picture):
+    try:
+        parsed = pd.to_datetime(text, errors="coerce", format="ISO8601")
+    except (TypeError, ValueError):
+        # Mixed UTC offsets have no single column type; keep each value's own.
+        return text.map(lambda v: _format_datetime_row(v, picture))
+    if picture.pieces is None:
+        return parsed.dt.strftime(picture.fmt).fillna("")
+    if parsed.dt.tz is not None:
+        parsed = parsed.dt.tz_localize(None)  # wall-clock time in the value's own offset
+    iso = pd.Series(np.datetime_as_string(parsed.to_numpy().astype("datetime64[s]"), unit="s"))
+    result = ""
+    for piece in picture.pieces:
+        result = result + (piece if isinstance(piece, str) else iso.str.slice(*piece))
+    if not _is_column(result):
+        result = pd.Series(result, index=iso.index)
+    return result.where(parsed.notna(), "")
+
+
+def _current_datetime_row():
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _round_column(index, value, precision=0):
+    value = number_column(value)
+    precision = to_number(precision) if not _is_column(precision) else precision
+    if _is_column(precision):
+        return _per_value(_round, (value, precision), index).astype(float)
+    if not _is_column(value):
+        return _round(value, precision)
+    factor = 10.0 ** precision
+    return np.floor(value * factor + 0.5) / factor
+
+
+FUNCTIONS = {
+    "concat": Function(_concat_row, _concat_column, 2, 64, "string"),
+    "substring": Function(_substring_row, _substring_column, 2, 3, "string"),
+    "upper-case": Function(lambda s: to_string(s).upper(), _upper_column, 1, 1, "string"),
+    "lower-case": Function(lambda s: to_string(s).lower(), _lower_column, 1, 1, "string"),
+    "string": Function(to_string, lambda index, v: _string_column(v), 1, 1, "string"),
+    "number": Function(to_number, lambda index, v: number_column(v), 1, 1, "number"),
+    "round": Function(
+        lambda v, p=0: _round(to_number(v), to_number(p)), _round_column, 1, 2, "number"
+    ),
+    "format-dateTime": Function(_format_datetime_row, _format_datetime_column, 2, 2, "string"),
+    "current-dateTime": Function(
+        _current_datetime_row, lambda index: _current_datetime_row(), 0, 0, "string"
+    ),
+}
+
+# Arguments that must be literals, compiled ahead of time: (function, position) -> converter.
+_COMPILED_ARGUMENTS = {("format-dateTime", 1): compile_picture}
+
+
+# --- Parsing ----------------------------------------------------------------------
+
+_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<number>\d+(?:\.\d*)?|\.\d+)
+      | (?P<string>"(?:[^"]|"")*"|'(?:[^']|'')*')
+      | (?P<variable>\$[A-Za-z_]\w*(?:/[A-Za-z_]\w*)*)
+      | (?P<name>[A-Za-z_][\w-]*(?::[A-Za-z_][\w-]*)?)
+      | (?P<op>!=|<=|>=|[=<>+*(),-])
+    )""", re.VERBOSE)
+
+_KEYWORDS = {"if", "then", "else", "and", "or", "div", "mod"}
+
+
+def _tokenize(text):
+    tokens = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if match is None or match.end() == position:
+            raise ExpressionError(f"Unexpected {text[position:].lstrip()[:10]!r} at column {position + 1}")
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "name" and value in _KEYWORDS:
+            kind = "op"
+        tokens.append((kind, value, match.start(kind) + 1))
+        position = match.end()
+    tokens.append(("end", "", len(text) + 1))
+    return tokens
+
+
+class _Parser:
+    """Recursive descent over the tokens, producing tuples::
+
+        ("literal", value)  ("var", field)  ("call", name, args)
+        ("if", cond, then, else)  ("binop", op, left, right)  ("neg", operand)
+    """
+
+    def __init__(self, text):
+        self.tokens = _tokenize(text)
+        self.index = 0
+
+    def peek(self):
+        return self.tokens[self.index]
+
+    def take(self, value=None):
+        kind, token, column = self.tokens[self.index]
+        if value is not None and token != value:
+            found = "end of expression" if kind == "end" else repr(token)
+            raise ExpressionError(f"Expected {value!r} at column {column}, found {found}")
+        self.index += 1
+        return kind, token, column
+
+    def parse(self):
+        node = self.expression()
+        kind, token, column = self.peek()
+        if kind != "end":
+            raise ExpressionError(f"Unexpected {token!r} at column {column}")
+        return node
+
+    def expression(self):
+        if self.peek()[1] == "if" and self.peek()[0] == "op":
+            self.take("if")
+            self.take("(")
+            condition = self.expression()
+            self.take(")")
+            self.take("then")
+            then = self.expression()
+            self.take("else")
+            return ("if", condition, then, self.expression())
+        return self.binary(0)
+
+    _LEVELS = (("or",), ("and",), ("=", "!=", "<", "<=", ">", ">="), ("+", "-"), ("*", "div", "mod"))
+
+    def binary(self, level):
+        if level == len(self._LEVELS):
+            return self.unary()
+        node = self.binary(level + 1)
+        while self.peek()[0] == "op" and self.peek()[1] in self._LEVELS[level]:
+            op = self.take()[1]
+            node = ("binop", op, node, self.binary(level + 1))
+        return node
+
+    def unary(self):
+        if self.peek()[:2] == ("op", "-"):
+            self.take()
+            return ("neg", self.unary())
+        return self.primary()
+
+    def primary(self):
+        kind, token, column = self.take()
+        if kind == "number":
+            return ("literal", float(token))
+        if kind == "string":
+            return ("literal", token[1:-1].replace(token[0] * 2, token[0]))
+        if kind == "variable":
+            return ("var", token[1:])
+        if kind == "name":
+            name = token.removeprefix("fn:")
+            if name not in FUNCTIONS:
+                raise ExpressionError(f"Unknown function {token}() at column {column}")
+            self.take("(")
+            args = []
+            if self.peek()[1] != ")":
+                args.append(self.expression())
+                while self.peek()[1] == ",":
+                    self.take(",")
+                    args.append(self.expression())
+            self.take(")")
+            function = FUNCTIONS[name]
+            if not function.min_args <= len(args) <= function.max_args:
+                raise ExpressionError(f"{token}() takes {_arity(function)} arguments, got {len(args)}")
+            return ("call", name, tuple(args))
+        if token == "(":
+            node = self.expression()
+            self.take(")")
+            return node
+        found = "end of expression" if kind == "end" else repr(token)
+        raise ExpressionError(f"Unexpected {found} at column {column}")
+
+
+def _arity(function):
+    if function.min_args == function.max_args:
+        return str(function.min_args)
+    if function.max_args > 3:
+        return f"at least {function.min_args}"
+    return f"{function.min_args}-{function.max_args}"
+
+
+# --- Compilation ------------------------------------------------------------------
+
+_COMPARISONS = {
+    "=": lambda a, b: a == b, "!=": lambda a, b: a != b,
+    "<": lambda a, b: a < b, "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b, ">=": lambda a, b: a >= b,
+}
+_ARITHMETIC_ROW = {
+    "+": lambda a, b: a + b, "-": lambda a, b: a - b, "*": lambda a, b: a * b,
+    "div": _divide, "mod": lambda a, b: math.fmod(a, b) if b else math.nan,
+}
+_ARITHMETIC_COLUMN = {
+    "+": lambda a, b: a + b, "-": lambda a, b: a - b, "*": lambda a, b: a * b,
+    "div": lambda a, b: a / b if _is_column(a) or _is_column(b) else _divide(a, b),
+    "mod": lambda a, b: np.fmod(a, b) if _is_column(a) or _is_column(b) else _ARITHMETIC_ROW["mod"](a, b),
+}
+
+
+def static_type(node):
+    """``"string"``, ``"number"``, ``"boolean"`` or ``"any"`` (a field)."""
+    kind = node[0]
+    if kind == "literal":
+        return "number" if isinstance(node[1], float) else "string"
+    if kind == "var":
+        return "any"
+    if kind == "call":
+        return FUNCTIONS[node[1]].returns
+    if kind == "neg":
+        return "number"
+    if kind == "if":
+        then, otherwise = static_type(node[2]), static_type(node[3])
+        return then if then == otherwise else "any"
+    op = node[1]
+    if op in ("and", "or") or op in _COMPARISONS:
+        return "boolean"
+    return "number"
+
+
+def _numeric_comparison(left, right):
+    return "number" in (static_type(left), static_type(right))
+
+
+def _compile_row(node):
+    kind = node[0]
+    if kind == "literal":
+        value = node[1]
+        return lambda record: value
+    if kind == "var":
+        field = node[1]
+        return lambda record: record.get(field)
+    if kind == "neg":
+        operand = _compile_row(node[1])
+        return lambda record: -to_number(operand(record))
+    if kind == "if":
+        condition, then, otherwise = (_compile_row(child) for child in node[1:])
+        return lambda record: then(record) if to_boolean(condition(record)) else otherwise(record)
+    if kind == "call":
+        name, args = node[1], node[2]
+        func = FUNCTIONS[name].row
+        compiled = [
+            _constant(_COMPILED_ARGUMENTS[name, i], arg) if (name, i) in _COMPILED_ARGUMENTS else _compile_row(arg)
+            for i, arg in enumerate(args)
+        ]
+        if len(compiled) == 1:
+            (only,) = compiled
+            return lambda record: func(only(record))
+        return lambda record: func(*[arg(record) for arg in compiled])
+
+    op, left, right = node[1], _compile_row(node[2]), _compile_row(node[3])
+    if op == "and":
+        return lambda record: to_boolean(left(record)) and to_boolean(right(record))
+    if op == "or":
+        return lambda record: to_boolean(left(record)) or to_boolean(right(record))
+    if op in _COMPARISONS:
+        compare = _COMPARISONS[op]
+        convert = to_number if _numeric_comparison(node[2], node[3]) else to_string
+        return lambda record: compare(convert(left(record)), convert(right(record)))
+    arithmetic = _ARITHMETIC_ROW[op]
+    return lambda record: arithmetic(to_number(left(record)), to_number(right(record)))
+
+
+def _compile_column(node):
+    kind = node[0]
+    if kind == "literal":
+        value = node[1]
+        return lambda frame: value
+    if kind == "var":
+        field = node[1]
+        return lambda frame: frame[field] if field in frame.columns else None
+    if kind == "neg":
+        operand = _compile_column(node[1])
+        return lambda frame: -number_column(operand(frame))
+    if kind == "if":
+        condition, then, otherwise = (_compile_column(child) for child in node[1:])
+
+        def choose(frame):
+            test = boolean_column(condition(frame))
+            if not _is_column(test):
+                return then(frame) if test else otherwise(frame)
+            # Select on objects so each row keeps its branch's type, as row by row.
+            chosen = np.where(test.to_numpy(), _objects(then(frame)), _objects(otherwise(frame)))
+            return pd.Series(chosen, index=frame.index, dtype=object).infer_objects()
+        return choose
+    if kind == "call":
+        name, args = node[1], node[2]
+        func = FUNCTIONS[name].column
+        compiled = [
+            _constant(_COMPILED_ARGUMENTS[name, i], arg) if (name, i) in _COMPILED_ARGUMENTS else _compile_column(arg)
+            for i, arg in enumerate(args)
+        ]
+        return lambda frame: func(frame.index, *[arg(frame) for arg in compiled])
+
+    op, left, right = node[1], _compile_column(node[2]), _compile_column(node[3])
+    if op in ("and", "or"):
+        combine = np.logical_and if op == "and" else np.logical_or
+        return lambda frame: combine(boolean_column(left(frame)), boolean_column(right(frame)))
+    if op in _COMPARISONS:
+        compare = _COMPARISONS[op]
+        if _numeric_comparison(node[2], node[3]):
+            return lambda frame: compare(number_column(left(frame)), number_column(right(frame)))
+        return lambda frame: _compare_strings(compare, left(frame), right(frame))
+    arithmetic = _ARITHMETIC_COLUMN[op]
+    return lambda frame: arithmetic(number_column(left(frame)), number_column(right(frame)))
+
+
+def _is_categorical(value):
+    return _is_column(value) and isinstance(value.dtype, pd.CategoricalDtype)
+
+
+def _per_category(column, test):
+    # One test per category (and "" for missing), spread over the rows by code.
+    labels = pd.Series([*column.cat.categories.map(to_string), ""], dtype=object)
+    hits = test(labels).to_numpy(dtype=bool)
+    return pd.Series(hits[column.cat.codes.to_numpy()], index=column.index)
+
+
+def _compare_strings(compare, left, right):
+    if _is_categorical(left) and not _is_column(right):
+        return _per_category(left, lambda labels: compare(labels, to_string(right)))
+    if _is_categorical(right) and not _is_column(left):
+        return _per_category(right, lambda labels: compare(to_string(left), labels))
+    return compare(_string_column(left), _string_column(right))
+
+
+def _objects(value):
+    return value.to_numpy(dtype=object) if _is_column(value) else np.array(value, dtype=object)
+
+
+def _constant(convert, node):
+    if node[0] != "literal":
+        raise ExpressionError("The date picture must be a string literal")
+    value = convert(node[1])
+    return lambda _: value
+
+
+@dataclass(frozen=True)
+class Expression:
+    """A parsed expression and its two compiled forms."""
+    source: str
+    tree: tuple
+    row: Callable
+    column: Callable
+
+    @property
+    def fields(self):
+        """Record fields the expression reads."""
+        found = set()
+
+        def walk(node):
+            if node[0] == "var":
+                found.add(node[1])
+            for child in node[1:]:
+                if isinstance(child, tuple) and child and isinstance(child[0], str):
+                    walk(child)
+                elif isinstance(child, tuple):
+                    for item in child:
+                        walk(item)
+        walk(self.tree)
+        return frozenset(found)
+
+
+def compile_expression(source):
+    """Parse ``source`` once and compile it for rows and for columns."""
+    tree = _Parser(source).parse()
+    return Expression(source=source, tree=tree, row=_compile_row(tree), column=_compile_column(tree))
+
+
+# --- Mappings ---------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Mapping:
+    """Target fields, each computed by an expression over the source record."""
+    targets: tuple  # ((target, Expression), ...)
+
+    def map_records(self, records):
+        """Row-by-row: one output dict per input record."""
+        targets = self.targets
+        return [{target: expression.row(record) for target, expression in targets} for record in records]
+
+    def map_frame(self, frame):
+        """Column-wise: the whole batch in one pass per target field."""
+        columns = {}
+        for target, expression in self.targets:
+            value = expression.column(frame)
+            columns[target] = value if _is_column(value) else pd.Series([value] * len(frame), index=frame.index)
+        return pd.DataFrame(columns, index=frame.index)
+
+
+_MAPPING_LINE = re.compile(r"^\s*([A-Za-z_][\w-]*)\s*=(?!=)\s*(.+?)\s*$")
+
+
+def compile_mapping(text):
+    """Compile ``target = expression`` lines; ``//`` lines and blanks are skipped."""
+    targets = []
+    for number, line in enumerate(text.splitlines(), start=1):
+        if not line.strip() or line.lstrip().startswith("//"):
+            continue
+        match = _MAPPING_LINE.match(line)
+        if match is None:
+            raise ExpressionError(f"Line {number}: expected 'target = expression'")
+        try:
+            targets.append((match.group(1), compile_expression(match.group(2))))
+        except ExpressionError as exc:
+            raise ExpressionError(f"Line {number} ({match.group(1)}): {exc}") from None
+    if not targets:
+        raise ExpressionError("No mappings defined")
+    return Mapping(tuple(targets))
+
+
+def flatten(records):
+    """Nested JSON records as a DataFrame with ``parent/child`` columns."""
+    return pd.json_normalize(records, sep=FIELD_SEPARATOR)
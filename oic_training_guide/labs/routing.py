@@ -0,0 +1,282 @@
+"""Endpoint templates for app-driven REST triggers, matched with a trie.
+
+A template is a resource path with ``{name}`` path parameters and an
+optional query part that declares query parameters, with defaults::
+
+    GET /api/orders/{orderId}?includeDetails&format=json
+
+``Router`` compiles its templates into a trie keyed by path segment.
+Literal segments are dict entries and a path parameter is one wildcard
+edge per node. Matching a request walks one node per segment, so its cost
+depends on the depth of the path rather than on how many endpoints exist.
+A literal segment wins over a parameter at the same position
+(``/orders/search`` before ``/orders/{orderId}``); when the literal branch
+dead-ends, matching backtracks to the parameter.
+
+``RegexRouter`` is the naive alternative: one compiled regular expression
+per template, tried in registration order until one matches. It stands as
+the baseline in the lab's benchmark.
+"""
+
+import re
+import time
+from dataclasses import dataclass, field
+from urllib.parse import parse_qsl, urlsplit
+
+import numpy as np
+
+METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE")
+
+_PARAM = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+
+class RouteError(ValueError):
+    """An endpoint template that cannot be registered."""
+
+
+@dataclass(frozen=True)
+class Route:
+    """One endpoint: method, path segments and declared parameters."""
+    method: str
+    template: str
+    segments: tuple  # literal text, or None for a path parameter
+    path_params: tuple  # names, in path order
+    query_defaults: dict  # declared query parameter -> default (None: no default)
+
+
+@dataclass(frozen=True)
+class Match:
+    route: Route
+    path_params: dict
+    query_params: dict
+
+
+def _split(path):
+    return [segment for segment in path.split("/") if segment]
+
+
+def parse_route(line):
+    """A ``Route`` from ``[METHOD] /path/{param}[?name&name=default]``."""
+    method, _, template = line.strip().rpartition(" ")
+    method = method.strip().upper() or "GET"
+    if method not in METHODS:
+        raise RouteError(f"Unknown method {method!r} in {line.strip()!r}")
+    if not template.startswith("/"):
+        raise RouteError(f"A resource path starts with '/': {template!r}")
+    path, _, query = template.partition("?")
+    segments, names = [], []
+    for segment in _split(path):
+        if match := _PARAM.fullmatch(segment):
+            if match[1] in names:
+                raise RouteError(f"Path parameter {{{match[1]}}} appears twice in {template!r}")
+            names.append(match[1])
+            segments.append(None)
+        elif "{" in segment or "}" in segment:
+            raise RouteError(f"A path parameter must be a whole segment: {segment!r} in {template!r}")
+        else:
+            segments.append(segment)
+    defaults = {}
+    for part in filter(None, query.split("&")):
+        name, has_default, default = part.partition("=")
+        defaults[name] = default if has_default else None
+    return Route(method, template, tuple(segments), tuple(names), defaults)
+
+
+def parse_routes(text):
+    """Routes from one template per line; blank and ``//`` lines are skipped."""
+    routes = []
+    for number, line in enumerate(text.splitlines(), start=1):
+        if not line.strip() or line.strip().startswith("//"):
+            continue
+        try:
+            routes.append(parse_route(line))
+        except RouteError as exc:
+            raise RouteError(f"Line {number}: {exc}") from None
+    return routes
+
+
+def _query(route, query):
+    params = {name: default for name, default in route.query_defaults.items() if default is not None}
+    params.update(parse_qsl(query, keep_blank_values=True))
+    return params
+
+
+class _Node:
+    __slots__ = ("literals", "param", "routes")
+
+    def __init__(self):
+        self.literals = {}
+        self.param = None
+        self.routes = {}  # method -> Route ending here
+
+
+class Router:
+    """Routes compiled into a segment trie."""
+
+    def __init__(self, routes=()):
+        self._root = _Node()
+        self.nodes = 1
+        self.routes = []
+        for route in routes:
+            self.add(route)
+
+    def add(self, route):
+        node = self._root
+        for segment in route.segments:
+            if segment is None:
+                if node.param is None:
+                    node.param = _Node()
+                    self.nodes += 1
+                node = node.param
+            else:
+                child = node.literals.get(segment)
+                if child is None:
+                    child = node.literals[segment] = _Node()
+                    self.nodes += 1
+                node = child
+        if route.method in node.routes:
+            raise RouteError(f"{route.template} clashes with {node.routes[route.method].template} ({route.method})")
+        node.routes[route.method] = route
+        self.routes.append(route)
+
+    def _walk(self, node, segments, i, method, values):
+        if i == len(segments):
+            return node.routes.get(method)
+        child = node.literals.get(segments[i])
+        if child is not None:
+            route = self._walk(child, segments, i + 1, method, values)
+            if route is not None:
+                return route
+        if node.param is not None:
+            values.append(segments[i])
+            route = self._walk(node.param, segments, i + 1, method, values)
+            if route is not None:
+                return route
+            values.pop()
+        return None
+
+    def match(self, method, url):
+        """The ``Match`` for a request, or ``None``."""
+        parts = urlsplit(url)
+        values = []
+        route = self._walk(self._root, _split(parts.path), 0, method, values)
+        if route is None:
+            return None
+        return Match(route, dict(zip(route.path_params, values)), _query(route, parts.query))
+
+
+class RegexRouter:
+    """One regular expression per route, tried in order."""
+
+    def __init__(self, routes=()):
+        self.routes = []
+        for route in routes:
+            self.add(route)
+
+    def add(self, route):
+        pattern = "".join(
+            "/" + (f"(?P<{name}>[^/]+)" if segment is None else re.escape(segment))
+            for segment, name in zip(route.segments, self._names(route))
+        )
+        self.routes.append((route, re.compile(pattern or "/")))
+
+    @staticmethod
+    def _names(route):
+        names = iter(route.path_params)
+        return [next(names) if segment is None else None for segment in route.segments]
+
+    def match(self, method, url):
+        parts = urlsplit(url)
+        path = "/" + "/".join(_split(parts.path))
+        for route, pattern in self.routes:
+            if route.method == method and (found := pattern.fullmatch(path)):
+                return Match(route, found.groupdict(), _query(route, parts.query))
+        return None
+
+
+# --- Generated endpoint sets for the benchmark -----------------------------------
+
+_SERVICES = ("orders", "billing", "catalog", "crm", "hr", "inventory", "payments", "shipping")
+_RESOURCES = (
+    "accounts", "addresses", "contacts", "contracts", "customers", "employees", "invoices", "items",
+    "leads", "lines", "notes", "orders", "payments", "products", "quotes", "returns", "shipments",
+    "suppliers", "tickets", "warehouses",
+)
+
+
+def _singular(resource):
+    return resource.removesuffix("es") if resource.endswith(("sses", "ches")) else resource.removesuffix("s")
+
+
+def generate_routes(count):
+    """``count`` distinct routes shaped like a real API catalogue."""
+    routes = []
+    for version in range(1, 1_000):
+        for service in _SERVICES:
+            for resource in _RESOURCES:
+                base = f"/{service}/v{version}/{resource}"
+                item = f"{base}/{{{_singular(resource)}Id}}"
+                sub = _RESOURCES[(_RESOURCES.index(resource) + version) % len(_RESOURCES)]
+                for line in (
+                    f"GET {base}?limit=25&offset=0",
+                    f"POST {base}",
+                    f"GET {item}",
+                    f"GET {item}/{sub}",
+                    f"GET {item}/{sub}/{{{_singular(sub)}Id}}",
+                ):
+                    routes.append(parse_route(line))
+                    if len(routes) == count:
+                        return routes
+    return routes
+
+
+def sample_requests(routes, count, seed=5, miss_share=0.05):
+    """``(method, url)`` requests for random routes, with a share that match nothing."""
+    rng = np.random.default_rng(seed)
+    picks = rng.integers(len(routes), size=count).tolist()
+    misses = (rng.random(count) < miss_share).tolist()
+    ids = rng.integers(1, 1_000_000, size=count).tolist()
+    requests = []
+    for pick, miss, number in zip(picks, misses, ids):
+        route = routes[pick]
+        segments = [f"ID-{number}" if segment is None else segment for segment in route.segments]
+        if miss:
+            segments[0] = "legacy"
+        query = "?limit=10" if route.query_defaults else ""
+        requests.append((route.method, "/" + "/".join(segments) + query))
+    return requests
+
+
+@dataclass
+class RouterTiming:
+    name: str
+    build_ms: float
+    match_ms: float
+    requests: int
+    matched: int
+    results: list = field(default_factory=list, repr=False)
+
+    @property
+    def per_request_us(self):
+        return self.match_ms * 1000 / self.requests if self.requests else 0.0
+
+    @property
+    def throughput(self):
+        return self.requests / (self.match_ms / 1000) if self.match_ms else 0.0
+
+
+def time_router(name, factory, routes, requests):
+    """Build a router from ``routes`` and match every request with it."""
+    started = time.perf_counter()
+    router = factory(routes)
+    built = time.perf_counter()
+    results = [router.match(method, url) for method, url in requests]
+    finished = time.perf_counter()
+    return RouterTiming(
+        name,
+        build_ms=(built - started) * 1000,
+        match_ms=(finished - built) * 1000,
+        requests=len(requests),
+        matched=sum(result is not None for result in results),
+        results=results,
+    )
@@ -0,0 +1,157 @@
+"""Scheduled Run Simulator: one run of the Day 3 scheduled integration.
+
+The schedule parameters drive ``labs.batching.run_schedule``: records for
+``sourceSystem`` and ``processDate`` are pulled in ``batchSize`` chunks and
+processed on a thread or process pool. The lab shows the tracking
+variables at the end of the run, per-batch latency, and how batch size and
+worker count trade throughput against the memory held in flight.
+"""
+
+import json
+import math
+from dataclasses import replace
+from datetime import date
+
+import pandas as pd
+import streamlit as st
+
+from labs.batching import ScheduleParameters, run_schedule
+
+RECORD_COUNTS = (10_000, 50_000, 200_000)
+
+# Batch sizes compared by the sweep, at the chosen worker count and at one
+# worker. Every combination waits on the target once per batch, so the sweep
+# runs fewer records than a single run may.
+SWEEP_BATCH_SIZES = (100, 1_000, 5_000)
+SWEEP_RECORDS = 10_000
+
+EXECUTORS = {"Threads": "thread", "Processes": "process"}
+
+# The target call is a real sleep, so a run waits at least batches x latency
+# / workers. Runs and sweeps that would wait longer than this are refused.
+MAX_WAIT_SECONDS = 30
+
+
+def expected_wait(batch_size, total, workers, call_latency_ms):
+    """Seconds a run spends waiting on the target, at best."""
+    return math.ceil(total / batch_size) * call_latency_ms / 1000 / workers
+
+
+def sweep_wait(workers, call_latency_ms, total=SWEEP_RECORDS):
+    """``expected_wait`` summed over every run of ``sweep``."""
+    return sum(
+        expected_wait(batch_size, total, pool_size, call_latency_ms)
+        for pool_size in sorted({1, workers})
+        for batch_size in SWEEP_BATCH_SIZES
+    )
+
+
+def _kb(size):
+    return f"{size / 1024:,.0f} KB"
+
+
+def sweep(parameters, workers, executor, call_latency_ms, total=SWEEP_RECORDS):
+    """Throughput and in-flight memory for each ``SWEEP_BATCH_SIZES`` entry."""
+    rows = []
+    for pool_size in sorted({1, workers}):
+        for batch_size in SWEEP_BATCH_SIZES:
+            report = run_schedule(
+                replace(parameters, batchSize=batch_size), total, pool_size, executor, call_latency_ms
+            )
+            rows.append({
+                "Workers": pool_size,
+                "batchSize": batch_size,
+                "Records/s": round(report.throughput),
+                "p95 batch (ms)": round(report.latency_percentiles()["p95_ms"], 1),
+                "In flight": _kb(report.peak_memory_bytes),
+            })
+    return pd.DataFrame(rows)
+
+
+def _show_run(report):
+    cols = st.columns(4)
+    cols[0].metric("recordCount", f"{report.tracking['recordCount']:,}")
+    cols[1].metric("Throughput", f"{report.throughput:,.0f}/s")
+    cols[2].metric(
+        "Run", f"{report.seconds:.2f} s", help=f"Starting the pool took {report.startup_seconds:.2f} s more"
+    )
+    cols[3].metric(
+        "Peak in flight", _kb(report.peak_memory_bytes),
+        help=f"{report.peak_in_flight} batches of {_kb(report.batch_bytes)} each",
+    )
+    left, right = st.columns([1, 2])
+    left.markdown("**Tracking variables**")
+    left.code(json.dumps(report.tracking, indent=2), language="json")
+    right.markdown("**Batch latency (ms)**")
+    right.line_chart(
+        pd.DataFrame(
+            {"Queued": [b.queued_ms for b in report.batches], "Processing": [b.processing_ms for b in report.batches]}
+        ),
+        height=220,
+    )
+    percentiles = report.latency_percentiles()
+    right.caption(" · ".join(f"{name.removesuffix('_ms')} {value:.1f} ms" for name, value in percentiles.items()))
+
+
+@st.fragment
+def render():
+    """Draw the Scheduled Run Simulator; its widgets rerun only the lab."""
+    st.markdown("#### ⏱️ Scheduled Run Simulator")
+    st.caption(
+        "Set the schedule parameters and run. Records are pulled from the source in batchSize "
+        "chunks and mapped on a worker pool; each batch then waits for the target call."
+    )
+    cols = st.columns(4)
+    batch_size = cols[0].number_input(
+        "batchSize", min_value=10, max_value=100_000, value=100, step=100, key="lab_scheduled_batch"
+    )
+    source_system = cols[1].text_input("sourceSystem", "ERP", key="lab_scheduled_source")
+    target_system = cols[2].text_input("targetSystem", "CRM", key="lab_scheduled_target")
+    process_date = cols[3].date_input("processDate", date(2024, 1, 1), key="lab_scheduled_date")
+    cols = st.columns(4)
+    total = cols[0].select_slider(
+        "Records", RECORD_COUNTS, value=50_000, format_func="{:,}".format, key="lab_scheduled_count"
+    )
+    executor = cols[1].radio(
+        "Pool", tuple(EXECUTORS), horizontal=True, key="lab_scheduled_pool",
+        help="Threads overlap waiting on the target; processes also run the mapping in parallel.",
+    )
+    workers = cols[2].slider("Workers", 1, 16, 4, key="lab_scheduled_workers")
+    latency = cols[3].slider("Target call (ms)", 0, 200, 20, step=5, key="lab_scheduled_latency")
+
+    parameters = ScheduleParameters(
+        int(batch_size), source_system or "ERP", target_system or "CRM", process_date.isoformat()
+    )
+    left, right = st.columns(2)
+    run = left.button("▶️ Run schedule", key="lab_scheduled_run")
+    compare = right.button(
+        "📊 Compare batch sizes", key="lab_scheduled_sweep",
+        help=(
+            f"Runs {SWEEP_RECORDS:,} records with batchSize {', '.join(map(str, SWEEP_BATCH_SIZES))}, "
+            f"on 1 and {workers} workers."
+        ),
+    )
+    if run:
+        wait = expected_wait(parameters.batchSize, total, workers, latency)
+        if wait > MAX_WAIT_SECONDS:
+            st.error(
+                f"❌ {math.ceil(total / parameters.batchSize):,} batches × {latency} ms on {workers} worker{'s' if workers > 1 else ''} "
+                f"would wait {wait:,.0f} s on the target; the lab allows {MAX_WAIT_SECONDS} s. "
+                "Raise batchSize or workers, or lower the records or target call."
+            )
+            return
+        with st.spinner("Running…"):
+            report = run_schedule(parameters, total, workers, EXECUTORS[executor], latency)
+        _show_run(report)
+    elif compare:
+        wait = sweep_wait(workers, latency)
+        if wait > MAX_WAIT_SECONDS:
+            st.error(
+                f"❌ The comparison would wait {wait:,.0f} s on the target; the lab allows {MAX_WAIT_SECONDS} s. "
+                "Lower the target call."
+            )
+            return
+        with st.spinner("Running every batch size…"):
+            table = sweep(parameters, workers, EXECUTORS[executor], latency)
+        st.dataframe(table, hide_index=True)
+        st.caption("Larger batches amortize the target call but hold more records in memory per worker.")
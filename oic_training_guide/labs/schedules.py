@@ -0,0 +1,279 @@
+"""Schedules, missed fire times and bounded-concurrency backfill.
+
+``parse_schedule`` reads a five-field cron expression (``0 2 * * *``) or
+one of the phrases used in the guide (``Daily at 2:00 AM``, ``Hourly``,
+``Every 15 minutes``) into a ``CronSchedule``. ``CronSchedule.fires`` lists
+fire times day by day from the allowed hours and minutes, so finding the
+runs missed since a watermark costs one step per matching day rather than
+one per minute.
+
+``simulate_backfill`` replays the missed runs after downtime, oldest first.
+Each run gets its own parameters (``processDate`` from its fire time), and
+at most ``concurrency`` runs are active at once. Runs that come due during
+the catch-up join the back of the queue. The model is a discrete-event
+simulation, so weeks of backlog are replayed instantly:
+
+* every run spends ``startup_s`` starting, then transfers its records at up
+  to ``run_rate`` records/s;
+* the target accepts ``target_rate`` records/s in total, shared by the runs
+  transferring at that moment.
+
+Because of that shared limit, adding concurrency stops shortening the
+catch-up once the target is saturated. The watermark (the latest fire time
+with every earlier run done) only advances over a contiguous prefix of
+finished runs.
+"""
+
+import heapq
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+_FIELDS = (
+    # name, low, high
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day of month", 1, 31),
+    ("month", 1, 12),
+    ("day of week", 0, 7),
+)
+_NAMES = {
+    "month": {name: n for n, name in enumerate(
+        ("JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"), start=1
+    )},
+    "day of week": {name: n for n, name in enumerate(("SUN", "MON", "TUE", "WED", "THU", "FRI", "SAT"))},
+}
+
+_DAILY = re.compile(r"daily at (\d{1,2}):(\d{2})\s*([ap]\.?m\.?)?", re.IGNORECASE)
+_EVERY = re.compile(r"every (\d+) (minute|hour)s?", re.IGNORECASE)
+
+# Replays stop after this much simulated time if the runs never catch up.
+MAX_CATCH_UP = timedelta(days=60)
+
+
+class ScheduleError(ValueError):
+    """A schedule that cannot be parsed."""
+
+
+def _value(text, name, low, high):
+    number = _NAMES.get(name, {}).get(text.upper())
+    if number is None:
+        if not text.isdigit():
+            raise ScheduleError(f"Bad {name} value {text!r}")
+        number = int(text)
+    if not low <= number <= high:
+        raise ScheduleError(f"{name.capitalize()} {number} is outside {low}-{high}")
+    return number
+
+
+def _parse_field(text, name, low, high):
+    """The set of values a cron field allows: ``*``, ``a-b``, ``a,b``, ``*/n``, ``a-b/n``."""
+    values = set()
+    for part in text.split(","):
+        spec, _, step = part.partition("/")
+        if step and not (step.isdigit() and int(step) > 0):
+            raise ScheduleError(f"Bad step {step!r} in the {name} field")
+        if spec == "*":
+            first, last = low, high
+        elif "-" in spec:
+            first, last = (_value(end, name, low, high) for end in spec.split("-", 1))
+        else:
+            first = last = _value(spec, name, low, high)
+            if step:
+                last = high
+        if first > last:
+            raise ScheduleError(f"Empty range {spec!r} in the {name} field")
+        values.update(range(first, last + 1, int(step or 1)))
+    return frozenset(values)
+
+
+@dataclass(frozen=True)
+class CronSchedule:
+    """The fire times of a five-field cron expression."""
+    expression: str
+    minutes: tuple
+    hours: tuple
+    days: frozenset
+    months: frozenset
+    weekdays: frozenset  # 0 = Sunday
+    any_day: bool  # day of month is ``*``
+    any_weekday: bool  # day of week is ``*``
+
+    def runs_on(self, day):
+        if day.month not in self.months:
+            return False
+        by_date = day.day in self.days
+        by_weekday = (day.weekday() + 1) % 7 in self.weekdays
+        # cron: when both day fields are restricted, either one may match.
+        if self.any_day or self.any_weekday:
+            return by_date and by_weekday
+        return by_date or by_weekday
+
+    def fires(self, after, until=None):
+        """Fire times ``after < t <= until`` in order (endless without ``until``)."""
+        day = after.replace(hour=0, minute=0, second=0, microsecond=0)
+        while until is None or day <= until:
+            if self.runs_on(day):
+                for hour in self.hours:
+                    for minute in self.minutes:
+                        fire = day.replace(hour=hour, minute=minute)
+                        if until is not None and fire > until:
+                            return
+                        if fire > after:
+                            yield fire
+            day += timedelta(days=1)
+
+
+def parse_cron(expression):
+    """Compile ``minute hour day-of-month month day-of-week``."""
+    parts = expression.split()
+    if len(parts) != 5:
+        raise ScheduleError(f"A cron expression has 5 fields, got {len(parts)}: {expression!r}")
+    minutes, hours, days, months, weekdays = (
+        _parse_field(text, *spec) for text, spec in zip(parts, _FIELDS)
+    )
+    weekdays = frozenset(day % 7 for day in weekdays)  # 7 is Sunday too
+    return CronSchedule(
+        expression, tuple(sorted(minutes)), tuple(sorted(hours)), days, months, weekdays,
+        any_day=parts[2] == "*", any_weekday=parts[4] == "*",
+    )
+
+
+def parse_schedule(text):
+    """A ``CronSchedule`` from cron syntax or ``Daily at 2:00 AM`` / ``Hourly`` / ``Every 15 minutes``."""
+    text = text.strip()
+    if text.lower() == "hourly":
+        return parse_cron("0 * * * *")
+    if match := _DAILY.fullmatch(text):
+        hour, minute, meridiem = int(match[1]), int(match[2]), (match[3] or "").lower()
+        if meridiem:
+            if not 1 <= hour <= 12:
+                raise ScheduleError(f"Bad hour {hour} in {text!r}")
+            hour = hour % 12 + (12 if meridiem.startswith("p") else 0)
+        return parse_cron(f"{minute} {hour} * * *")
+    if match := _EVERY.fullmatch(text):
+        count, unit = int(match[1]), match[2].lower()
+        if not 0 < count < (60 if unit == "minute" else 24):
+            raise ScheduleError(f"Every {count} {unit}s isn't a single cron step; write the cron expression")
+        return parse_cron(f"*/{count} * * * *" if unit == "minute" else f"0 */{count} * * *")
+    return parse_cron(text)
+
+
+def missed_runs(schedule, watermark, now):
+    """Fire times after the watermark up to ``now``: the runs downtime skipped."""
+    return list(schedule.fires(watermark, now))
+
+
+@dataclass(frozen=True)
+class RunCost:
+    """What one run costs: startup, then its records through a shared target."""
+    records: int = 200_000
+    weekend_share: float = 0.3  # weekend runs carry this share of the records
+    startup_s: float = 30.0
+    run_rate: float = 500.0  # records/s for one run on its own
+    target_rate: float = 2_000.0  # records/s the target takes from all runs together
+
+    def records_for(self, fire):
+        return round(self.records * (self.weekend_share if fire.weekday() >= 5 else 1))
+
+
+def run_parameters(fire):
+    """The schedule parameters one replayed run is started with."""
+    return {"processDate": fire.date().isoformat(), "scheduledTime": fire.isoformat(timespec="minutes")}
+
+
+@dataclass(frozen=True)
+class ReplayedRun:
+    fire: datetime
+    parameters: dict
+    started: datetime
+    finished: datetime
+
+
+@dataclass
+class Backfill:
+    """Outcome of replaying a backlog at one concurrency limit."""
+    concurrency: int
+    now: datetime
+    missed: int
+    runs: list = field(default_factory=list)  # ReplayedRun, in completion order
+    caught_up_at: datetime = None  # None: still behind after MAX_CATCH_UP
+    watermarks: list = field(default_factory=list)  # (time, watermark) each time it advances
+    peak_active: int = 0
+
+    @property
+    def caught_up(self):
+        return self.caught_up_at is not None
+
+    @property
+    def catch_up(self):
+        """Time from the end of the downtime until no run is overdue."""
+        return (self.caught_up_at or self.now + MAX_CATCH_UP) - self.now
+
+
+class _Active:
+    __slots__ = ("fire", "started", "startup_until", "remaining")
+
+    def __init__(self, fire, started, startup_until, remaining):
+        self.fire, self.started, self.startup_until, self.remaining = fire, started, startup_until, remaining
+
+
+def simulate_backfill(schedule, watermark, now, concurrency, cost=RunCost()):
+    """Replay the runs missed between ``watermark`` and ``now``, ``concurrency`` at a time."""
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    missed = missed_runs(schedule, watermark, now)
+    queue = deque(missed)
+    upcoming = schedule.fires(now, now + MAX_CATCH_UP)
+    next_fire = next(upcoming, None)
+    result = Backfill(concurrency, now, len(missed))
+    # Fire times not yet finished, to find how far the watermark can move.
+    outstanding = list(missed)
+    heapq.heapify(outstanding)
+    finished = set()
+    active = []
+    t = 0.0  # seconds since ``now``
+    deadline = MAX_CATCH_UP.total_seconds()
+
+    def at(seconds):
+        return now + timedelta(seconds=seconds)
+
+    while t <= deadline:
+        while queue and len(active) < concurrency:
+            fire = queue.popleft()
+            active.append(_Active(fire, t, t + cost.startup_s, cost.records_for(fire)))
+        result.peak_active = max(result.peak_active, len(active))
+        if not active:
+            result.caught_up_at = at(t)
+            break
+        transferring = [run for run in active if run.startup_until <= t]
+        rate = min(cost.run_rate, cost.target_rate / len(transferring)) if transferring else 0.0
+        steps = [run.startup_until - t for run in active if run.startup_until > t]
+        steps += [run.remaining / rate for run in transferring]
+        if next_fire is not None:
+            steps.append((next_fire - now).total_seconds() - t)
+        step = max(min(steps), 0.0)
+        t += step
+        for run in transferring:
+            run.remaining -= rate * step
+        if next_fire is not None and t >= (next_fire - now).total_seconds() - 1e-6:
+            queue.append(next_fire)
+            heapq.heappush(outstanding, next_fire)
+            next_fire = next(upcoming, None)
+        done = [run for run in active if run.startup_until <= t and run.remaining <= 1e-6]
+        for run in done:
+            active.remove(run)
+            result.runs.append(ReplayedRun(run.fire, run_parameters(run.fire), at(run.started), at(t)))
+            finished.add(run.fire)
+        mark = None
+        while outstanding and outstanding[0] in finished:
+            mark = heapq.heappop(outstanding)
+        if mark is not None:
+            result.watermarks.append((at(t), mark))
+    return result
+
+
+def compare_concurrency(schedule, watermark, now, levels, cost=RunCost()):
+    """``simulate_backfill`` at each concurrency in ``levels``."""
+    return [simulate_backfill(schedule, watermark, now, level, cost) for level in levels]
@@ -0,0 +1,143 @@
+"""Switch Simulator: route bulk orders through the Day 6 Switch action.
+
+The cases are compiled by ``labs.decision_table`` and every applicable
+strategy routes the same orders: the decision table (one binary search per
+order), condition masks (each case over the whole batch) and case by case
+(one record at a time, as the flow evaluates it). The lab reports how many
+orders took each branch and the throughput of each strategy.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from labs.decision_table import compile_switch
+from labs.expressions import ExpressionError
+
+DEFAULT_CASES = pd.DataFrame({
+    "Condition": ["$orderAmount > 10000", "$orderAmount > 1000"],
+    "Route": ["HighValueOrderHandler", "StandardOrderHandler"],
+})
+DEFAULT_OTHERWISE = "BasicOrderHandler"
+
+ORDER_VOLUMES = (10_000, 100_000, 1_000_000, 5_000_000)
+
+# Case-by-case routing runs in Python; beyond this it only adds waiting.
+CASE_BY_CASE_LIMIT = 100_000
+
+_REGIONS = ("NA", "EMEA", "APAC", "LATAM")
+_CHANNELS = ("WEB", "EDI", "STORE")
+
+
+def order_volume(count, seed=6):
+    """``count`` orders with a long-tailed ``orderAmount`` (median about 800)."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "orderId": np.arange(1, count + 1),
+        "orderAmount": np.round(rng.lognormal(mean=6.7, sigma=1.4, size=count), 2),
+        "quantity": rng.integers(1, 50, size=count),
+        "region": pd.Categorical.from_codes(rng.integers(len(_REGIONS), size=count), _REGIONS),
+        "channel": pd.Categorical.from_codes(rng.integers(len(_CHANNELS), size=count), _CHANNELS),
+    })
+
+
+def _text(value):
+    # Empty data_editor cells are None (or NaN once the column is numeric).
+    return value.strip() if isinstance(value, str) else ""
+
+
+def _timed(route, orders):
+    started = time.perf_counter()
+    codes = route(orders)
+    return codes, time.perf_counter() - started
+
+
+def run_strategies(switch, orders):
+    """Route ``orders`` with every applicable strategy; return ``(rows, codes)``.
+
+    ``codes`` are from the first (fastest) strategy. Each row's ``Mismatches``
+    counts the orders a strategy routed differently from it.
+    """
+    strategies = []
+    if switch.table is not None:
+        strategies.append(("Decision table (binary search)", switch.route_table, orders))
+    strategies.append(("Condition masks", switch.route_masks, orders))
+    sample = orders.iloc[:CASE_BY_CASE_LIMIT]
+    strategies.append(("Case by case", lambda frame: switch.route_records(frame.to_dict("records")), sample))
+    rows = []
+    codes = None
+    for name, route, frame in strategies:
+        result, seconds = _timed(route, frame)
+        if codes is None:
+            codes = result
+        rows.append({
+            "Strategy": name,
+            "Orders": len(frame),
+            "Time (ms)": round(seconds * 1000, 1),
+            "Orders/s": round(len(frame) / seconds) if seconds else None,
+            "Mismatches": int(np.count_nonzero(result != codes[:len(result)])),
+        })
+    return rows, codes
+
+
+@st.fragment
+def render():
+    """Draw the Switch Simulator; its widgets rerun only the lab."""
+    st.markdown("#### 🔀 Switch Simulator")
+    st.caption(
+        "Cases are tested in order and the first match wins. Conditions use the mapper's "
+        "expression syntax over the order fields: orderAmount, quantity, region, channel."
+    )
+    cases = st.data_editor(
+        DEFAULT_CASES, num_rows="dynamic", hide_index=True, key="lab_switch_cases"
+    )
+    left, right = st.columns(2)
+    otherwise = left.text_input("Otherwise route", DEFAULT_OTHERWISE, key="lab_switch_otherwise")
+    count = right.select_slider(
+        "Orders", ORDER_VOLUMES, value=1_000_000, format_func="{:,}".format, key="lab_switch_count"
+    )
+    if not st.button("▶️ Route orders", key="lab_switch_run"):
+        return
+
+    rows = [
+        (condition.strip(), _text(route) or f"Case {n}")
+        for n, (condition, route) in enumerate(zip(cases["Condition"], cases["Route"]), start=1)
+        if _text(condition)
+    ]
+    try:
+        switch = compile_switch(rows, otherwise.strip() or "Otherwise")
+    except ExpressionError as exc:
+        st.error(f"❌ {exc}")
+        return
+    try:
+        with st.spinner("Routing…"):
+            orders = order_volume(count)
+            timings, codes = run_strategies(switch, orders)
+    except (TypeError, ValueError) as exc:
+        st.error(f"❌ Could not route the orders: {exc}")
+        return
+
+    if switch.table is None:
+        st.info("These cases aren't all thresholds on one field, so there is no decision table; masks are used.")
+    else:
+        st.markdown(f"**Decision table** on `{switch.table.field}`")
+        st.dataframe(
+            pd.DataFrame(
+                [(interval, switch.routes[code]) for interval, code in switch.table.intervals()],
+                columns=["Range", "Route"],
+            ),
+            hide_index=True,
+        )
+    counts = np.bincount(codes, minlength=len(switch.routes))
+    branches = pd.DataFrame({"Route": switch.routes, "Orders": counts})
+    branches["Share"] = (branches["Orders"] / max(len(codes), 1)).map("{:.1%}".format)
+    left, right = st.columns(2)
+    left.markdown("**Branches**")
+    left.dataframe(branches, hide_index=True)
+    right.markdown("**Throughput**")
+    right.dataframe(pd.DataFrame(timings), hide_index=True)
+    mismatched = [row["Strategy"] for row in timings if row["Mismatches"]]
+    if mismatched:
+        st.error(f"❌ {', '.join(mismatched)} routed some orders differently from {timings[0]['Strategy']}.")
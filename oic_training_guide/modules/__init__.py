@@ -1,15 +1,13 @@
-"""Modules package for OIC Training Guide."""
-
-from . import (
-    module_1_getting_started,
-    module_2_core_concepts,
-    module_3_management,
-    module_4_advanced,
-    module_5_file_ops,
-    module_6_database,
-    module_7_web_services,
-    module_8_enterprise
-)
+"""Modules package for OIC Training Guide.
+
+Each module file declares its page as data (a ``utils.content.Module`` named
+``MODULE``). Module files are imported lazily: nothing below ``modules`` is
+loaded until a page actually needs it, so starting the app only pays for the
+Home page.
+"""
+
+import importlib
+from functools import partial
 
 __all__ = [
     'module_1_getting_started',
@@ -21,3 +19,32 @@ __all__ = [
     'module_7_web_services',
     'module_8_enterprise'
 ]
+
+
+def _render(name, **options):
+    # Imported here so that loading the package stays free of Streamlit.
+    from utils.content import get_module
+    from utils.profiling import timed
+    from utils.reload import watch_module
+    from utils.renderer import render_module
+
+    watch_module(name)
+    with timed(f"modules.{name}"):
+        render_module(get_module(name), **options)
+
+
+def load_render(name):
+    """Return a function rendering ``modules.<name>``.
+
+    The module is imported and compiled the first time the function runs;
+    afterwards every session replays the same compiled content. Keyword
+    arguments are passed on to ``utils.renderer.render_module``.
+    """
+    return partial(_render, name)
+
+
+def __getattr__(name):
+    # Keep ``from modules import module_x`` working without eager imports.
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,92 +1,81 @@
 """Module 8: Enterprise Patterns"""
 
-import streamlit as st
-import sys
-from pathlib import Path
+from utils.content import (
+    Callout,
+    Code,
+    Columns,
+    Day,
+    Diagram,
+    Exercise,
+    KeyPoints,
+    Markdown,
+    Module,
+    Section,
+    Video,
+)
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.helpers import *
-from utils.diagrams import *
+MODULE = Module(
+    number=8,
+    title="Enterprise Patterns",
+    heading="Module 8: Enterprise Patterns",
+    subtitle="Days 24-26 | Advanced enterprise integration patterns",
+    duration="~6 hours",
+    topics=[
+        "FBDI (File-Based Data Import)",
+        "Bulk data loading",
+        "Callback integrations",
+        "BIP reports integration",
+    ],
+    days=[
+        Day(24, "Deep Dive into Purchase Order FBDI", [
+            Markdown("""
+                ### What is FBDI?
 
-def render():
-    """Render Module 8 content."""
-    
-    render_header(
-        "Module 8: Enterprise Patterns",
-        "Days 24-26 | Advanced enterprise integration patterns"
-    )
-    
-    render_module_info(
-        module_num=8,
-        title="Enterprise Patterns",
-        duration="~6 hours",
-        topics=[
-            "FBDI (File-Based Data Import)",
-            "Bulk data loading",
-            "Callback integrations",
-            "BIP reports integration"
-        ]
-    )
-    
-    # Day 24
-    st.markdown("## 📅 Day 24: Deep Dive into Purchase Order FBDI")
-    
-    st.markdown("""
-    ### What is FBDI?
-    
-    **File-Based Data Import (FBDI)** is Oracle Fusion's mechanism for bulk data loading:
-    
-    **Key Characteristics:**
-    - CSV file-based import
-    - Handles large data volumes
-    - Asynchronous processing
-    - Validation and error reporting
-    - Supports all Fusion modules
-    """)
-    
-    st.markdown("```mermaid\n" + fbdi_pattern() + "\n```")
-    
-    st.markdown("""
-    ### FBDI vs API: When to Use Each
-    """)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
-        **Use FBDI When:**
-        - Loading large volumes (1000+ records)
-        - Initial data migration
-        - Batch processing acceptable
-        - Complex data relationships
-        - Historical data import
-        """)
-    
-    with col2:
-        st.markdown("""
-        **Use API When:**
-        - Real-time processing needed
-        - Small transaction volumes
-        - Immediate validation required
-        - Synchronous response needed
-        - Simple data structures
-        """)
-    
-    st.markdown("""
-    ### FBDI Process Overview
-    
-    **Steps:**
-    1. Generate CSV file with required format
-    2. Create ZIP archive
-    3. Upload to UCM (Universal Content Management)
-    4. Submit ESS (Enterprise Scheduler Service) job
-    5. Monitor job status
-    6. Download error report if needed
-    """)
-    
-    render_code_example(
-        title="Purchase Order FBDI CSV Format",
-        code='''POHeadersInterface.csv:
+                **File-Based Data Import (FBDI)** is Oracle Fusion's mechanism for bulk data loading:
+
+                **Key Characteristics:**
+                - CSV file-based import
+                - Handles large data volumes
+                - Asynchronous processing
+                - Validation and error reporting
+                - Supports all Fusion modules
+            """),
+            Diagram("fbdi_pattern"),
+            Markdown("""
+                ### FBDI vs API: When to Use Each
+            """),
+            Columns([
+                """
+                    **Use FBDI When:**
+                    - Loading large volumes (1000+ records)
+                    - Initial data migration
+                    - Batch processing acceptable
+                    - Complex data relationships
+                    - Historical data import
+                """,
+                """
+                    **Use API When:**
+                    - Real-time processing needed
+                    - Small transaction volumes
+                    - Immediate validation required
+                    - Synchronous response needed
+                    - Simple data structures
+                """,
+            ]),
+            Markdown("""
+                ### FBDI Process Overview
+
+                **Steps:**
+                1. Generate CSV file with required format
+                2. Create ZIP archive
+                3. Upload to UCM (Universal Content Management)
+                4. Submit ESS (Enterprise Scheduler Service) job
+                5. Monitor job status
+                6. Download error report if needed
+            """),
+            Code(
+                title="Purchase Order FBDI CSV Format",
+                code='''POHeadersInterface.csv:
 INTERFACE_HEADER_KEY,ACTION,BATCH_ID,DOCUMENT_NUM,CURRENCY_CODE,BUYER_ID,VENDOR_ID,VENDOR_SITE_ID
 1,ORIGINAL,BATCH001,PO-001,USD,100010004471139,300000047414679,300000047414680
 
@@ -99,33 +88,27 @@ PODistributionsInterface.csv:
 INTERFACE_DISTRIBUTION_KEY,INTERFACE_LINE_KEY,DISTRIBUTION_NUM,QUANTITY,CHARGE_ACCOUNT_ID
 1,1,1,10,300000047414681
 2,2,1,10,300000047414681''',
-        language="csv"
-    )
-    
-    st.markdown("---")
-    
-    # Day 25
-    st.markdown("## 📅 Day 25: Bulk Load Purchase Orders Using FBDI")
-    
-    st.markdown("""
-    ### Complete FBDI Integration
-    
-    **Integration Components:**
-    """)
-    
-    render_key_points([
-        "**Data Transformation**: Convert source data to FBDI CSV format",
-        "**File Generation**: Create CSV files for headers, lines, distributions",
-        "**ZIP Creation**: Package CSV files into ZIP archive",
-        "**UCM Upload**: Upload ZIP to Oracle Content Management",
-        "**ESS Job Submission**: Trigger import job",
-        "**Status Monitoring**: Poll job status until complete",
-        "**Error Handling**: Download and process error reports"
-    ])
-    
-    render_code_example(
-        title="ESS Job Submission",
-        code='''// Submit FBDI Import Job
+                language="csv",
+            ),
+        ]),
+        Day(25, "Bulk Load Purchase Orders Using FBDI", [
+            Markdown("""
+                ### Complete FBDI Integration
+
+                **Integration Components:**
+            """),
+            KeyPoints([
+                "**Data Transformation**: Convert source data to FBDI CSV format",
+                "**File Generation**: Create CSV files for headers, lines, distributions",
+                "**ZIP Creation**: Package CSV files into ZIP archive",
+                "**UCM Upload**: Upload ZIP to Oracle Content Management",
+                "**ESS Job Submission**: Trigger import job",
+                "**Status Monitoring**: Poll job status until complete",
+                "**Error Handling**: Download and process error reports",
+            ]),
+            Code(
+                title="ESS Job Submission",
+                code='''// Submit FBDI Import Job
 Job Name: oracle/apps/ess/projects/po/import/ImportPurchaseOrders
 Parameters:
   - ImportType: ORIGINAL
@@ -150,45 +133,39 @@ GET /fscmRestApi/resources/11.13.18.05/erpintegrations/{requestId}
   "processedRecords": 100,
   "errorRecords": 0
 }''',
-        language="json"
-    )
-    
-    render_exercise(
-        title="Build FBDI Integration",
-        description="Create end-to-end FBDI integration for Purchase Orders",
-        steps=[
-            "Create scheduled integration",
-            "Read source data (database/file/API)",
-            "Transform to FBDI CSV format",
-            "Generate CSV files for headers, lines, distributions",
-            "Create ZIP archive with all CSV files",
-            "Upload ZIP to UCM",
-            "Submit ESS import job",
-            "Poll job status (with timeout)",
-            "Download error report if job fails",
-            "Send notification with results"
-        ]
-    )
-    
-    st.markdown("---")
-    
-    # Day 26
-    st.markdown("## 📅 Day 26: Callback Integrations & BIP Reports")
-    
-    st.markdown("""
-    ### Callback Integrations
-    
-    **Callback Pattern**: Asynchronous request-response pattern
-    
-    **Use Cases:**
-    - Long-running processes
-    - External system notifications
-    - Event-driven workflows
-    """)
-    
-    render_code_example(
-        title="Callback Pattern Flow",
-        code='''1. Client submits request to OIC
+                language="json",
+            ),
+            Exercise(
+                title="Build FBDI Integration",
+                description="Create end-to-end FBDI integration for Purchase Orders",
+                steps=[
+                    "Create scheduled integration",
+                    "Read source data (database/file/API)",
+                    "Transform to FBDI CSV format",
+                    "Generate CSV files for headers, lines, distributions",
+                    "Create ZIP archive with all CSV files",
+                    "Upload ZIP to UCM",
+                    "Submit ESS import job",
+                    "Poll job status (with timeout)",
+                    "Download error report if job fails",
+                    "Send notification with results",
+                ],
+            ),
+        ]),
+        Day(26, "Callback Integrations & BIP Reports", [
+            Markdown("""
+                ### Callback Integrations
+
+                **Callback Pattern**: Asynchronous request-response pattern
+
+                **Use Cases:**
+                - Long-running processes
+                - External system notifications
+                - Event-driven workflows
+            """),
+            Code(
+                title="Callback Pattern Flow",
+                code='''1. Client submits request to OIC
    POST /api/processOrder
    Response: { "requestId": "REQ-12345", "status": "PROCESSING" }
 
@@ -206,25 +183,23 @@ GET /fscmRestApi/resources/11.13.18.05/erpintegrations/{requestId}
    }
 
 4. Client receives notification and retrieves results''',
-        language="text"
-    )
-    
-    st.markdown("""
-    ### BIP Reports Integration
-    
-    **Business Intelligence Publisher (BIP)** generates reports in Oracle Fusion:
-    
-    **Integration Capabilities:**
-    - Run BIP reports from OIC
-    - Pass parameters to reports
-    - Retrieve report output (PDF, Excel, CSV)
-    - Schedule report generation
-    - Email reports to users
-    """)
-    
-    render_code_example(
-        title="BIP Report Invocation",
-        code='''// Run BIP Report
+                language="text",
+            ),
+            Markdown("""
+                ### BIP Reports Integration
+
+                **Business Intelligence Publisher (BIP)** generates reports in Oracle Fusion:
+
+                **Integration Capabilities:**
+                - Run BIP reports from OIC
+                - Pass parameters to reports
+                - Retrieve report output (PDF, Excel, CSV)
+                - Schedule report generation
+                - Email reports to users
+            """),
+            Code(
+                title="BIP Report Invocation",
+                code='''// Run BIP Report
 POST /xmlpserver/services/ExternalReportWSSService
 
 SOAP Request:
@@ -246,59 +221,57 @@ SOAP Request:
 
 // Response includes base64-encoded PDF
 <reportBytes>JVBERi0xLjQKJeLjz9MKMy...</reportBytes>''',
-        language="xml"
-    )
-    
-    render_best_practice(
-        "For large reports, use asynchronous pattern: submit report job, poll for completion, then download. This prevents timeout issues."
-    )
-    
-    st.markdown("---")
-    
-    # Key Takeaways
-    st.markdown("## 🎯 Key Takeaways")
-    
-    render_key_points([
-        "FBDI is the preferred method for bulk data loading into Oracle Fusion",
-        "FBDI uses CSV files uploaded to UCM and processed by ESS jobs",
-        "Always validate FBDI files before upload to catch errors early",
-        "Callback pattern enables asynchronous processing for long-running operations",
-        "BIP reports can be generated and retrieved programmatically from OIC",
-        "Monitor ESS job status and handle errors appropriately"
-    ])
-    
-    st.markdown("---")
-    
-    # Course Completion
-    st.markdown("## 🎉 Congratulations!")
-    
-    st.success("""
-    **You've completed all 8 modules of the OIC Gen 3 Training Guide!**
-    
-    You now have comprehensive knowledge of:
-    - OIC Gen 3 fundamentals and architecture
-    - Integration patterns and best practices
-    - File and database operations
-    - Web services and API integration
-    - Enterprise patterns like FBDI and callbacks
-    
-    **Next Steps:**
-    - Practice building integrations in your OIC instance
-    - Explore the Resources section for additional learning
-    - Join Oracle Cloud communities for support
-    - Stay updated with new OIC features and capabilities
-    """)
-    
-    st.markdown("---")
-    
-    st.markdown("## 📚 Additional Resources")
-    st.info("""
-    - Review earlier modules as needed
-    - Check the Resources page for documentation links
-    - Watch the original video series for demonstrations
-    - Practice with real-world integration scenarios
-    """)
-    
-    with st.expander("📺 Video References"):
-        for day in range(24, 27):
-            st.markdown(f"📺 **Day {day}** - [View on YouTube](https://www.youtube.com/playlist?list=PL3X62LScvI_Jv63W_k8PG0Chfzr4n_QEN)")
+                language="xml",
+            ),
+            Callout(
+                "best_practice",
+                "For large reports, use asynchronous pattern: submit report job, poll for completion, then download. This prevents timeout issues.",
+            ),
+        ]),
+    ],
+    sections=[
+        Section("🎯 Key Takeaways", [
+            KeyPoints([
+                "FBDI is the preferred method for bulk data loading into Oracle Fusion",
+                "FBDI uses CSV files uploaded to UCM and processed by ESS jobs",
+                "Always validate FBDI files before upload to catch errors early",
+                "Callback pattern enables asynchronous processing for long-running operations",
+                "BIP reports can be generated and retrieved programmatically from OIC",
+                "Monitor ESS job status and handle errors appropriately",
+            ]),
+        ]),
+        Section("🎉 Congratulations!", [
+            Callout(
+                "success",
+                """
+                    **You've completed all 8 modules of the OIC Gen 3 Training Guide!**
+
+                    You now have comprehensive knowledge of:
+                    - OIC Gen 3 fundamentals and architecture
+                    - Integration patterns and best practices
+                    - File and database operations
+                    - Web services and API integration
+                    - Enterprise patterns like FBDI and callbacks
+
+                    **Next Steps:**
+                    - Practice building integrations in your OIC instance
+                    - Explore the Resources section for additional learning
+                    - Join Oracle Cloud communities for support
+                    - Stay updated with new OIC features and capabilities
+                """,
+            ),
+        ]),
+        Section("📚 Additional Resources", [
+            Callout(
+                "info",
+                """
+                    - Review earlier modules as needed
+                    - Check the Resources page for documentation links
+                    - Watch the original video series for demonstrations
+                    - Practice with real-world integration scenarios
+                """,
+            ),
+        ]),
+    ],
+    videos=[Video(day) for day in range(24, 27)],
+)
@@ -0,0 +1,99 @@
+"""
+Read-only HTTP server for the OIC Training Guide.
+
+Serves the same pages as the static export (``utils.site``), built from the
+same content and renderers as ``app.py``, without a Streamlit session per
+reader. Pages are built and precompressed once at startup. Every response
+carries a strong ETag, ``Cache-Control`` and ``Vary: Accept-Encoding``.
+Content-hashed assets (``assets/``) are cached for a year as immutable.
+Conditional requests are answered with ``304 Not Modified``, and compressed
+variants are served as they were built.
+
+Needs Starlette and uvicorn (``pip install starlette uvicorn``, plus
+``brotli`` for brotli responses). Run it from the ``oic_training_guide``
+directory::
+
+    python -m server --port 8000
+    # or: uvicorn server:app --workers 4
+"""
+
+import argparse
+from contextlib import asynccontextmanager
+
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse, Response
+from starlette.routing import Route
+
+from app import MODULES, home_ops, resources_ops
+from utils.assets import IMMUTABLE_CACHE_CONTROL
+from utils.site import ASSETS_PREFIX, HOME_PAGE, build_site, compile_modules, precompress
+
+# Pages may change with a deploy, so caches revalidate them after a short
+# while. Assets are named by their content hash and never change.
+CACHE_CONTROL = {
+    "text/html": "public, max-age=300, stale-while-revalidate=86400",
+}
+DEFAULT_CACHE_CONTROL = "public, max-age=86400"
+
+
+def build_files():
+    """Build and precompress every page of the site."""
+    return precompress(build_site(home_ops(), resources_ops(), compile_modules(MODULES)))
+
+
+def _etag_matches(if_none_match, etag):
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so a ``W/`` prefix still matches.
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+async def serve_file(request):
+    path = request.path_params["path"] or HOME_PAGE
+    site_file = request.app.state.files.get(path)
+    if site_file is None:
+        return PlainTextResponse("Not Found", status_code=404)
+
+    encoding, body, etag = site_file.variant(request.headers.get("accept-encoding"))
+    media_type = site_file.content_type.split(";")[0]
+    if path.startswith(ASSETS_PREFIX):
+        cache_control = IMMUTABLE_CACHE_CONTROL
+    else:
+        cache_control = CACHE_CONTROL.get(media_type, DEFAULT_CACHE_CONTROL)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": cache_control,
+        "Vary": "Accept-Encoding",
+    }
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, headers=headers, media_type=site_file.content_type)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    app.state.files = build_files()
+    yield
+
+
+app = Starlette(
+    routes=[Route("/{path:path}", serve_file, methods=["GET", "HEAD"])],
+    lifespan=lifespan,
+)
+
+
+def main(argv=None):
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Serve the training guide read-only.")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to bind")
+    parser.add_argument("--port", type=int, default=8000, help="port to listen on")
+    args = parser.parse_args(argv)
+    uvicorn.run(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Command-line tools for building and checking the OIC Training Guide."""
@@ -0,0 +1,56 @@
+"""Build the content-hashed assets the Streamlit app links to.
+
+Writes the app stylesheet and every pre-rendered diagram to ``static/``
+under names that include a hash of their content, plus ``manifest.json``
+mapping logical names to them (see ``utils.assets``). Streamlit serves the
+directory at ``app/static/``. Run it as part of each release, after
+``python -m tools.prerender_diagrams``, and restart the app to pick up the
+new manifest.
+
+Streamlit's static file route doesn't send long-lived cache headers. Put a
+rule on the reverse proxy or CDN in front of the app to serve
+``/app/static/*`` (except ``manifest.json``) with
+``Cache-Control: public, max-age=31536000, immutable``.
+
+Usage (from the ``oic_training_guide`` directory)::
+
+    python -m tools.build_assets
+"""
+
+import argparse
+
+from utils.assets import STATIC_DIR, STYLESHEET, AssetBundle, display_lists
+from utils.bootstrap import app_css
+from utils.content import get_module
+
+
+def build(out=STATIC_DIR):
+    """Build and write the app's assets; return the ``AssetBundle``."""
+    from app import home_ops, resources_ops
+    from modules import __all__ as module_names
+
+    bundle = AssetBundle()
+    # Always include the highlighting styles, so the same build works with
+    # and without OIC_SERVER_HIGHLIGHT.
+    bundle.add(STYLESHEET, app_css(highlighted=True))
+    bundle.add_diagrams([home_ops(), resources_ops()])
+    for name in module_names:
+        bundle.add_diagrams(display_lists(get_module(name)))
+    bundle.write(out)
+    return bundle
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default=STATIC_DIR, help="output directory (default: static/)")
+    args = parser.parse_args(argv)
+
+    bundle = build(args.out)
+    diagrams = sum(name.startswith("diagrams/") for name in bundle.manifest)
+    print(f"{len(bundle.files)} assets ({diagrams} diagrams) written to {args.out}")
+    if not diagrams:
+        print("No pre-rendered diagrams found; run python -m tools.prerender_diagrams first")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""Export the full guide as one EPUB or PDF with a table of contents.
+
+Each module is rendered in its own worker process: compiled, turned into
+HTML by ``utils.html_renderer`` (diagrams as inline SVG, code highlighted)
+and, for PDF, laid out by WeasyPrint. The chapters are then merged in course
+order. Home opens the book and Resources closes it.
+
+EPUB needs only the standard library (plus ``markdown``, like the static
+site). PDF also needs ``pip install weasyprint pypdf``. Run
+``python -m tools.prerender_diagrams`` first so diagrams are vector images
+rather than Mermaid source.
+
+Usage (from the ``oic_training_guide`` directory)::
+
+    python -m tools.export_book --format epub --out oic_training_guide.epub
+    python -m tools.export_book --format pdf --workers 8
+"""
+
+import argparse
+import hashlib
+import html
+import io
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from utils import highlight
+from utils.bootstrap import ASSETS_DIR, PAGE_CONFIG
+from utils.content import get_module
+from utils.html_renderer import render_html
+from utils.site import day_anchor
+
+TITLE = PAGE_CONFIG["page_title"]
+
+
+@dataclass(frozen=True)
+class Chapter:
+    """One part of the book: a module, or the Home / Resources pages."""
+    key: str
+    title: str
+    body: str
+    days: tuple = ()  # (anchor, label) for the table of contents
+
+
+def book_css():
+    """The app stylesheet, book layout and code highlighting styles."""
+    return "\n".join((
+        (ASSETS_DIR / "style.css").read_text(encoding="utf-8"),
+        (ASSETS_DIR / "book.css").read_text(encoding="utf-8"),
+        highlight.css(),
+    ))
+
+
+def _open_expanders(body):
+    # Expanders become <details>; a printed page cannot be clicked open.
+    return body.replace("<details>", '<details open="open">')
+
+
+def module_chapter(name):
+    """Render ``modules.<name>`` as a ``Chapter`` (runs in a worker process)."""
+    module = get_module(name)
+    parts = [render_html(module.intro)]
+    for day in module.days:
+        parts.append(f'<section id="{day_anchor(day.number)}">\n{render_html(day.ops)}</section>\n')
+    parts.append(render_html(module.outro))
+    return Chapter(
+        key=f"module-{module.number}",
+        title=f"Module {module.number}: {module.title}",
+        body=_open_expanders("".join(parts)),
+        days=tuple((day_anchor(day.number), f"{day.label}: {day.title}") for day in module.days),
+    )
+
+
+def _document(chapter, css_href=None, css=None, xhtml=False):
+    head = f'<link rel="stylesheet" href="{css_href}"/>' if css_href else f"<style>{css}</style>"
+    opening = (
+        '<?xml version="1.0" encoding="utf-8"?>\n<!DOCTYPE html>\n'
+        '<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops" lang="en">'
+        if xhtml else '<!DOCTYPE html>\n<html lang="en">'
+    )
+    return (
+        f'{opening}\n<head>\n<meta charset="utf-8"/>\n<title>{html.escape(chapter.title)}</title>\n'
+        f"{head}\n</head>\n<body>\n{chapter.body}</body>\n</html>\n"
+    )
+
+
+def chapter_pdf(chapter):
+    """Lay ``chapter`` out as PDF bytes with WeasyPrint."""
+    from weasyprint import HTML
+
+    return HTML(string=_document(chapter, css=book_css())).write_pdf()
+
+
+def module_pdf(name):
+    """Render ``modules.<name>`` to a PDF chapter (runs in a worker process)."""
+    chapter = module_chapter(name)
+    return chapter, chapter_pdf(chapter)
+
+
+def page_chapters():
+    """Home and Resources as chapters; rendered in the parent process."""
+    from app import home_ops, resources_ops
+
+    return (
+        Chapter("home", "Introduction", _open_expanders(render_html(home_ops()))),
+        Chapter("resources", "Resources", _open_expanders(render_html(resources_ops()))),
+    )
+
+
+def _nav_xhtml(chapters):
+    items = []
+    for chapter in chapters:
+        days = "".join(
+            f'<li><a href="{chapter.key}.xhtml#{anchor}">{html.escape(label)}</a></li>'
+            for anchor, label in chapter.days
+        )
+        items.append(
+            f'<li><a href="{chapter.key}.xhtml">{html.escape(chapter.title)}</a>'
+            + (f"<ol>{days}</ol>" if days else "") + "</li>"
+        )
+    toc = Chapter("nav", "Contents", f'<nav epub:type="toc" id="toc"><h1>Contents</h1><ol>{"".join(items)}</ol></nav>\n')
+    return _document(toc, css_href="style.css", xhtml=True)
+
+
+def _manifest_item(chapter):
+    # EPUB 3 wants the "svg" property on exactly the documents that embed SVG.
+    properties = ' properties="svg"' if "<svg" in chapter.body else ""
+    return f'<item id="{chapter.key}" href="{chapter.key}.xhtml" media-type="application/xhtml+xml"{properties}/>'
+
+
+def _content_opf(chapters, identifier):
+    manifest = "".join(_manifest_item(c) for c in chapters)
+    spine = "".join(f'<itemref idref="{c.key}"/>' for c in chapters)
+    modified = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="book-id">\n'
+        '<metadata xmlns:dc="http://purl.org/dc/elements/1.1/">\n'
+        f'<dc:identifier id="book-id">urn:sha256:{identifier}</dc:identifier>\n'
+        f"<dc:title>{html.escape(TITLE)}</dc:title>\n<dc:language>en</dc:language>\n"
+        f'<meta property="dcterms:modified">{modified}</meta>\n</metadata>\n'
+        '<manifest><item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>'
+        f'<item id="css" href="style.css" media-type="text/css"/>{manifest}</manifest>\n'
+        f'<spine><itemref idref="nav"/>{spine}</spine>\n</package>\n'
+    )
+
+
+_CONTAINER = (
+    '<?xml version="1.0" encoding="utf-8"?>\n'
+    '<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">'
+    '<rootfiles><rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>'
+    "</rootfiles></container>\n"
+)
+
+
+def write_epub(chapters, out):
+    """Merge the chapters into an EPUB 3 file at ``out``."""
+    documents = {f"OEBPS/{c.key}.xhtml": _document(c, css_href="style.css", xhtml=True) for c in chapters}
+    identifier = hashlib.sha256("".join(documents.values()).encode("utf-8")).hexdigest()
+    with zipfile.ZipFile(out, "w") as epub:
+        # The mimetype entry must come first and be stored uncompressed.
+        epub.writestr("mimetype", "application/epub+zip", compress_type=zipfile.ZIP_STORED)
+        epub.writestr("META-INF/container.xml", _CONTAINER, compress_type=zipfile.ZIP_DEFLATED)
+        epub.writestr("OEBPS/content.opf", _content_opf(chapters, identifier), compress_type=zipfile.ZIP_DEFLATED)
+        epub.writestr("OEBPS/nav.xhtml", _nav_xhtml(chapters), compress_type=zipfile.ZIP_DEFLATED)
+        epub.writestr("OEBPS/style.css", book_css(), compress_type=zipfile.ZIP_DEFLATED)
+        for path, document in documents.items():
+            epub.writestr(path, document, compress_type=zipfile.ZIP_DEFLATED)
+
+
+def write_pdf(parts, out):
+    """Merge ``(chapter, pdf_bytes)`` parts into one PDF with an outline."""
+    from pypdf import PdfReader, PdfWriter
+
+    writer = PdfWriter()
+    writer.add_metadata({"/Title": TITLE})
+    for chapter, data in parts:
+        writer.append(PdfReader(io.BytesIO(data)), outline_item=chapter.title)
+    with open(out, "wb") as pdf:
+        writer.write(pdf)
+
+
+def main(argv=None):
+    from modules import __all__ as module_names
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--format", choices=("epub", "pdf"), default="epub", help="output format")
+    parser.add_argument("--out", help="output file (default: oic_training_guide.<format>)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    args = parser.parse_args(argv)
+    out = Path(args.out or f"oic_training_guide.{args.format}")
+    if args.format == "pdf":
+        try:
+            import pypdf  # noqa: F401
+            import weasyprint  # noqa: F401
+        except ImportError:
+            raise SystemExit("PDF export needs WeasyPrint and pypdf: pip install weasyprint pypdf")
+
+    start = time.perf_counter()
+    home, resources = page_chapters()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        if args.format == "epub":
+            chapters = [home, *pool.map(module_chapter, module_names), resources]
+            write_epub(chapters, out)
+        else:
+            parts = list(pool.map(module_pdf, module_names))
+            write_pdf([(home, chapter_pdf(home)), *parts, (resources, chapter_pdf(resources))], out)
+    print(f"{out} written in {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
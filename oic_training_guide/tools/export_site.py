@@ -0,0 +1,57 @@
+"""Export the guide as a static HTML site.
+
+Renders Home, Resources and every module into linked pages under the output
+directory (``site/`` by default), ready to serve from any static file server
+or CDN. Needs the ``markdown`` package; Pygments adds code highlighting.
+Diagrams are published from the SVG cache, so run
+``python -m tools.prerender_diagrams`` first to avoid client-side Mermaid.
+Files under ``assets/`` are content-hashed: serve them with
+``Cache-Control: public, max-age=31536000, immutable``.
+
+Usage (from the ``oic_training_guide`` directory)::
+
+    python -m tools.export_site --out site
+"""
+
+import argparse
+from pathlib import Path
+
+from app import MODULES, home_ops, resources_ops
+from utils.html_renderer import MERMAID_CLASS
+from utils.site import build_site, compile_modules, precompress
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default="site", help="output directory")
+    parser.add_argument(
+        "--precompress", action="store_true",
+        help="also write .gz (and, with brotli installed, .br) files for static servers",
+    )
+    args = parser.parse_args(argv)
+
+    out = Path(args.out)
+    out.mkdir(parents=True, exist_ok=True)
+    files = build_site(home_ops(), resources_ops(), compile_modules(MODULES))
+    for path, content in files.items():
+        target = out / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, bytes):
+            target.write_bytes(content)
+        else:
+            target.write_text(content, encoding="utf-8")
+    if args.precompress:
+        suffixes = {"gzip": ".gz", "br": ".br"}
+        for path, prepared in precompress(files).items():
+            for encoding, data in prepared.encodings.items():
+                (out / (path + suffixes[encoding])).write_bytes(data)
+    fallbacks = sum(
+        content.count(f'class="{MERMAID_CLASS}"') for path, content in files.items() if path.endswith(".html")
+    )
+    print(f"{len(files)} files written to {out}")
+    if fallbacks:
+        print(f"{fallbacks} diagrams have no pre-rendered SVG and will render client-side")
+
+
+if __name__ == "__main__":
+    main()
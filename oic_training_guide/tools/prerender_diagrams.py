@@ -0,0 +1,19 @@
+"""Pre-render every Mermaid diagram to the SVG cache.
+
+Usage (from the ``oic_training_guide`` directory)::
+
+    python -m tools.prerender_diagrams
+"""
+
+from utils import mermaid
+
+
+def main():
+    total = len(mermaid.diagram_sources())
+    if mermaid.mmdc_path() is None:
+        raise SystemExit("mmdc not found; install @mermaid-js/mermaid-cli or set MMDC")
+    print(f"{mermaid.prerender_all()}/{total} diagrams rendered to {mermaid.CACHE_DIR}")
+
+
+if __name__ == "__main__":
+    main()
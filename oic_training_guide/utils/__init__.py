@@ -1,5 +1,5 @@
 """Utils package for OIC Training Guide."""
 
-from . import helpers, diagrams
+from . import helpers, diagrams, bootstrap
 
-__all__ = ['helpers', 'diagrams']
+__all__ = ['helpers', 'diagrams', 'bootstrap']
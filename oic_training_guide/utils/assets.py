@@ -0,0 +1,146 @@
+"""Content-hashed static assets: the stylesheet and pre-rendered diagrams.
+
+Every asset is published under a name that includes a hash of its bytes
+(``style.3f2a9c0b1d4e.css``). A name therefore never changes meaning, and
+servers can send it with a one-year ``immutable`` cache. Browsers fetch each
+asset once per release rather than receiving it again inside every page.
+A manifest maps each logical name (``style.css``, ``diagrams/<digest>.svg``)
+to its published name, and pages look assets up there.
+
+Two consumers:
+
+* The Streamlit app. ``python -m tools.build_assets`` writes the assets and
+  ``manifest.json`` to ``static/``, which Streamlit serves at
+  ``app/static/`` when ``server.enableStaticServing`` is on (see
+  ``.streamlit/config.toml``). ``static_url`` returns ``None`` without the
+  manifest or static serving, and the app falls back to inline CSS and SVG.
+* The static site and ``server.py``. ``utils.site`` builds the same assets
+  under ``assets/``.
+"""
+
+import hashlib
+import json
+import logging
+import posixpath
+import threading
+from pathlib import Path
+
+import streamlit as st
+
+from utils.mermaid import cached_svg
+
+STATIC_DIR = Path(__file__).parent.parent / "static"
+MANIFEST = "manifest.json"
+
+# Logical name of the app stylesheet.
+STYLESHEET = "style.css"
+
+# Safe for hashed names only: their content can never change.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+logger = logging.getLogger(__name__)
+
+_manifest = None
+_manifest_lock = threading.Lock()
+
+
+def hashed_name(name, body):
+    """Publish ``name`` under a hash of ``body``: ``a/b.css`` becomes ``a/b.<hash>.css``."""
+    stem, suffix = posixpath.splitext(name)
+    return f"{stem}.{hashlib.sha256(body).hexdigest()[:12]}{suffix}"
+
+
+def diagram_asset(digest):
+    """Logical asset name of the diagram whose source hashes to ``digest``."""
+    return f"diagrams/{digest[:16]}.svg"
+
+
+def iter_diagrams(ops):
+    """Yield the ``digest`` of every diagram in a display list, nested ones included."""
+    for op in ops:
+        if op[0] == "diagram":
+            yield op[1]
+        elif op[0] == "columns":
+            for child in op[2]:
+                yield from iter_diagrams(child)
+        elif op[0] == "expander":
+            yield from iter_diagrams(op[2])
+
+
+def display_lists(module):
+    """Every display list of a compiled module, in page order."""
+    return [module.intro, *(day.ops for day in module.days), module.outro]
+
+
+class AssetBundle:
+    """Hashed assets collected for one build, with their manifest."""
+
+    def __init__(self):
+        self.files = {}  # published name -> bytes
+        self.manifest = {}  # logical name -> published name
+
+    def add(self, name, body):
+        """Add an asset; return its published name."""
+        body = body.encode("utf-8") if isinstance(body, str) else body
+        published = hashed_name(name, body)
+        self.files[published] = body
+        self.manifest[name] = published
+        return published
+
+    def add_diagrams(self, ops_lists):
+        """Add the pre-rendered SVG of every diagram in ``ops_lists``.
+
+        Diagrams without an SVG in the cache are skipped; pages render them
+        client-side as before.
+        """
+        for ops in ops_lists:
+            for digest in iter_diagrams(ops):
+                name = diagram_asset(digest)
+                if name not in self.manifest:
+                    svg = cached_svg(digest)
+                    if svg is not None:
+                        self.add(name, svg)
+
+    def write(self, out_dir, prune=True):
+        """Write the assets and ``manifest.json``.
+
+        With ``prune``, assets listed in the previous manifest but not in this
+        one are removed; other files in ``out_dir`` are left alone.
+        """
+        out_dir = Path(out_dir)
+        if prune:
+            try:
+                previous = json.loads((out_dir / MANIFEST).read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                previous = {}
+            for published in set(previous.values()) - set(self.files):
+                (out_dir / published).unlink(missing_ok=True)
+        for published, body in self.files.items():
+            path = out_dir / published
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(body)
+        (out_dir / MANIFEST).write_text(json.dumps(self.manifest, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def static_manifest():
+    """The manifest in ``static/``, read once per process; empty if unusable."""
+    global _manifest
+    if _manifest is None:
+        with _manifest_lock:
+            if _manifest is None:
+                manifest = {}
+                if st.get_option("server.enableStaticServing"):
+                    try:
+                        manifest = json.loads((STATIC_DIR / MANIFEST).read_text(encoding="utf-8"))
+                    except FileNotFoundError:
+                        pass
+                    except (OSError, ValueError) as exc:
+                        logger.warning("Ignoring unreadable asset manifest: %s", exc)
+                _manifest = manifest
+    return _manifest
+
+
+def static_url(name):
+    """URL of a built asset as served by Streamlit, or ``None`` if it wasn't built."""
+    published = static_manifest().get(name)
+    return f"app/static/{published}" if published else None
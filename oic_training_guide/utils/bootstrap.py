@@ -0,0 +1,58 @@
+"""Page setup for the OIC Training Guide Streamlit app.
+
+Streamlit re-executes ``app.py`` on every interaction. Anything that only
+needs to happen once per server process lives behind ``st.cache_resource``
+here, so a rerun only emits the page config and the (already built) style
+element before rendering the selected page.
+"""
+
+from pathlib import Path
+
+import streamlit as st
+
+from utils import assets, highlight, mermaid, reload, sessions
+
+ASSETS_DIR = Path(__file__).parent.parent / "assets"
+
+PAGE_CONFIG = {
+    "page_title": "OIC Gen 3 Training Guide",
+    "page_icon": "☁️",
+    "layout": "wide",
+    "initial_sidebar_state": "expanded",
+}
+
+
+def app_css(highlighted=highlight.SERVER_HIGHLIGHT):
+    """The app stylesheet, plus code highlighting styles if ``highlighted``."""
+    css = (ASSETS_DIR / "style.css").read_text(encoding="utf-8")
+    if highlighted:
+        css += highlight.css()
+    return css
+
+
+@st.cache_resource(show_spinner=False)
+def page_css():
+    """Link the built stylesheet, else read ``assets/style.css`` once per process.
+
+    With assets built (``python -m tools.build_assets``) each rerun sends a
+    one-line link and the browser caches the stylesheet itself.
+    """
+    href = assets.static_url(assets.STYLESHEET)
+    if href is not None:
+        return f'<link rel="stylesheet" href="{href}">'
+    return f"<style>\n{app_css()}</style>"
+
+
+@st.cache_resource(show_spinner=False)
+def init_process():
+    """Start process-wide background work; runs once per server process."""
+    mermaid.prerender_in_background()
+    reload.start_watcher()
+    sessions.start_sweeper()
+
+
+def setup_page():
+    """Apply page config and custom CSS for the current script run."""
+    init_process()
+    st.set_page_config(**PAGE_CONFIG)
+    st.markdown(page_css(), unsafe_allow_html=True)
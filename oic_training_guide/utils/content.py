@@ -0,0 +1,403 @@
+"""Declarative content model for the training modules.
+
+Each file under ``modules`` describes its page as a ``Module`` built from the
+blocks below. ``compile_module`` turns that description into display lists
+(see ``utils.renderer``) with every string already formatted, and
+``get_module`` keeps one compiled, read-only copy per process that all
+sessions share.
+"""
+
+import importlib
+import re
+import textwrap
+import threading
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from typing import Optional
+
+from labs import LABS
+from utils import diagrams
+from utils.helpers import (
+    best_practice_ops,
+    code_example_ops,
+    diagram_ops,
+    exercise_ops,
+    header_ops,
+    key_points_ops,
+    module_info_ops,
+    tip_ops,
+    video_reference_ops,
+    warning_ops,
+)
+from utils.profiling import record_cache
+from utils.renderer import coalesce, day_heading
+
+PLAYLIST_URL = "https://www.youtube.com/playlist?list=PL3X62LScvI_Jv63W_k8PG0Chfzr4n_QEN"
+
+
+def _freeze(instance):
+    # Blocks are written with list literals for readability; store tuples so
+    # the model is hashable and cannot be mutated after import.
+    for f in fields(instance):
+        value = getattr(instance, f.name)
+        if isinstance(value, list):
+            object.__setattr__(instance, f.name, tuple(value))
+
+
+def _text(text):
+    return textwrap.dedent(text).strip()
+
+
+# --- Blocks -----------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Markdown:
+    """A markdown paragraph or list."""
+    text: str
+
+
+@dataclass(frozen=True)
+class Diagram:
+    """A Mermaid diagram, by function name in ``utils.diagrams``."""
+    name: str
+
+
+@dataclass(frozen=True)
+class Code:
+    """A code example with optional title."""
+    code: str
+    language: str = "python"
+    title: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class KeyPoints:
+    """A list of key points with checkmark icons."""
+    points: tuple
+
+    def __post_init__(self):
+        _freeze(self)
+
+
+@dataclass(frozen=True)
+class Callout:
+    """A coloured box: ``tip``, ``best_practice``, ``warning``, ``info`` or ``success``."""
+    kind: str
+    text: str
+
+
+@dataclass(frozen=True)
+class Columns:
+    """Markdown laid out side by side, one string per column."""
+    columns: tuple
+
+    def __post_init__(self):
+        _freeze(self)
+
+
+@dataclass(frozen=True)
+class Exercise:
+    """A hands-on exercise."""
+    title: str
+    description: str
+    steps: tuple
+
+    def __post_init__(self):
+        _freeze(self)
+
+
+@dataclass(frozen=True)
+class Lab:
+    """An interactive lab, by name in ``labs.LABS``."""
+    name: str
+
+
+# --- Page structure -----------------------------------------------------------
+
+@dataclass(frozen=True)
+class Day:
+    """One training day; ``last`` is set when a section spans several days."""
+    number: int
+    title: str
+    blocks: tuple
+    last: Optional[int] = None
+
+    def __post_init__(self):
+        _freeze(self)
+
+    @property
+    def label(self):
+        if self.last:
+            return f"Days {self.number}-{self.last}"
+        return f"Day {self.number}"
+
+
+@dataclass(frozen=True)
+class Section:
+    """A closing section such as Key Takeaways or What's Next."""
+    title: str
+    blocks: tuple
+
+    def __post_init__(self):
+        _freeze(self)
+
+
+@dataclass(frozen=True)
+class Video:
+    """A reference to the original training video for a day."""
+    day: int
+    title: Optional[str] = None
+    url: str = PLAYLIST_URL
+
+
+@dataclass(frozen=True)
+class Module:
+    """A complete training module page."""
+    number: int
+    title: str
+    heading: str
+    subtitle: str
+    duration: str
+    topics: tuple
+    days: tuple
+    sections: tuple = ()
+    videos: tuple = ()
+
+    def __post_init__(self):
+        _freeze(self)
+
+
+# --- Compilation ----------------------------------------------------------------
+
+@dataclass(frozen=True)
+class CompiledSection:
+    """Part of a day from one ``###`` heading to the next, for deep links."""
+    slug: str
+    title: str
+    ops: tuple
+
+
+@dataclass(frozen=True)
+class CompiledDay:
+    """A day's content as a display list, plus its sections and exercise titles."""
+    number: int
+    last: Optional[int]
+    label: str
+    title: str
+    ops: tuple
+    exercises: tuple = ()
+    sections: tuple = ()
+
+    def section(self, slug):
+        """The section named by a ``?section=`` value: its slug or a prefix of it."""
+        slug = slugify(slug)
+        if not slug:
+            return None
+        for section in self.sections:
+            if section.slug == slug:
+                return section
+        for section in self.sections:
+            if section.slug.startswith(f"{slug}-"):
+                return section
+        return None
+
+
+@dataclass(frozen=True)
+class CompiledModule:
+    """A module page as display lists: header, one entry per day, closing."""
+    number: int
+    title: str
+    intro: tuple
+    days: tuple = ()
+    outro: tuple = ()
+
+
+_CALLOUTS = {
+    "tip": tip_ops,
+    "best_practice": best_practice_ops,
+    "warning": warning_ops,
+    "info": lambda text: (("info", text),),
+    "success": lambda text: (("success", text),),
+}
+
+
+def compile_block(block):
+    """Return the display list for a single content block."""
+    if isinstance(block, Markdown):
+        return (("markdown", _text(block.text)),)
+    if isinstance(block, Diagram):
+        return diagram_ops(getattr(diagrams, block.name)())
+    if isinstance(block, Code):
+        return code_example_ops(block.code, block.language, block.title)
+    if isinstance(block, KeyPoints):
+        return key_points_ops(block.points)
+    if isinstance(block, Callout):
+        return _CALLOUTS[block.kind](_text(block.text))
+    if isinstance(block, Columns):
+        children = tuple((("markdown", _text(text)),) for text in block.columns)
+        return (("columns", (1,) * len(children), children),)
+    if isinstance(block, Exercise):
+        return exercise_ops(block.title, block.description, block.steps)
+    if isinstance(block, Lab):
+        if block.name not in LABS:
+            raise ValueError(f"Unknown lab: {block.name!r}")
+        return (("lab", block.name),)
+    raise TypeError(f"Unknown content block: {block!r}")
+
+
+def _compile_blocks(blocks):
+    return tuple(op for block in blocks for op in compile_block(block))
+
+
+def _video_ops(video):
+    if video.title:
+        return video_reference_ops(video.day, video.title, video.url)
+    return (("markdown", f"📺 **Day {video.day}** - [View on YouTube]({video.url})"),)
+
+
+_SECTION_HEADING = re.compile(r"^### +(.+?)\s*$", re.MULTILINE)
+
+
+def slugify(title):
+    """URL-friendly form of a heading, e.g. ``upsert-pattern-insert-or-update``."""
+    return re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")
+
+
+def split_sections(ops):
+    """Split a display list at ``###`` headings into ``CompiledSection``s.
+
+    Content before the first heading is not a section. Markdown ops are cut
+    at the heading line, so this works on uncoalesced and coalesced lists.
+    """
+    sections = []
+    current = None
+    for op in ops:
+        if op[0] != "markdown":
+            if current is not None:
+                current[2].append(op)
+            continue
+        text = op[1]
+        starts = [match.start() for match in _SECTION_HEADING.finditer(text)]
+        head = text[:starts[0]] if starts else text
+        if head.strip() and current is not None:
+            current[2].append(("markdown", head.strip()))
+        for start, end in zip(starts, starts[1:] + [len(text)]):
+            chunk = text[start:end].strip()
+            title = _SECTION_HEADING.match(chunk).group(1)
+            current = [slugify(title), title, [("markdown", chunk)]]
+            sections.append(current)
+    slugs = {}
+    compiled = []
+    for slug, title, section_ops in sections:
+        count = slugs[slug] = slugs.get(slug, 0) + 1
+        compiled.append(CompiledSection(
+            slug=slug if count == 1 else f"{slug}-{count}",
+            title=title,
+            ops=coalesce(section_ops),
+        ))
+    return tuple(compiled)
+
+
+def diagram_names(module):
+    """Names of the ``utils.diagrams`` templates a ``Module`` uses."""
+    blocks = [b for day in module.days for b in day.blocks]
+    blocks += [b for section in module.sections for b in section.blocks]
+    return {block.name for block in blocks if isinstance(block, Diagram)}
+
+
+def compile_module(module):
+    """Compile a ``Module`` description into a ``CompiledModule``.
+
+    Adjacent markdown is coalesced so each display list draws as few
+    elements as possible.
+    """
+    separator = (("markdown", "---"),)
+    intro = header_ops(module.heading, module.subtitle) + module_info_ops(
+        module.number, module.title, module.duration, module.topics
+    )
+    days = tuple(
+        CompiledDay(
+            number=day.number,
+            last=day.last,
+            label=day.label,
+            title=day.title,
+            ops=coalesce(
+                (("markdown", day_heading(day.label, day.title)),)
+                + _compile_blocks(day.blocks)
+                + separator
+            ),
+            exercises=tuple(b.title for b in day.blocks if isinstance(b, Exercise)),
+            sections=split_sections(_compile_blocks(day.blocks)),
+        )
+        for day in module.days
+    )
+    outro = ()
+    for i, section in enumerate(module.sections):
+        if i:
+            outro += separator
+        outro += (("markdown", f"## {section.title}"),) + _compile_blocks(section.blocks)
+    if module.videos:
+        videos = tuple(op for video in module.videos for op in _video_ops(video))
+        outro += (("expander", "📺 Video References", videos),)
+    return CompiledModule(
+        number=module.number,
+        title=module.title,
+        intro=coalesce(intro),
+        days=days,
+        outro=coalesce(outro),
+    )
+
+
+# --- Process-wide bundle ----------------------------------------------------------
+
+_bundle = {}
+_bundle_lock = threading.Lock()
+_versions = {}
+
+
+def get_module(name):
+    """Return the compiled content of ``modules.<name>``, compiling it on first use."""
+    compiled = _bundle.get(name)
+    record_cache("compiled_modules", compiled is not None)
+    if compiled is None:
+        with _bundle_lock:
+            compiled = _bundle.get(name)
+            if compiled is None:
+                source = importlib.import_module(f"modules.{name}").MODULE
+                compiled = _bundle[name] = compile_module(source)
+    return compiled
+
+
+def reload_module(name, reimport=True):
+    """Recompile ``modules.<name>`` and replace its bundle entry.
+
+    With ``reimport`` the module file is re-executed first (it was edited);
+    without, only the compilation is redone (e.g. a diagram it uses changed).
+    Sessions see the new content on their next render; ``module_version``
+    tells them one is due.
+    """
+    module = importlib.import_module(f"modules.{name}")
+    if reimport:
+        module = importlib.reload(module)
+    compiled = compile_module(module.MODULE)
+    with _bundle_lock:
+        _bundle[name] = compiled
+        _versions[name] = _versions.get(name, 0) + 1
+    return compiled
+
+
+def module_version(name):
+    """How many times ``modules.<name>`` has been recompiled in this process."""
+    return _versions.get(name, 0)
+
+
+def compiled_names():
+    """Names of the modules compiled so far in this process."""
+    return set(_bundle)
+
+
+def load_bundle():
+    """Compile every module and return a read-only ``{name: CompiledModule}``."""
+    from modules import __all__ as module_names
+
+    return MappingProxyType({name: get_module(name) for name in module_names})
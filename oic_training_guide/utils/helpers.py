@@ -1,63 +1,119 @@
-"""Helper functions for the OIC Training Guide Streamlit app."""
+"""Helper functions for the OIC Training Guide Streamlit app.
 
-import streamlit as st
+Every ``render_*`` helper is backed by a ``*_ops`` builder that returns the
+same output as a display list (see ``utils.renderer``). The builders are pure,
+which lets ``utils.content`` compile module pages once and replay them.
+"""
+
+from utils.mermaid import source_hash
+from utils.renderer import render_ops
+
+
+def header_ops(title, subtitle=None):
+    """Display list for a styled header with optional subtitle."""
+    ops = [("markdown", f"# {title}")]
+    if subtitle:
+        ops.append(("markdown", f"*{subtitle}*"))
+    ops.append(("markdown", "---"))
+    return tuple(ops)
 
 def render_header(title, subtitle=None):
     """Render a styled header with optional subtitle."""
-    st.markdown(f"# {title}")
-    if subtitle:
-        st.markdown(f"*{subtitle}*")
-    st.markdown("---")
+    render_ops(header_ops(title, subtitle))
+
+def key_points_ops(points):
+    """Display list for a list of key points with checkmark icons."""
+    return tuple(("markdown", f"✅ {point}") for point in points)
 
 def render_key_points(points):
     """Render a list of key points with checkmark icons."""
-    for point in points:
-        st.markdown(f"✅ {point}")
+    render_ops(key_points_ops(points))
+
+def warning_ops(message):
+    """Display list for a warning box."""
+    return (("warning", f"⚠️ {message}"),)
 
 def render_warning(message):
     """Render a warning box."""
-    st.warning(f"⚠️ {message}")
+    render_ops(warning_ops(message))
+
+def tip_ops(message):
+    """Display list for a tip box."""
+    return (("info", f"💡 **Tip:** {message}"),)
 
 def render_tip(message):
     """Render a tip box."""
-    st.info(f"💡 **Tip:** {message}")
+    render_ops(tip_ops(message))
+
+def best_practice_ops(message):
+    """Display list for a best practice box."""
+    return (("success", f"⭐ **Best Practice:** {message}"),)
 
 def render_best_practice(message):
     """Render a best practice box."""
-    st.success(f"⭐ **Best Practice:** {message}")
+    render_ops(best_practice_ops(message))
+
+def code_example_ops(code, language="python", title=None):
+    """Display list for a code example with optional title."""
+    ops = []
+    if title:
+        ops.append(("markdown", f"**{title}**"))
+    ops.append(("code", code, language))
+    return tuple(ops)
 
 def render_code_example(code, language="python", title=None):
     """Render a code example with optional title."""
-    if title:
-        st.markdown(f"**{title}**")
-    st.code(code, language=language)
+    render_ops(code_example_ops(code, language, title))
+
+def diagram_ops(source):
+    """Display list for a Mermaid diagram, served as SVG once pre-rendered."""
+    return (("diagram", source_hash(source), source),)
+
+def render_diagram(source):
+    """Render a Mermaid diagram."""
+    render_ops(diagram_ops(source))
+
+def exercise_ops(title, description, steps):
+    """Display list for a hands-on exercise."""
+    body = [("markdown", description), ("markdown", "**Steps:**")]
+    body.extend(("markdown", f"{i}. {step}") for i, step in enumerate(steps, 1))
+    return (("expander", f"🎯 Exercise: {title}", tuple(body)),)
 
 def render_exercise(title, description, steps):
     """Render a hands-on exercise."""
-    with st.expander(f"🎯 Exercise: {title}"):
-        st.markdown(description)
-        st.markdown("**Steps:**")
-        for i, step in enumerate(steps, 1):
-            st.markdown(f"{i}. {step}")
+    render_ops(exercise_ops(title, description, steps))
+
+def progress_tracker_ops(completed_modules, total_modules=8):
+    """Display list for a visual progress tracker."""
+    progress = completed_modules / total_modules
+    return (
+        ("progress", progress),
+        ("markdown", f"**Progress:** {completed_modules}/{total_modules} modules completed ({int(progress*100)}%)"),
+    )
 
 def create_progress_tracker(completed_modules, total_modules=8):
     """Create a visual progress tracker."""
-    progress = completed_modules / total_modules
-    st.progress(progress)
-    st.markdown(f"**Progress:** {completed_modules}/{total_modules} modules completed ({int(progress*100)}%)")
+    render_ops(progress_tracker_ops(completed_modules, total_modules))
+
+def video_reference_ops(day, title, url):
+    """Display list for a reference to the original training video."""
+    return (("markdown", f"📺 **Day {day}:** [{title}]({url})"),)
 
 def render_video_reference(day, title, url):
     """Render a reference to the original training video."""
-    st.markdown(f"📺 **Day {day}:** [{title}]({url})")
+    render_ops(video_reference_ops(day, title, url))
+
+def module_info_ops(module_num, title, duration, topics):
+    """Display list for a module information card."""
+    topic_ops = (("markdown", "**Topics Covered:**"),) + tuple(
+        ("markdown", f"• {topic}") for topic in topics
+    )
+    return (
+        ("markdown", f"## Module {module_num}: {title}"),
+        ("columns", (1, 3), ((("metric", "Duration", duration),), topic_ops)),
+        ("markdown", "---"),
+    )
 
 def render_module_info(module_num, title, duration, topics):
     """Render module information card."""
-    st.markdown(f"## Module {module_num}: {title}")
-    col1, col2 = st.columns([1, 3])
-    with col1:
-        st.metric("Duration", duration)
-    with col2:
-        st.markdown("**Topics Covered:**")
-        for topic in topics:
-            st.markdown(f"• {topic}")
-    st.markdown("---")
+    render_ops(module_info_ops(module_num, title, duration, topics))
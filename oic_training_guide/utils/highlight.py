@@ -0,0 +1,66 @@
+"""Server-side syntax highlighting with a process-wide cache.
+
+Code examples are tokenized with Pygments (``pip install pygments``) once
+per process and the highlighted HTML is shared by every session and by the
+static export. Entries are keyed by ``(language, code)``: Python caches a
+string's hash, so each lookup after the first costs a dict probe rather
+than a re-hash of the snippet.
+
+The static export always uses it when Pygments is installed. The Streamlit
+app keeps ``st.code`` (client-side highlighting with a copy button) unless
+``OIC_SERVER_HIGHLIGHT=1`` is set, which makes it send the cached HTML.
+"""
+
+import os
+import threading
+
+from utils.profiling import record_cache
+
+try:
+    from pygments import highlight as _highlight
+    from pygments.formatters import HtmlFormatter
+    from pygments.lexers import get_lexer_by_name
+    from pygments.util import ClassNotFound
+except ImportError:  # pragma: no cover - optional dependency
+    _highlight = None
+
+CSS_CLASS = "highlight"
+
+SERVER_HIGHLIGHT = os.environ.get("OIC_SERVER_HIGHLIGHT", "").lower() in ("1", "true", "yes")
+
+_cache = {}
+_lock = threading.Lock()
+_formatter = HtmlFormatter(cssclass=CSS_CLASS) if _highlight is not None else None
+
+
+def available():
+    """Whether Pygments is installed."""
+    return _highlight is not None
+
+
+def _lexer(language):
+    try:
+        return get_lexer_by_name(language or "text")
+    except ClassNotFound:
+        return get_lexer_by_name("text")
+
+
+def highlight(code, language):
+    """Return highlighted HTML for ``code``, or ``None`` without Pygments."""
+    if _highlight is None:
+        return None
+    key = (language, code)
+    html = _cache.get(key)
+    record_cache("highlighted_code", html is not None)
+    if html is None:
+        html = _highlight(code, _lexer(language), _formatter)
+        with _lock:
+            html = _cache.setdefault(key, html)
+    return html
+
+
+def css():
+    """Stylesheet for highlighted code, empty without Pygments."""
+    if _formatter is None:
+        return ""
+    return _formatter.get_style_defs(f".{CSS_CLASS}")
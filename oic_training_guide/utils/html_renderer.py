@@ -0,0 +1,149 @@
+"""HTML renderer for display lists.
+
+The static counterpart of ``utils.renderer``: ``render_html`` walks the same
+display lists (see the op table there) and returns an HTML fragment instead
+of drawing Streamlit elements. It backs the static-site export, so every
+page keeps a single source of content.
+
+Markdown is converted with the ``markdown`` package and code is highlighted
+with Pygments (through the shared cache in ``utils.highlight``) when it is
+installed::
+
+    pip install markdown pygments
+
+Diagrams are inlined as their pre-rendered SVG, or left as a ``mermaid``
+block for Mermaid's browser script when no SVG has been rendered yet. Inside
+``linked_diagrams(href)`` a diagram with a published asset becomes an
+``<img>`` pointing at it instead. Interactive labs need the app, so they
+become a pointer to it.
+"""
+
+import html
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from labs import LABS
+from utils.highlight import highlight
+from utils.mermaid import cached_svg
+
+try:
+    import markdown as _markdown_lib
+except ImportError:  # pragma: no cover - optional dependency
+    _markdown_lib = None
+
+
+MARKDOWN_EXTENSIONS = ("tables", "fenced_code", "sane_lists")
+
+# Marks a page that needs Mermaid's browser script.
+MERMAID_CLASS = "mermaid"
+
+_diagram_href = ContextVar("diagram_href", default=None)
+
+
+@contextmanager
+def linked_diagrams(href):
+    """Link diagrams instead of inlining them while rendering in this block.
+
+    ``href(digest)`` returns the URL of a diagram's asset, or ``None`` to
+    inline it as usual.
+    """
+    token = _diagram_href.set(href)
+    try:
+        yield
+    finally:
+        _diagram_href.reset(token)
+
+
+def markdown_to_html(text):
+    """Convert Streamlit-flavoured markdown to HTML."""
+    if _markdown_lib is None:
+        raise RuntimeError("HTML export needs the 'markdown' package: pip install markdown")
+    return _markdown_lib.markdown(text, extensions=list(MARKDOWN_EXTENSIONS))
+
+
+def code_to_html(code, language):
+    """Highlight ``code`` (cached, see ``utils.highlight``), or escape it without Pygments."""
+    highlighted = highlight(code, language)
+    if highlighted is not None:
+        return highlighted
+    return f'<pre><code class="language-{html.escape(language or "text")}">{html.escape(code)}</code></pre>\n'
+
+
+def _title(text):
+    return f"<h1>{html.escape(text)}</h1>\n"
+
+
+def _markdown(text):
+    return markdown_to_html(text) + "\n"
+
+
+def _html(text):
+    return text + "\n"
+
+
+def _diagram(digest, source):
+    href = _diagram_href.get()
+    url = href(digest) if href is not None else None
+    if url is not None:
+        return f'<div class="oic-diagram"><img src="{html.escape(url, quote=True)}" alt="Diagram"></div>\n'
+    svg = cached_svg(digest)
+    if svg is None:
+        return f'<pre class="{MERMAID_CLASS}">{html.escape(source)}</pre>\n'
+    return f'<div class="oic-diagram">{svg}</div>\n'
+
+
+def _alert(kind):
+    def render(text):
+        return f'<div class="oic-alert oic-{kind}">{markdown_to_html(text)}</div>\n'
+    return render
+
+
+def _metric(label, value, help=None):
+    title = f' title="{html.escape(help, quote=True)}"' if help else ""
+    return (
+        f'<div class="oic-metric"{title}><div class="oic-metric-label">{html.escape(label)}</div>'
+        f'<div class="oic-metric-value">{html.escape(str(value))}</div></div>\n'
+    )
+
+
+def _progress(value):
+    return f'<progress class="oic-progress" value="{value:g}" max="1"></progress>\n'
+
+
+def _columns(spec, children):
+    template = " ".join(f"{weight}fr" for weight in spec)
+    columns = "".join(f"<div>{render_html(ops)}</div>" for ops in children)
+    return f'<div class="oic-columns" style="grid-template-columns: {template}">{columns}</div>\n'
+
+
+def _expander(label, ops):
+    # Streamlit renders markdown in expander labels too.
+    summary = markdown_to_html(label).removeprefix("<p>").removesuffix("</p>")
+    return f"<details><summary>{summary}</summary>\n{render_html(ops)}</details>\n"
+
+
+def _lab(name):
+    # Labs run Python on the server; static pages can only point at them.
+    return f'<div class="oic-alert oic-info"><p>{html.escape(LABS[name])}: open this day in the app to try it.</p></div>\n'
+
+
+_HANDLERS = {
+    "title": _title,
+    "markdown": _markdown,
+    "html": _html,
+    "code": code_to_html,
+    "diagram": _diagram,
+    "info": _alert("info"),
+    "success": _alert("success"),
+    "warning": _alert("warning"),
+    "metric": _metric,
+    "progress": _progress,
+    "columns": _columns,
+    "expander": _expander,
+    "lab": _lab,
+}
+
+
+def render_html(ops):
+    """Return the HTML for a display list."""
+    return "".join(_HANDLERS[op[0]](*op[1:]) for op in ops)
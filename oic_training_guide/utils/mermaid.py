@@ -0,0 +1,126 @@
+"""Server-side Mermaid rendering with a content-hash SVG cache.
+
+Diagrams are rendered to SVG with the Mermaid CLI (``mmdc``, from
+``npm install -g @mermaid-js/mermaid-cli``) and stored under
+``.cache/diagrams/<sha256>.svg``, keyed by a hash of the diagram source. The
+cache is filled ahead of time by::
+
+    python -m tools.prerender_diagrams
+
+and topped up in a background thread when the app starts. Pages look SVGs up
+by hash while rendering; a diagram that has no SVG yet (or no ``mmdc`` on the
+server) falls back to a client-side ```` ```mermaid ```` block.
+
+Set ``MMDC`` to point at a specific ``mmdc`` binary and
+``MMDC_PUPPETEER_CONFIG`` to pass a Puppeteer config file (e.g. to add
+``--no-sandbox`` when running as root in a container).
+"""
+
+import hashlib
+import inspect
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import textwrap
+import threading
+from pathlib import Path
+
+from utils import diagrams
+from utils.profiling import record_cache
+
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "diagrams"
+
+logger = logging.getLogger(__name__)
+
+_svgs = {}
+
+
+def source_hash(source):
+    """Content hash identifying a diagram source."""
+    return hashlib.sha256(textwrap.dedent(source).strip().encode("utf-8")).hexdigest()
+
+
+def mmdc_path():
+    """Path of the Mermaid CLI, or ``None`` if it is not installed."""
+    return shutil.which(os.environ.get("MMDC", "mmdc"))
+
+
+def _render(source, digest, mmdc):
+    with tempfile.TemporaryDirectory() as tmp:
+        src = Path(tmp) / "diagram.mmd"
+        out = Path(tmp) / "diagram.svg"
+        src.write_text(textwrap.dedent(source).strip(), encoding="utf-8")
+        cmd = [
+            mmdc, "-q", "-i", str(src), "-o", str(out),
+            "-b", "transparent", "-I", f"diagram-{digest[:12]}",
+        ]
+        config = os.environ.get("MMDC_PUPPETEER_CONFIG")
+        if config:
+            cmd += ["-p", config]
+        subprocess.run(cmd, check=True, capture_output=True, timeout=120)
+        return out.read_text(encoding="utf-8")
+
+
+def cached_svg(digest):
+    """Return the SVG for ``digest`` if it has been rendered, else ``None``.
+
+    This is the per-render lookup: memory first, then the disk cache. It
+    never starts the renderer.
+    """
+    svg = _svgs.get(digest)
+    record_cache("diagram_svgs", svg is not None)
+    if svg is None:
+        path = CACHE_DIR / f"{digest}.svg"
+        if path.exists():
+            svg = _svgs[digest] = path.read_text(encoding="utf-8")
+    return svg
+
+
+def render_svg(source):
+    """Return the SVG for ``source``, rendering and caching it if needed.
+
+    Returns ``None`` when ``mmdc`` is not available or rendering fails.
+    """
+    digest = source_hash(source)
+    svg = cached_svg(digest)
+    if svg is not None:
+        return svg
+    mmdc = mmdc_path()
+    if mmdc is None:
+        return None
+    try:
+        svg = _render(source, digest, mmdc)
+    except (OSError, subprocess.SubprocessError) as exc:
+        logger.warning("Could not render diagram %s: %s", digest[:12], exc)
+        return None
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    (CACHE_DIR / f"{digest}.svg").write_text(svg, encoding="utf-8")
+    _svgs[digest] = svg
+    return svg
+
+
+def diagram_sources():
+    """Return ``{name: source}`` for every template in ``utils.diagrams``."""
+    return {
+        name: func()
+        for name, func in inspect.getmembers(diagrams, inspect.isfunction)
+        if func.__module__ == diagrams.__name__
+    }
+
+
+def prerender_all():
+    """Render every diagram template; return the number available as SVG."""
+    return sum(render_svg(source) is not None for source in diagram_sources().values())
+
+
+def prerender_in_background():
+    """Start ``prerender_all`` on a daemon thread (no-op without ``mmdc``)."""
+    if mmdc_path() is None:
+        logger.info("mmdc not found; diagrams will render client-side")
+        return None
+    thread = threading.Thread(target=prerender_all, name="mermaid-prerender", daemon=True)
+    thread.start()
+    return thread
+
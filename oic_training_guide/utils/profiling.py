@@ -0,0 +1,153 @@
+"""Opt-in render profiling for the OIC Training Guide Streamlit app.
+
+Set ``OIC_PROFILE=1`` before starting the app to time every kind of
+display-list op drawn by ``utils.renderer.render_ops`` (``render_ops[code]``
+and so on; a columns or expander op includes its children), every module
+page and the other pages, and to count cache hits and misses (compiled
+modules, diagram SVGs). Without it the hooks are no-ops:
+``profiled`` returns functions unchanged and ``timed``/``record_cache``
+return straight away.
+
+Measurements are aggregated in-process and shared by every session. The
+Diagnostics page in ``app.py`` shows them to admins; ``snapshot()`` returns
+the same data as a JSON-serialisable dict.
+"""
+
+import functools
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+ENABLED = os.environ.get("OIC_PROFILE", "").lower() in ("1", "true", "yes")
+
+# Samples kept per timer; percentiles describe the most recent ones.
+WINDOW = 2000
+
+_PERCENTILES = (50, 90, 99)
+
+
+def _elements():
+    # Imported here: ``utils.renderer`` itself depends on modules that
+    # record cache statistics.
+    from utils.renderer import delta_count
+
+    return delta_count()
+
+
+def _percentile(ordered, p):
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+
+class Profiler:
+    """Timings, element counts and cache statistics for one process."""
+
+    def __init__(self, window=WINDOW):
+        self.window = window
+        self._lock = threading.Lock()
+        self._timings = {}
+        self._elements = {}
+        self._calls = {}
+        self._cache = {}
+        self.started = time.time()
+
+    def record(self, name, ms, elements=0):
+        with self._lock:
+            if name not in self._timings:
+                self._timings[name] = deque(maxlen=self.window)
+                self._elements[name] = deque(maxlen=self.window)
+                self._calls[name] = 0
+            self._timings[name].append(ms)
+            self._elements[name].append(elements)
+            self._calls[name] += 1
+
+    def record_cache(self, name, hit):
+        with self._lock:
+            counts = self._cache.setdefault(name, [0, 0])
+            counts[0 if hit else 1] += 1
+
+    def reset(self):
+        with self._lock:
+            self._timings.clear()
+            self._elements.clear()
+            self._calls.clear()
+            self._cache.clear()
+            self.started = time.time()
+
+    def snapshot(self):
+        """Return the aggregated measurements as a JSON-serialisable dict."""
+        with self._lock:
+            timings = {name: sorted(samples) for name, samples in self._timings.items()}
+            elements = {name: list(samples) for name, samples in self._elements.items()}
+            calls = dict(self._calls)
+            cache = {name: tuple(counts) for name, counts in self._cache.items()}
+        renders = {}
+        for name, ordered in timings.items():
+            stats = {f"p{p}_ms": round(_percentile(ordered, p), 3) for p in _PERCENTILES}
+            stats["mean_ms"] = round(sum(ordered) / len(ordered), 3)
+            stats["max_ms"] = round(ordered[-1], 3)
+            stats["calls"] = calls[name]
+            stats["mean_elements"] = round(sum(elements[name]) / len(elements[name]), 1)
+            renders[name] = stats
+        return {
+            "enabled": ENABLED,
+            "since": self.started,
+            "window": self.window,
+            "renders": renders,
+            "caches": {
+                name: {
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_rate": round(hits / (hits + misses), 4) if hits + misses else None,
+                }
+                for name, (hits, misses) in cache.items()
+            },
+        }
+
+
+_profiler = Profiler()
+
+
+def get_profiler():
+    """The process-wide profiler shared by all sessions."""
+    return _profiler
+
+
+@contextmanager
+def timed(name):
+    """Time the enclosed block under ``name`` along with the elements it drew."""
+    if not ENABLED:
+        yield
+        return
+    elements = _elements()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _profiler.record(name, (time.perf_counter() - start) * 1000, _elements() - elements)
+
+
+def profiled(func):
+    """Decorator timing ``func`` under its qualified name when profiling is on."""
+    if not ENABLED:
+        return func
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with timed(name):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def record_cache(name, hit):
+    """Count a hit (or miss) of the cache called ``name``."""
+    if ENABLED:
+        _profiler.record_cache(name, hit)
+
+
+def snapshot():
+    """Aggregated measurements of the process-wide profiler."""
+    return _profiler.snapshot()
@@ -0,0 +1,191 @@
+"""Persistent learner progress with write-behind batching.
+
+Progress is stored in SQLite (``data/progress.db`` by default, or the path in
+``OIC_PROGRESS_DB``) as one row per completed item. Reads are served from an
+in-memory cache that is loaded once per learner, so rendering the sidebar
+never touches disk. Writes update the cache immediately and are queued for a
+background thread that commits them in batches, keeping every click off the
+database's critical path.
+
+The same database keeps the session state of evicted idle sessions (see
+``utils.sessions``) so it can be restored when the learner returns.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+
+DEFAULT_PATH = Path(__file__).parent.parent / "data" / "progress.db"
+
+# Item kinds
+DAY = "day"
+EXERCISE = "exercise"
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS progress (
+    learner TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    item TEXT NOT NULL,
+    completed_at REAL NOT NULL,
+    PRIMARY KEY (learner, kind, item)
+)
+"""
+
+_STATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS session_state (
+    learner TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    saved_at REAL NOT NULL
+)
+"""
+
+
+class ProgressStore:
+    """Per-learner completion records with a read cache and a write-behind queue."""
+
+    def __init__(self, path=DEFAULT_PATH, flush_interval=0.5, batch_size=500):
+        self.path = Path(path)
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            conn.execute(_STATE_SCHEMA)
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="progress-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _load(self, learner):
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT kind, item FROM progress WHERE learner = ?", (learner,)
+            ).fetchall()
+        return {(kind, item) for kind, item in rows}
+
+    def _items(self, learner):
+        items = self._cache.get(learner)
+        if items is None:
+            loaded = self._load(learner)
+            with self._cache_lock:
+                items = self._cache.setdefault(learner, loaded)
+        return items
+
+    def completed(self, learner):
+        """Return a snapshot of the learner's completed ``(kind, item)`` pairs."""
+        items = self._items(learner)
+        with self._cache_lock:
+            return frozenset(items)
+
+    def is_done(self, learner, kind, item):
+        return (kind, str(item)) in self.completed(learner)
+
+    def count(self, learner, kind):
+        return sum(1 for k, _ in self.completed(learner) if k == kind)
+
+    def mark(self, learner, kind, item, done=True):
+        """Record (or clear) completion of an item; persisted asynchronously."""
+        key = (kind, str(item))
+        items = self._items(learner)
+        with self._cache_lock:
+            if done:
+                items.add(key)
+            else:
+                items.discard(key)
+        self._queue.put((learner, kind, str(item), done, time.time()))
+
+    def flush(self):
+        """Block until every queued update has been committed."""
+        self._queue.join()
+
+    def forget(self, learner):
+        """Drop a learner from the read cache (the database is untouched)."""
+        with self._cache_lock:
+            self._cache.pop(learner, None)
+
+    def cached_items(self):
+        """``{learner: number of cached items}`` for the learners held in memory."""
+        with self._cache_lock:
+            return {learner: len(items) for learner, items in self._cache.items()}
+
+    def save_state(self, learner, state):
+        """Store a learner's session state (JSON-serialisable) for ``load_state``."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO session_state (learner, state, saved_at) VALUES (?, ?, ?)",
+                (learner, json.dumps(state), time.time()),
+            )
+
+    def load_state(self, learner):
+        """Return the session state last saved for ``learner``, or ``{}``."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT state FROM session_state WHERE learner = ?", (learner,)
+            ).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def _write_loop(self):
+        conn = self._connect()
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            try:
+                self._commit(conn, batch)
+            except sqlite3.Error:
+                logger.exception("Failed to persist %d progress updates", len(batch))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    @staticmethod
+    def _commit(conn, batch):
+        # Later updates to the same item win, so collapse the batch first.
+        latest = {}
+        for learner, kind, item, done, ts in batch:
+            latest[(learner, kind, item)] = (done, ts)
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO progress (learner, kind, item, completed_at) VALUES (?, ?, ?, ?)",
+                [(*key, ts) for key, (done, ts) in latest.items() if done],
+            )
+            conn.executemany(
+                "DELETE FROM progress WHERE learner = ? AND kind = ? AND item = ?",
+                [key for key, (done, _) in latest.items() if not done],
+            )
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """The process-wide progress store, created on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ProgressStore(os.environ.get("OIC_PROGRESS_DB", DEFAULT_PATH))
+                atexit.register(_store.flush)
+    return _store
@@ -0,0 +1,140 @@
+"""Content hot-reload for authoring.
+
+With ``OIC_AUTHORING=1`` a background thread polls the module files and
+``utils/diagrams.py``. When one changes, only the affected modules are
+recompiled (``utils.content.reload_module``). Their search entries are
+re-indexed and new diagrams are pre-rendered. Every other module, and every
+session not viewing a changed module, is left alone.
+
+Sessions learn about an update through ``watch_module``. It is a small
+fragment on each module page that polls the module's version and reruns
+that session once the version moves.
+
+Run Streamlit with its own file watcher off, so an edit doesn't also
+trigger a full reload of every session::
+
+    OIC_AUTHORING=1 streamlit run app.py --server.fileWatcherType none
+"""
+
+import importlib
+import logging
+import os
+import threading
+from pathlib import Path
+
+import streamlit as st
+
+from utils import diagrams, mermaid
+from utils.content import compiled_names, diagram_names, module_version, reload_module
+from utils.search import get_index
+
+AUTHORING = os.environ.get("OIC_AUTHORING", "").lower() in ("1", "true", "yes")
+
+# Seconds between checks, for the file watcher and for each viewer.
+POLL_INTERVAL = 1.0
+
+MODULES_DIR = Path(__file__).parent.parent / "modules"
+DIAGRAMS_FILE = Path(diagrams.__file__)
+
+logger = logging.getLogger(__name__)
+
+
+def _mtime(path):
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+class ContentWatcher:
+    """Polls content files and recompiles only what an edit affects."""
+
+    def __init__(self, interval=POLL_INTERVAL):
+        from modules import __all__ as module_names
+
+        self.interval = interval
+        self._files = {name: MODULES_DIR / f"{name}.py" for name in module_names}
+        self._mtimes = {name: _mtime(path) for name, path in self._files.items()}
+        self._diagrams_mtime = _mtime(DIAGRAMS_FILE)
+        self._stop = threading.Event()
+
+    def check(self):
+        """Refresh modules whose sources changed; return their names."""
+        changed = []
+        for name, path in self._files.items():
+            mtime = _mtime(path)
+            if mtime != self._mtimes[name]:
+                self._mtimes[name] = mtime
+                changed.append(name)
+        # Modules never compiled here are picked up fresh on first use.
+        compiled = compiled_names()
+        refreshed = []
+        for name in changed:
+            if name in compiled and self._refresh(name, reimport=True):
+                refreshed.append(name)
+
+        mtime = _mtime(DIAGRAMS_FILE)
+        if mtime != self._diagrams_mtime:
+            self._diagrams_mtime = mtime
+            for name in self._diagram_users():
+                if name not in refreshed and self._refresh(name, reimport=False):
+                    refreshed.append(name)
+        return refreshed
+
+    def _diagram_users(self):
+        before = mermaid.diagram_sources()
+        importlib.reload(diagrams)
+        after = mermaid.diagram_sources()
+        edited = {name for name, source in after.items() if before.get(name) != source}
+        users = []
+        for name in sorted(compiled_names()):
+            module = importlib.import_module(f"modules.{name}").MODULE
+            if diagram_names(module) & edited:
+                users.append(name)
+        return users
+
+    def _refresh(self, name, reimport):
+        try:
+            compiled = reload_module(name, reimport=reimport)
+        except Exception:
+            # A half-saved file must not take the app down; keep the old copy.
+            logger.exception("Could not reload %s; keeping the previous version", name)
+            return False
+        get_index().add_module(name, compiled)
+        if mermaid.mmdc_path() is not None:
+            module = importlib.import_module(f"modules.{name}").MODULE
+            for diagram in diagram_names(module):
+                mermaid.render_svg(getattr(diagrams, diagram)())
+        logger.info("Reloaded %s (version %d)", name, module_version(name))
+        return True
+
+    def run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Content watcher check failed")
+
+    def stop(self):
+        self._stop.set()
+
+
+def start_watcher():
+    """Start a ``ContentWatcher`` thread (authoring mode only)."""
+    if not AUTHORING:
+        return None
+    watcher = ContentWatcher()
+    threading.Thread(target=watcher.run, name="content-watcher", daemon=True).start()
+    return watcher
+
+
+@st.fragment(run_every=POLL_INTERVAL)
+def _watch(name, seen):
+    if module_version(name) != seen:
+        st.rerun(scope="app")
+
+
+def watch_module(name):
+    """Rerun this session when ``modules.<name>`` is recompiled (authoring only)."""
+    if AUTHORING:
+        _watch(name, module_version(name))
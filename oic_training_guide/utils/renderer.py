@@ -0,0 +1,310 @@
+"""Generic renderer for display lists.
+
+A display list is a tuple of ops, each a plain tuple whose first item names
+the Streamlit element to draw::
+
+    ("title", text)               st.title(text)
+    ("markdown", text)            st.markdown(text)
+    ("html", text)                st.markdown(text, unsafe_allow_html=True)
+    ("code", code, language)      st.code(code, language=language), or cached
+                                  Pygments HTML (st.html) with OIC_SERVER_HIGHLIGHT=1
+    ("diagram", digest, source)   built SVG asset (``utils.assets``), else the
+                                  cached SVG inline, else a mermaid block
+    ("info" | "success" | "warning", text)
+    ("metric", label, value[, help])
+    ("progress", value)
+    ("columns", spec, (ops, ...)) one nested display list per column
+    ("expander", label, ops)
+    ("lab", name)                 the interactive lab ``labs.<name>``
+
+``utils.helpers`` builds these and ``utils.content`` compiles whole modules
+into them, so a rerun only walks prebuilt tuples.
+
+Each markdown op becomes its own element (one forward message to the
+browser). ``coalesce`` merges runs of markdown ops into one element with the
+same visual output. ``delta_count`` reports how many elements the current script run has drawn.
+"""
+
+import threading
+
+import streamlit as st
+
+from utils.assets import diagram_asset, static_url
+from utils.highlight import SERVER_HIGHLIGHT, highlight
+from utils.mermaid import cached_svg
+from utils.profiling import ENABLED as PROFILING, timed
+
+_local = threading.local()
+
+
+def _title(container, text):
+    container.title(text)
+
+
+def _markdown(container, text):
+    container.markdown(text)
+
+
+def _html(container, text):
+    container.markdown(text, unsafe_allow_html=True)
+
+
+def _code(container, code, language):
+    highlighted = highlight(code, language) if SERVER_HIGHLIGHT else None
+    if highlighted is None:
+        container.code(code, language=language)
+    else:
+        # Not markdown: a blank line in the <pre> would end the HTML block.
+        container.html(highlighted)
+
+
+def _diagram(container, digest, source):
+    url = static_url(diagram_asset(digest))
+    if url is not None:
+        container.markdown(f'<div class="oic-diagram"><img src="{url}" alt="Diagram"></div>', unsafe_allow_html=True)
+        return
+    svg = cached_svg(digest)
+    if svg is None:
+        container.markdown("```mermaid\n" + source + "\n```")
+    else:
+        container.markdown(f'<div class="oic-diagram">{svg}</div>', unsafe_allow_html=True)
+
+
+def _info(container, text):
+    container.info(text)
+
+
+def _success(container, text):
+    container.success(text)
+
+
+def _warning(container, text):
+    container.warning(text)
+
+
+def _metric(container, label, value, help=None):
+    container.metric(label, value, help=help)
+
+
+def _progress(container, value):
+    container.progress(value)
+
+
+def _columns(container, spec, children):
+    for column, ops in zip(container.columns(list(spec)), children):
+        render_ops(ops, column)
+
+
+def _expander(container, label, ops):
+    render_ops(ops, container.expander(label))
+
+
+def _lab(container, name):
+    from labs import render_lab
+
+    if container is st:
+        render_lab(name)
+    else:
+        with container:
+            render_lab(name)
+
+
+_HANDLERS = {
+    "title": _title,
+    "markdown": _markdown,
+    "html": _html,
+    "code": _code,
+    "diagram": _diagram,
+    "info": _info,
+    "success": _success,
+    "warning": _warning,
+    "metric": _metric,
+    "progress": _progress,
+    "columns": _columns,
+    "expander": _expander,
+    "lab": _lab,
+}
+
+
+def _op_deltas(op):
+    # Columns add a horizontal block plus one block per column.
+    if op[0] == "columns":
+        return 1 + len(op[1])
+    return 1
+
+
+def render_ops(ops, container=None):
+    """Draw a display list into ``container`` (the main area by default)."""
+    container = st if container is None else container
+    for op in ops:
+        if PROFILING:
+            with timed(f"render_ops[{op[0]}]"):
+                _draw(container, op)
+        else:
+            _draw(container, op)
+
+
+def _draw(container, op):
+    _HANDLERS[op[0]](container, *op[1:])
+    _local.deltas = getattr(_local, "deltas", 0) + _op_deltas(op)
+
+
+def coalesce(ops):
+    """Merge adjacent markdown ops, recursing into columns and expanders.
+
+    Blocks are joined with a blank line so each keeps its own paragraph,
+    list or rule, matching what separate elements would show.
+    """
+    merged = []
+    for op in ops:
+        kind = op[0]
+        if kind == "columns":
+            op = (kind, op[1], tuple(coalesce(child) for child in op[2]))
+        elif kind == "expander":
+            op = (kind, op[1], coalesce(op[2]))
+        elif kind == "markdown" and merged and merged[-1][0] == "markdown":
+            op = ("markdown", merged.pop()[1] + "\n\n" + op[1])
+        merged.append(op)
+    return tuple(merged)
+
+
+def reset_delta_count():
+    """Start counting elements for a new script run."""
+    _local.deltas = 0
+
+
+def delta_count():
+    """Number of elements drawn through ``render_ops`` since the last reset."""
+    return getattr(_local, "deltas", 0)
+
+
+WRAP_UP = "🎯 Wrap-up"
+ALL_DAYS = "📖 All days"
+
+
+def day_heading(label, title):
+    """Markdown heading that opens a day."""
+    return f"## 📅 {label}: {title}"
+
+
+def day_page_key(module_number):
+    """Session-state key holding the page selected in a module's day selector."""
+    return f"module_{module_number}_page"
+
+
+def _day_for(module, number):
+    for day in module.days:
+        if day.number <= number <= (day.last or day.number):
+            return day
+    return None
+
+
+def _initial_page(module):
+    # Deep links: ``?day=19`` opens that day directly.
+    try:
+        day = _day_for(module, int(st.query_params.get("day", "")))
+    except ValueError:
+        day = None
+    return (day or module.days[0]).label
+
+
+def _sync_day_param(day):
+    value = str(day.number) if day else None
+    if st.query_params.get("day") != value:
+        # A ``?section=`` link belongs to the day it was opened on.
+        if "section" in st.query_params:
+            del st.query_params["section"]
+        if value is None:
+            del st.query_params["day"]
+        else:
+            st.query_params["day"] = value
+
+
+def _show_whole_day():
+    del st.query_params["section"]
+
+
+def _render_section(module, day, section, day_footer):
+    # Only the linked section, under its day's heading.
+    render_ops((("markdown", day_heading(day.label, day.title)),) + section.ops)
+    st.button(f"📖 Show all of {day.label}", key="show_whole_day", on_click=_show_whole_day)
+    if day_footer is not None:
+        day_footer(module, day)
+
+
+def _go_to(key, page):
+    st.session_state[key] = page
+
+
+def _pager(key, pages, page):
+    index = pages.index(page)
+    prev_col, next_col = st.columns(2)
+    if index > 0:
+        prev_col.button(
+            f"⬅️ {pages[index - 1]}", key=f"{key}_prev",
+            on_click=_go_to, args=(key, pages[index - 1]),
+        )
+    if pages[index + 1] != ALL_DAYS:
+        next_col.button(
+            f"{pages[index + 1]} ➡️", key=f"{key}_next",
+            on_click=_go_to, args=(key, pages[index + 1]),
+        )
+
+
+@st.fragment
+def _render_day(module, day, day_footer):
+    # A fragment: widgets in the footer rerun this day only.
+    render_ops(day.ops)
+    if day_footer is not None:
+        day_footer(module, day)
+
+
+@st.fragment
+def _render_pages(module, day_footer):
+    # A fragment: switching days reruns the module body, not the whole app.
+    days = {day.label: day for day in module.days}
+    pages = list(days) + [WRAP_UP, ALL_DAYS]
+    key = day_page_key(module.number)
+    if key not in st.session_state:
+        st.session_state[key] = _initial_page(module)
+    page = st.radio(
+        "Day", pages, key=key, horizontal=True, label_visibility="collapsed"
+    )
+    _sync_day_param(days.get(page))
+
+    if page == ALL_DAYS:
+        for day in module.days:
+            _render_day(module, day, day_footer)
+        render_ops(module.outro)
+    elif page == WRAP_UP:
+        render_ops(module.outro)
+        _pager(key, pages, page)
+    else:
+        day = days[page]
+        section = day.section(st.query_params.get("section", ""))
+        if section is None:
+            _render_day(module, day, day_footer)
+        else:
+            _render_section(module, day, section, day_footer)
+        _pager(key, pages, page)
+
+
+def render_module(module, paged=True, day_footer=None):
+    """Render a compiled module (see ``utils.content.compile_module``).
+
+    With ``paged`` set, only the day picked in the day selector is rendered;
+    the other days are not drawn until selected. The choice is mirrored in
+    the ``day`` query parameter so every day has a shareable link, and
+    ``?day=19&section=upsert`` narrows the page to one ``###`` section.
+    ``day_footer(module, day)``, if given, is called after each day's content.
+
+    The day selector and each day are Streamlit fragments, so moving between
+    days or using a widget inside a day reruns only that part of the page.
+    """
+    render_ops(module.intro)
+    if paged:
+        _render_pages(module, day_footer)
+        return
+    for day in module.days:
+        _render_day(module, day, day_footer)
+    render_ops(module.outro)
@@ -0,0 +1,230 @@
+"""Full-text search over the compiled course content.
+
+``SearchIndex`` is an in-memory inverted index with BM25 ranking and prefix
+matching. One document is indexed per training day (plus one per module
+wrap-up), taken from the compiled display lists, so headings, markdown, key
+points, callouts and code examples are all searchable.
+
+A single process-wide index (``get_index``) is shared by every session. It
+is filled on the first query (``search``), not at startup, so a process
+compiles only the modules its learners open until someone searches; the
+first search pays for compiling the rest (tens of milliseconds). Later
+queries never rebuild it. ``add_module`` and ``remove_module`` update it
+incrementally.
+"""
+
+import bisect
+import math
+import re
+import threading
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Optional
+
+from utils.content import get_module
+from utils.renderer import WRAP_UP
+
+# Words, keeping compounds such as ``dvm:lookupValue`` or ``upper-case``
+# together; their parts are indexed as well.
+_TOKEN = re.compile(r"\w+(?:[:\-.]\w+)*")
+_MARKUP = re.compile(r"[#*`|]+")
+
+K1 = 1.2
+B = 0.75
+TITLE_BOOST = 3
+PREFIX_WEIGHT = 0.5
+MAX_EXPANSIONS = 20
+
+
+def tokenize(text):
+    """Lowercase terms in ``text``, with compound terms also split into parts."""
+    terms = []
+    for match in _TOKEN.finditer(text.lower()):
+        word = match.group()
+        terms.append(word)
+        if not word.isalnum():
+            terms.extend(part for part in re.split(r"[:\-.]", word) if part)
+    return terms
+
+
+def ops_text(ops):
+    """Plain text of a display list, including expander labels and code."""
+    parts = []
+    for op in ops:
+        kind = op[0]
+        if kind == "columns":
+            parts.extend(ops_text(child) for child in op[2])
+        elif kind == "expander":
+            parts.append(op[1])
+            parts.append(ops_text(op[2]))
+        elif kind in ("title", "markdown", "code", "info", "success", "warning"):
+            parts.append(op[1])
+    return "\n".join(parts)
+
+
+@dataclass(frozen=True)
+class Document:
+    """A searchable page: one day of a module, or a module's wrap-up."""
+    module: str
+    module_title: str
+    page: str
+    title: str
+    text: str
+    day: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class Hit:
+    """A ranked search result."""
+    document: Document
+    score: float
+    snippet: str
+
+
+class SearchIndex:
+    """Inverted index with BM25 scoring and prefix expansion."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._docs = {}
+        self._lengths = {}
+        self._postings = defaultdict(dict)
+        self._vocabulary = []
+        self._next_id = 0
+        self._total_length = 0
+
+    def __len__(self):
+        return len(self._docs)
+
+    def modules(self):
+        """Names of the modules currently indexed."""
+        with self._lock:
+            return {doc.module for doc in self._docs.values()}
+
+    def add(self, document):
+        """Index ``document`` and return its id."""
+        counts = Counter(tokenize(document.text))
+        for term in tokenize(document.title):
+            counts[term] += TITLE_BOOST
+        with self._lock:
+            doc_id = self._next_id
+            self._next_id += 1
+            self._docs[doc_id] = document
+            self._lengths[doc_id] = sum(counts.values())
+            self._total_length += self._lengths[doc_id]
+            for term, tf in counts.items():
+                postings = self._postings[term]
+                if not postings:
+                    bisect.insort(self._vocabulary, term)
+                postings[doc_id] = tf
+        return doc_id
+
+    def remove_module(self, module):
+        """Drop every document belonging to ``module``."""
+        with self._lock:
+            stale = [i for i, doc in self._docs.items() if doc.module == module]
+            for doc_id in stale:
+                del self._docs[doc_id]
+                self._total_length -= self._lengths.pop(doc_id)
+            if not stale:
+                return
+            stale = set(stale)
+            for term in list(self._postings):
+                postings = self._postings[term]
+                for doc_id in stale.intersection(postings):
+                    del postings[doc_id]
+                if not postings:
+                    del self._postings[term]
+            self._vocabulary = sorted(self._postings)
+
+    def add_module(self, module, compiled):
+        """(Re)index a compiled module under its name ``module``."""
+        self.remove_module(module)
+        for day in compiled.days:
+            self.add(Document(
+                module=module,
+                module_title=compiled.title,
+                page=day.label,
+                title=f"{day.label}: {day.title}",
+                text=ops_text(day.ops),
+                day=day.number,
+            ))
+        self.add(Document(
+            module=module,
+            module_title=compiled.title,
+            page=WRAP_UP,
+            title=f"Module {compiled.number} wrap-up",
+            text=ops_text(compiled.outro),
+        ))
+
+    def _expand(self, term):
+        # Exact term at full weight, other vocabulary words it prefixes at less.
+        start = bisect.bisect_left(self._vocabulary, term)
+        expansions = []
+        for candidate in self._vocabulary[start:start + MAX_EXPANSIONS + 1]:
+            if not candidate.startswith(term):
+                break
+            expansions.append((candidate, 1.0 if candidate == term else PREFIX_WEIGHT))
+        return expansions
+
+    def search(self, query, limit=10):
+        """Return up to ``limit`` ``Hit``s for ``query``, best first."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        with self._lock:
+            n = len(self._docs)
+            if not n:
+                return []
+            avg_length = self._total_length / n
+            scores = defaultdict(float)
+            for term in terms:
+                for candidate, weight in self._expand(term):
+                    postings = self._postings[candidate]
+                    idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+                    for doc_id, tf in postings.items():
+                        norm = K1 * (1 - B + B * self._lengths[doc_id] / avg_length)
+                        scores[doc_id] += weight * idf * tf * (K1 + 1) / (tf + norm)
+            ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+            docs = [(self._docs[doc_id], score) for doc_id, score in ranked]
+        return [Hit(doc, round(score, 3), _snippet(doc.text, terms)) for doc, score in docs]
+
+
+def _snippet(text, terms, width=120):
+    lowered = text.lower()
+    positions = [p for p in (lowered.find(term) for term in terms) if p >= 0]
+    start = max(min(positions, default=0) - width // 3, 0)
+    snippet = " ".join(_MARKUP.sub("", text[start:start + width]).split())
+    return ("…" if start else "") + snippet + ("…" if start + width < len(text) else "")
+
+
+_index = SearchIndex()
+_build_lock = threading.Lock()
+_built = False
+
+
+def get_index():
+    """The process-wide index shared by all sessions (possibly not yet built)."""
+    return _index
+
+
+def build_index():
+    """Index every module not yet in the shared index, once per process."""
+    global _built
+    if _built:
+        return _index
+    from modules import __all__ as module_names
+
+    with _build_lock:
+        if not _built:
+            indexed = _index.modules()
+            for name in module_names:
+                if name not in indexed:
+                    _index.add_module(name, get_module(name))
+            _built = True
+    return _index
+
+
+def search(query, limit=10):
+    """``SearchIndex.search`` on the shared index, building it on first use."""
+    return build_index().search(query, limit=limit)
@@ -0,0 +1,201 @@
+"""Per-session memory accounting and idle-session eviction.
+
+Every script run records the deep size of its session's ``st.session_state``
+in a process-wide ``SessionRegistry``. The Diagnostics page shows the totals.
+Fragments call ``touch`` so a learner who only moves between days still
+counts as active.
+
+A sweeper thread evicts sessions idle for longer than ``OIC_SESSION_IDLE``
+seconds (15 minutes by default). The navigation state of an evicted session
+(selected module, day per module) is saved to the progress store, its
+session state is cleared, and the learner's cached progress is dropped if no
+other session uses it. When the learner comes back, ``restore`` puts the
+navigation back before any widget is drawn. Progress reloads from SQLite
+on first use, and widgets on screen resend their own values from the
+browser.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from utils.progress import get_store
+
+IDLE_TIMEOUT = float(os.environ.get("OIC_SESSION_IDLE", 15 * 60))
+SWEEP_INTERVAL = 60
+
+logger = logging.getLogger(__name__)
+
+
+def deep_size(obj, seen=None):
+    """Approximate bytes held by ``obj`` and the containers inside it."""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_size(item, seen) for item in obj)
+    return size
+
+
+def _persisted(key):
+    # Navigation: the sidebar module and each module's day selector.
+    return key == "selected_module" or (key.startswith("module_") and key.endswith("_page"))
+
+
+@dataclass
+class SessionRecord:
+    """What the registry knows about one live session."""
+    learner: str
+    last_seen: float
+    state_bytes: int
+    state: object  # Streamlit's thread-safe session state for this session
+
+
+class SessionRegistry:
+    """Live sessions of this process, their state sizes and idle eviction."""
+
+    def __init__(self, idle_timeout=IDLE_TIMEOUT):
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self.evicted = 0
+        self.restored = 0
+
+    def record(self, session_id, learner, state, state_bytes):
+        with self._lock:
+            self._sessions[session_id] = SessionRecord(learner, time.time(), state_bytes, state)
+
+    def touch(self, session_id):
+        record = self._sessions.get(session_id)
+        if record is not None:
+            record.last_seen = time.time()
+
+    def note_restored(self):
+        with self._lock:
+            self.restored += 1
+
+    def sweep(self, now=None):
+        """Evict sessions idle for longer than ``idle_timeout``; return how many."""
+        now = time.time() if now is None else now
+        with self._lock:
+            idle = {
+                session_id: record for session_id, record in self._sessions.items()
+                if now - record.last_seen > self.idle_timeout
+            }
+            for session_id in idle:
+                del self._sessions[session_id]
+            active = {record.learner for record in self._sessions.values()}
+        store = get_store()
+        for record in idle.values():
+            state = record.state
+            snapshot = {key: value for key, value in state.filtered_state.items() if _persisted(key)}
+            if snapshot:
+                store.save_state(record.learner, snapshot)
+            for key in list(state.filtered_state):
+                try:
+                    del state[key]
+                except KeyError:
+                    pass
+            if record.learner not in active:
+                store.forget(record.learner)
+        with self._lock:
+            self.evicted += len(idle)
+        return len(idle)
+
+    def stats(self):
+        """Totals for the Diagnostics page and its JSON export."""
+        with self._lock:
+            sizes = [record.state_bytes for record in self._sessions.values()]
+            learners = {record.learner for record in self._sessions.values()}
+            evicted, restored = self.evicted, self.restored
+        cached = get_store().cached_items()
+        return {
+            "sessions": len(sizes),
+            "learners": len(learners),
+            "state_bytes_total": sum(sizes),
+            "state_bytes_mean": round(sum(sizes) / len(sizes)) if sizes else 0,
+            "state_bytes_max": max(sizes, default=0),
+            "progress_cache_learners": len(cached),
+            "progress_cache_items": sum(cached.values()),
+            "evicted": evicted,
+            "restored": restored,
+            "idle_timeout_s": self.idle_timeout,
+        }
+
+
+_registry = SessionRegistry()
+_sweeper = None
+_sweeper_lock = threading.Lock()
+
+
+def get_registry():
+    """The process-wide session registry."""
+    return _registry
+
+
+def restore(learner):
+    """Put back the navigation saved when this learner's session was evicted.
+
+    Runs once per session, and again after an eviction cleared the session.
+    Saved positions only fill keys the session doesn't have, and a deep link
+    (``?module=`` or ``?day=``) wins over all of them.
+    """
+    if st.session_state.get("state_restored"):
+        return
+    st.session_state.state_restored = True
+    if "module" in st.query_params or "day" in st.query_params:
+        return
+    missing = {
+        key: value for key, value in get_store().load_state(learner).items()
+        if _persisted(key) and key not in st.session_state
+    }
+    for key, value in missing.items():
+        st.session_state[key] = value
+    if missing:
+        _registry.note_restored()
+
+
+def track(learner):
+    """Record this session's state size; call at the end of a full run."""
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return 0
+    size = deep_size(st.session_state.to_dict())
+    _registry.record(ctx.session_id, learner, ctx.session_state, size)
+    return size
+
+
+def touch():
+    """Mark this session active; for fragments, which skip ``track``."""
+    ctx = get_script_run_ctx()
+    if ctx is not None:
+        _registry.touch(ctx.session_id)
+
+
+def _sweep_loop():
+    while True:
+        time.sleep(SWEEP_INTERVAL)
+        try:
+            _registry.sweep()
+        except Exception:
+            logger.exception("Idle session sweep failed")
+
+
+def start_sweeper():
+    """Start the idle-session sweeper thread once per process."""
+    global _sweeper
+    with _sweeper_lock:
+        if _sweeper is None:
+            _sweeper = threading.Thread(target=_sweep_loop, name="session-sweeper", daemon=True)
+            _sweeper.start()
+    return _sweeper
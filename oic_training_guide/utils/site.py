@@ -0,0 +1,186 @@
+"""Static site built from the same display lists as the Streamlit app.
+
+``build_site`` turns the Home and Resources display lists and the compiled
+modules into linked HTML pages, ready for any static file server or CDN.
+Each module is one page with an anchor per day (``module-6.html#day-19``),
+mirroring the app's ``?day=19`` links. The stylesheet and pre-rendered
+diagrams are content-hashed assets under ``assets/`` (see ``utils.assets``),
+so pages link to them and browsers cache them across pages and visits.
+
+``precompress`` prepares the built files for serving: each gets a strong
+ETag and gzip (and, with the ``brotli`` package, brotli) variants computed
+once, so a server only has to pick one per request.
+"""
+
+import gzip
+import hashlib
+import html
+import mimetypes
+from dataclasses import dataclass, field
+
+from utils.content import get_module
+
+from utils.assets import STYLESHEET, AssetBundle, diagram_asset, display_lists
+from utils.bootstrap import ASSETS_DIR, PAGE_CONFIG
+from utils import highlight
+from utils.html_renderer import MERMAID_CLASS, linked_diagrams, render_html
+from utils.renderer import WRAP_UP
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+ASSETS_PREFIX = "assets/"
+HOME_PAGE = "index.html"
+RESOURCES_PAGE = "resources.html"
+
+_ACTIVE = ' class="active"'
+
+MERMAID_SCRIPT = (
+    '<script type="module">'
+    'import mermaid from "https://cdn.jsdelivr.net/npm/mermaid@10/dist/mermaid.esm.min.mjs";'
+    "mermaid.initialize({startOnLoad: true});"
+    "</script>"
+)
+
+
+def module_page(number):
+    """File name of the page for module ``number``."""
+    return f"module-{number}.html"
+
+
+def day_anchor(number):
+    """Fragment identifier of a day within its module page."""
+    return f"day-{number}"
+
+
+def site_css():
+    """The app stylesheet, the export layout and the code highlighting styles."""
+    return "\n".join((
+        (ASSETS_DIR / "style.css").read_text(encoding="utf-8"),
+        (ASSETS_DIR / "export.css").read_text(encoding="utf-8"),
+        highlight.css(),
+    ))
+
+
+def _nav(links, current):
+    items = "".join(
+        f'<li><a href="{href}"{_ACTIVE if href == current else ""}>{html.escape(label)}</a></li>'
+        for label, href in links
+    )
+    return f'<nav class="oic-nav"><h2>📖 Navigation</h2><ul>{items}</ul></nav>'
+
+
+def render_page(title, body, links, current, stylesheet):
+    """Wrap ``body`` in a full HTML document with the site navigation."""
+    script = MERMAID_SCRIPT if f'class="{MERMAID_CLASS}"' in body else ""
+    return (
+        "<!DOCTYPE html>\n"
+        '<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+        '<meta name="viewport" content="width=device-width, initial-scale=1">\n'
+        f"<title>{html.escape(title)} · {html.escape(PAGE_CONFIG['page_title'])}</title>\n"
+        f'<link rel="stylesheet" href="{stylesheet}">\n'
+        "</head>\n<body>\n"
+        f"{_nav(links, current)}\n<main>\n{body}</main>\n{script}\n"
+        "</body>\n</html>\n"
+    )
+
+
+def module_body(module):
+    """HTML for a compiled module: intro, day index, each day and the wrap-up."""
+    index = " ".join(
+        f'<a href="#{day_anchor(day.number)}">{html.escape(day.label)}</a>' for day in module.days
+    )
+    parts = [render_html(module.intro), f'<p class="oic-days">{index} <a href="#wrap-up">{WRAP_UP}</a></p>\n']
+    for day in module.days:
+        parts.append(f'<section id="{day_anchor(day.number)}">\n{render_html(day.ops)}</section>\n')
+    parts.append(f'<section id="wrap-up">\n{render_html(module.outro)}</section>\n')
+    return "".join(parts)
+
+
+def compile_modules(menu):
+    """``{label: CompiledModule}`` for the module entries of a sidebar menu."""
+    return {label: get_module(name) for label, name in menu.items() if name}
+
+
+def build_site(home_ops, resources_ops, modules):
+    """Return ``{path: content}`` for the whole site, assets included.
+
+    ``modules`` maps each sidebar label to its compiled module, in menu order.
+    """
+    links = [("🏠 Home", HOME_PAGE)]
+    links += [(label, module_page(module.number)) for label, module in modules.items()]
+    links.append(("📚 Resources", RESOURCES_PAGE))
+
+    bundle = AssetBundle()
+    stylesheet = ASSETS_PREFIX + bundle.add(STYLESHEET, site_css())
+    bundle.add_diagrams([home_ops, resources_ops])
+    for module in modules.values():
+        bundle.add_diagrams(display_lists(module))
+
+    def diagram_href(digest):
+        published = bundle.manifest.get(diagram_asset(digest))
+        return ASSETS_PREFIX + published if published else None
+
+    files = {}
+    with linked_diagrams(diagram_href):
+        files[HOME_PAGE] = render_page("Home", render_html(home_ops), links, HOME_PAGE, stylesheet)
+        files[RESOURCES_PAGE] = render_page(
+            "Resources", render_html(resources_ops), links, RESOURCES_PAGE, stylesheet
+        )
+        for module in modules.values():
+            path = module_page(module.number)
+            files[path] = render_page(
+                f"Module {module.number}: {module.title}", module_body(module), links, path, stylesheet
+            )
+    files.update((ASSETS_PREFIX + published, body) for published, body in bundle.files.items())
+    return files
+
+
+@dataclass(frozen=True)
+class SiteFile:
+    """A built file ready to serve: body, validators and compressed variants."""
+    path: str
+    content_type: str
+    body: bytes
+    etag: str
+    encodings: dict = field(default_factory=dict)
+
+    def variant(self, accept_encoding):
+        """Return ``(encoding, body, etag)`` for an ``Accept-Encoding`` header.
+
+        Each encoding gets its own strong ETag, as the bytes differ.
+        """
+        accepted = {part.split(";")[0].strip().lower() for part in (accept_encoding or "").split(",")}
+        for encoding in ("br", "gzip"):
+            if encoding in accepted and encoding in self.encodings:
+                return encoding, self.encodings[encoding], f'{self.etag[:-1]}-{encoding}"'
+        return None, self.body, self.etag
+
+
+def precompress(files, min_size=512):
+    """Turn ``build_site`` output into ``{path: SiteFile}``.
+
+    Files smaller than ``min_size`` bytes are not worth compressing, and a
+    variant is dropped when it does not come out smaller than the original.
+    """
+    prepared = {}
+    for path, content in files.items():
+        body = content.encode("utf-8") if isinstance(content, str) else content
+        content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        if content_type.startswith("text/"):
+            content_type += "; charset=utf-8"
+        encodings = {}
+        if len(body) >= min_size:
+            encodings["gzip"] = gzip.compress(body, compresslevel=9, mtime=0)
+            if brotli is not None:
+                encodings["br"] = brotli.compress(body, quality=11)
+        prepared[path] = SiteFile(
+            path=path,
+            content_type=content_type,
+            body=body,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            encodings={name: data for name, data in encodings.items() if len(data) < len(body)},
+        )
+    return prepared